@@ -8,6 +8,11 @@ import logging
 # when the application hasn't configured logging.
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+# Defined before the submodule imports, which may read it during import
+from importlib.metadata import version as _get_version  # noqa: E402
+
+__version__ = _get_version("pytest-skill-engineering")
+
 # Core types  # noqa: E402 - logging must be configured before submodule imports
 from pytest_skill_engineering.core import (  # noqa: E402
     AITestError,
@@ -175,7 +180,3 @@ try:
     ]
 except ImportError:
     pass  # github-copilot-sdk not installed — copilot types not available
-
-from importlib.metadata import version as _get_version  # noqa: E402
-
-__version__ = _get_version("pytest-skill-engineering")
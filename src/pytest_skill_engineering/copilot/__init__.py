@@ -21,7 +21,7 @@ from pytest_skill_engineering.copilot.personas import (
     VSCodePersona,
 )
 from pytest_skill_engineering.copilot.result import CopilotResult
-from pytest_skill_engineering.copilot.runner import run_copilot
+from pytest_skill_engineering.copilot.runner import create_copilot_client, run_copilot
 from pytest_skill_engineering.execution.optimizer import InstructionSuggestion, optimize_instruction
 
 __all__ = [
@@ -35,6 +35,7 @@ __all__ = [
     "Persona",
     "VSCodePersona",
     "copilot_eval",
+    "create_copilot_client",
     "load_custom_agent",
     "load_custom_agents",
     "load_mcp_config",
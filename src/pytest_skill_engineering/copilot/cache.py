@@ -0,0 +1,212 @@
+"""Opt-in on-disk cache for Copilot runs.
+
+Re-running an unchanged Copilot test pays the full LLM round-trip every
+time. With ``PYTEST_COPILOT_CACHE=1`` the ``copilot_eval`` and ``ab_run``
+fixtures memoize successful results under
+``~/.cache/pytest-skill-engineering/copilot/<key>/``: the result as JSON
+plus a tarball of the files the agent left in its working directory.
+
+The key is a SHA-256 over everything that shapes the run — prompt, model,
+instructions, tool and agent configuration, the plugin version (personas
+and polyfill tools change between releases), and the *contents* of the
+skill directories and of the working directory before the run (paths are
+left out, since ``tmp_path`` changes on every run).
+
+Entries expire after ``PYTEST_COPILOT_CACHE_TTL`` seconds (default one day);
+``--no-copilot-cache`` bypasses the cache for a whole session.
+
+``PYTEST_COPILOT_CACHE=replay`` makes the cache read-only: entries never
+expire, and a run with no recorded result raises
+:class:`~pytest_skill_engineering.core.errors.CacheMissError` instead of
+starting a Copilot session.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import tarfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pytest_skill_engineering import __version__
+from pytest_skill_engineering.copilot.result import (
+    CopilotResult,
+    SubagentInvocation,
+    ToolCall,
+    Turn,
+    UsageInfo,
+)
+from pytest_skill_engineering.core.serialization import serialize_dataclass
+
+if TYPE_CHECKING:
+    from pytest_skill_engineering.copilot.eval import CopilotEval
+
+_logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PYTEST_COPILOT_CACHE"
+CACHE_TTL_ENV = "PYTEST_COPILOT_CACHE_TTL"
+DEFAULT_TTL_S = 24 * 60 * 60
+
+_PLUGIN_VERSION = __version__
+
+_RESULT_FILE = "result.json"
+_WORKSPACE_FILE = "workspace.tar.gz"
+
+# Extraction filters arrived in a 3.11 patch release; use them when present
+_EXTRACT_KWARGS: dict[str, Any] = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def default_cache_dir() -> Path:
+    """Return the cache root, honouring ``XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pytest-skill-engineering" / "copilot"
+
+
+def cache_enabled() -> bool:
+    """Return True when ``PYTEST_COPILOT_CACHE`` opts in to result caching."""
+    return os.environ.get(CACHE_ENV, "").strip().lower() in {"1", "true", "yes", "on", "replay"}
+
+
+def cache_replay_only() -> bool:
+    """Return True when ``PYTEST_COPILOT_CACHE=replay`` forbids live runs."""
+    return os.environ.get(CACHE_ENV, "").strip().lower() == "replay"
+
+
+def _hash_tree(root: str | Path | None) -> str | None:
+    """Digest the relative paths and contents of every file under ``root``."""
+    if root is None:
+        return None
+    root = Path(root)
+    if not root.is_dir():
+        return None
+    digest = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def cache_key(agent: CopilotEval, prompt: str) -> str:
+    """Build the cache key for running ``prompt`` against ``agent``."""
+    spec = {
+        "prompt": prompt,
+        "plugin_version": _PLUGIN_VERSION,
+        "model": agent.model,
+        "reasoning_effort": agent.reasoning_effort,
+        "instructions": agent.instructions,
+        "system_message_mode": agent.system_message_mode,
+        "allowed_tools": agent.allowed_tools,
+        "excluded_tools": agent.excluded_tools,
+        "max_turns": agent.max_turns,
+        "mcp_servers": agent.mcp_servers,
+        "custom_agents": agent.custom_agents,
+        "active_agent": agent.active_agent,
+        "disabled_skills": agent.disabled_skills,
+        "extra_config": agent.extra_config,
+        "persona": repr(agent.persona),
+        "skills": [_hash_tree(d) for d in agent.skill_directories],
+        "workspace": _hash_tree(agent.working_directory),
+    }
+    payload = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _result_from_dict(data: dict[str, Any]) -> CopilotResult:
+    turns = [
+        Turn(
+            role=t["role"],
+            content=t["content"],
+            tool_calls=[
+                ToolCall(
+                    name=tc["name"],
+                    arguments=tc.get("arguments", {}),
+                    result=tc.get("result"),
+                    error=tc.get("error"),
+                    duration_ms=tc.get("duration_ms"),
+                    image_content=(
+                        base64.b64decode(tc["image_content"]) if tc.get("image_content") else None
+                    ),
+                    image_media_type=tc.get("image_media_type"),
+                )
+                for tc in t.get("tool_calls", [])
+            ],
+        )
+        for t in data.get("turns", [])
+    ]
+    return CopilotResult(
+        turns=turns,
+        success=data.get("success", True),
+        error=data.get("error"),
+        duration_ms=data.get("duration_ms", 0.0),
+        usage=[UsageInfo(**u) for u in data.get("usage", [])],
+        reasoning_traces=data.get("reasoning_traces", []),
+        subagent_invocations=[
+            SubagentInvocation(**s) for s in data.get("subagent_invocations", [])
+        ],
+        permission_requested=data.get("permission_requested", False),
+        permissions=data.get("permissions", []),
+        model_used=data.get("model_used"),
+        total_premium_requests=data.get("total_premium_requests", 0.0),
+        raw_event_count=data.get("raw_event_count", 0),
+    )
+
+
+class CopilotResultCache:
+    """Directory-backed store of Copilot results keyed by :func:`cache_key`."""
+
+    def __init__(self, root: Path | None = None, ttl_s: float | None = None) -> None:
+        self.root = root or default_cache_dir()
+        if ttl_s is None:
+            ttl_s = float(os.environ.get(CACHE_TTL_ENV, DEFAULT_TTL_S))
+        self.ttl_s = ttl_s
+
+    def load(self, key: str, agent: CopilotEval) -> CopilotResult | None:
+        """Return the cached result for ``key``, restoring its files, or None."""
+        entry = self.root / key
+        result_path = entry / _RESULT_FILE
+        if not result_path.is_file():
+            return None
+        if time.time() - result_path.stat().st_mtime > self.ttl_s:
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        try:
+            result = _result_from_dict(json.loads(result_path.read_text(encoding="utf-8")))
+            archive = entry / _WORKSPACE_FILE
+            if agent.working_directory is not None and archive.is_file():
+                with tarfile.open(archive, "r:gz") as tar:
+                    tar.extractall(agent.working_directory, **_EXTRACT_KWARGS)
+        except Exception:
+            _logger.debug("Copilot cache entry %s unreadable, ignoring", key, exc_info=True)
+            return None
+
+        result.agent = agent
+        return result
+
+    def store(self, key: str, agent: CopilotEval, result: CopilotResult) -> None:
+        """Persist a successful ``result`` and the agent's working directory."""
+        if not result.success:
+            return
+        entry = self.root / key
+        entry.mkdir(parents=True, exist_ok=True)
+
+        if agent.working_directory is not None and Path(agent.working_directory).is_dir():
+            buffer = io.BytesIO()
+            with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+                tar.add(agent.working_directory, arcname=".")
+            (entry / _WORKSPACE_FILE).write_bytes(buffer.getvalue())
+
+        # Raw SDK events and the agent back-reference are not JSON-serializable
+        data = serialize_dataclass(dataclasses.replace(result, raw_events=[], agent=None))
+        data.pop("agent", None)
+        (entry / _RESULT_FILE).write_text(json.dumps(data, default=str), encoding="utf-8")
@@ -68,8 +68,9 @@ class CopilotEval:
     ``build_session_config()`` maps them to the SDK's actual
     ``system_message`` TypedDict.
 
-    The SDK's ``SessionConfig`` has no ``maxTurns`` field — turn limits
-    are enforced externally by the runner via ``timeout_s``.
+    The SDK's ``SessionConfig`` has no ``maxTurns`` field — the runner
+    aborts a run once it exceeds ``max_turns``, and ``timeout_s`` bounds
+    its wall-clock time.
 
     Example:
         # Minimal
@@ -122,6 +123,10 @@ class CopilotEval:
     # Permissions — auto-approve by default for deterministic testing
     auto_confirm: bool = True
 
+    # Keep every SDK event on result.raw_events. When False only
+    # result.raw_event_count is kept, so long sessions don't hold the stream.
+    capture_raw_events: bool = True
+
     # MCP servers to attach to the session
     mcp_servers: dict[str, Any] = field(default_factory=dict)
 
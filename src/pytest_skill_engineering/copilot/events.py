@@ -84,7 +84,7 @@ class EventMapper:
         result = mapper.build()
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, capture_raw_events: bool = True) -> None:
         self._turns: list[Turn] = []
         self._pending_tool_calls: dict[str, ToolCall] = {}  # tool_call_id → ToolCall
         self._pending_tool_start_times: dict[str, float] = {}
@@ -102,12 +102,22 @@ class EventMapper:
         self._model_used: str | None = None
         self._error: str | None = None
         self._raw_events: list[Any] = []
+        self._raw_event_count: int = 0
+        self._capture_raw_events = capture_raw_events
         self._start_time: float = time.monotonic()
         self._total_premium_requests: float = 0.0
+        self._assistant_turns: int = 0
+        # Copilot client serving this run; nested subagent dispatches
+        # open their sessions on it instead of starting another CLI.
+        self.client: Any | None = None
+        # Polyfill subagent runs (runSubagent/task) still in progress
+        self.dispatches_in_flight: int = 0
 
     def handle(self, event: SessionEvent) -> None:
         """Process a single SDK event."""
-        self._raw_events.append(event)
+        self._raw_event_count += 1
+        if self._capture_raw_events:
+            self._raw_events.append(event)
         event_type = event.type.value if hasattr(event.type, "value") else str(event.type)
 
         handler = _EVENT_HANDLERS.get(event_type)
@@ -116,6 +126,11 @@ class EventMapper:
         else:
             logger.debug("Unhandled event type: %s", event_type)
 
+    @property
+    def assistant_turns(self) -> int:
+        """Number of ``assistant.turn_start`` events seen so far."""
+        return self._assistant_turns
+
     def build(self) -> CopilotResult:
         """Build the final CopilotResult from accumulated events."""
         # Flush any pending assistant content
@@ -136,6 +151,7 @@ class EventMapper:
             permissions=self._permissions,
             model_used=self._model_used,
             raw_events=self._raw_events,
+            raw_event_count=self._raw_event_count,
             total_premium_requests=self._total_premium_requests,
         )
 
@@ -216,6 +232,7 @@ class EventMapper:
 
     def _handle_assistant_turn_start(self, event: SessionEvent) -> None:
         """Mark the start of a new assistant turn."""
+        self._assistant_turns += 1
         # Flush previous turn if any
         self._flush_assistant_turn()
 
@@ -9,13 +9,27 @@ configurations against the same task in isolated directories.
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import math
+import os
+import shutil
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from pytest_skill_engineering.copilot.cache import (
+    CACHE_ENV,
+    CopilotResultCache,
+    cache_enabled,
+    cache_key,
+    cache_replay_only,
+)
 from pytest_skill_engineering.copilot.runner import run_copilot
+from pytest_skill_engineering.core.errors import CacheMissError
+from pytest_skill_engineering.execution.single_flight import SingleFlight
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
@@ -26,9 +40,29 @@ if TYPE_CHECKING:
     from pytest_skill_engineering.copilot.result import CopilotResult
 
 
+@pytest.fixture
+def copilot_client() -> Any | None:
+    """Already-started ``CopilotClient`` shared by ``copilot_eval`` and ``ab_run``.
+
+    Returns ``None`` by default, so every run starts and stops its own
+    Copilot CLI. Override it in a ``conftest.py`` with a session-scoped
+    fixture to pay CLI startup and authentication once per session.
+    The override must share the tests' event loop:
+
+        @pytest_asyncio.fixture(scope="session", loop_scope="session")
+        async def copilot_client():
+            client = create_copilot_client()
+            await client.start()
+            yield client
+            await client.stop()
+    """
+    return None
+
+
 @pytest.fixture
 def copilot_eval(
     request: pytest.FixtureRequest,
+    copilot_client: Any | None,
 ) -> Callable[..., Coroutine[Any, Any, CopilotResult]]:
     """Execute a prompt against a CopilotEval and capture results.
 
@@ -45,10 +79,39 @@ def copilot_eval(
             result = await copilot_eval(agent, "Create hello.py with print('hello')")
             assert result.success
             assert result.tool_was_called("create_file")
+
+    Pass ``success_predicate`` to stop as soon as an acceptance check on
+    the working directory passes, instead of waiting for the agent to
+    finish (see :func:`run_copilot`)::
+
+        result = await copilot_eval(
+            agent,
+            "Create hello.py",
+            success_predicate=lambda wd: (wd / "hello.py").exists(),
+        )
     """
 
-    async def _run(agent: CopilotEval, prompt: str) -> CopilotResult:
-        result = await run_copilot(agent, prompt)
+    async def _run(
+        agent: CopilotEval,
+        prompt: str,
+        *,
+        success_predicate: Callable[[Path], bool] | None = None,
+    ) -> CopilotResult:
+        if success_predicate is not None:
+            # Early-stopped runs are never shared with full runs, and are
+            # cached under their own key.
+            result = await run_copilot_cached(
+                request.config,
+                agent,
+                prompt,
+                key=f"{cache_key(agent, prompt)}-early" if _cache_active(request.config) else None,
+                client=copilot_client,
+                success_predicate=success_predicate,
+            )
+        elif _cache_active(request.config):
+            result = await _run_coalesced(request.config, agent, prompt, copilot_client)
+        else:
+            result = await _run_on_client(agent, prompt, copilot_client)
 
         # Stash for pytest-skill-engineering's reporting plugin.
         # The plugin hook also does this automatically for tests that
@@ -61,6 +124,124 @@ def copilot_eval(
     return _run
 
 
+# Runs currently in flight, keyed by ``cache_key``.
+_single_flight: SingleFlight[str, CopilotResult] = SingleFlight()
+
+
+async def _run_coalesced(
+    config: pytest.Config,
+    agent: CopilotEval,
+    prompt: str,
+    client: Any | None = None,
+) -> CopilotResult:
+    """Run ``prompt`` once per identical request that is already in flight.
+
+    When another ``copilot_eval`` call with the same agent spec, prompt and
+    workspace contents is still running, wait for it instead of issuing a
+    second Copilot session. The files the first run wrote are then copied
+    into this caller's working directory.
+
+    Only used while the result cache is active: a cached run would be
+    replayed to the second caller anyway, whereas without the cache
+    repeated identical calls are independent samples.
+    """
+    key = cache_key(agent, prompt)
+    result, led = await _single_flight.run(
+        key, lambda: run_copilot_cached(config, agent, prompt, key=key, client=client)
+    )
+    return result if led else _adopt_result(result, agent)
+
+
+def _adopt_result(result: CopilotResult, agent: CopilotEval) -> CopilotResult:
+    """Re-home a coalesced ``result`` onto ``agent`` and its working directory."""
+    source = result.agent.working_directory if result.agent else None
+    target = agent.working_directory
+    if source and target and Path(source) != Path(target):
+        shutil.copytree(source, target, dirs_exist_ok=True)
+    return dataclasses.replace(result, agent=agent)
+
+
+def _cache_active(config: pytest.Config) -> bool:
+    """Return True when ``PYTEST_COPILOT_CACHE`` is set and not bypassed for this session."""
+    return cache_enabled() and not config.getoption("--no-copilot-cache", default=False)
+
+
+async def run_copilot_cached(
+    config: pytest.Config,
+    agent: CopilotEval,
+    prompt: str,
+    key: str | None = None,
+    client: Any | None = None,
+    success_predicate: Callable[[Path], bool] | None = None,
+) -> CopilotResult:
+    """Run ``prompt`` via :func:`run_copilot`, going through the opt-in result cache.
+
+    The cache is only consulted when ``PYTEST_COPILOT_CACHE`` is set and
+    ``--no-copilot-cache`` was not passed. With ``PYTEST_COPILOT_CACHE=replay``
+    a miss raises :class:`CacheMissError`. See
+    :mod:`pytest_skill_engineering.copilot.cache`.
+
+    ``copilot_eval`` and ``ab_run`` go through here. Call it directly from
+    class- or module-scoped fixtures that share one run between tests, so
+    those runs are cached too.
+    """
+    if not _cache_active(config):
+        return await _run_on_client(agent, prompt, client, success_predicate)
+
+    replay_only = cache_replay_only()
+    cache = CopilotResultCache(ttl_s=math.inf if replay_only else None)
+    # Key on the pre-run workspace so seeded input files are part of the key
+    key = key or cache_key(agent, prompt)
+    cached = cache.load(key, agent)
+    if cached is not None:
+        return cached
+    if replay_only:
+        raise CacheMissError(CACHE_ENV, key)
+
+    result = await _run_on_client(agent, prompt, client, success_predicate)
+    cache.store(key, agent, result)
+    return result
+
+
+MAX_INFLIGHT_ENV = "PYTEST_COPILOT_MAX_INFLIGHT"
+DEFAULT_MAX_INFLIGHT = 8
+
+# One limiter per event loop; an asyncio.Semaphore is bound to the loop it
+# first waits on, and function-scoped tests each get their own loop.
+_limits: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _inflight_limit() -> asyncio.Semaphore:
+    """Return the running loop's cap on concurrent Copilot sessions.
+
+    Sized from ``PYTEST_COPILOT_MAX_INFLIGHT`` (default 8) when first used.
+    """
+    loop = asyncio.get_running_loop()
+    limit = _limits.get(loop)
+    if limit is None:
+        size = int(os.environ.get(MAX_INFLIGHT_ENV, DEFAULT_MAX_INFLIGHT))
+        limit = _limits[loop] = asyncio.Semaphore(max(1, size))
+    return limit
+
+
+async def _run_on_client(
+    agent: CopilotEval,
+    prompt: str,
+    client: Any | None,
+    success_predicate: Callable[[Path], bool] | None = None,
+) -> CopilotResult:
+    """Call :func:`run_copilot` under the in-flight limit, passing only set options."""
+    options: dict[str, Any] = {}
+    if client is not None:
+        options["client"] = client
+    if success_predicate is not None:
+        options["success_predicate"] = success_predicate
+    async with _inflight_limit():
+        return await run_copilot(agent, prompt, **options)
+
+
 def _convert_to_aitest(
     agent: CopilotEval,
     result: CopilotResult,
@@ -124,12 +305,13 @@ def stash_on_item(
 def ab_run(
     request: pytest.FixtureRequest,
     tmp_path: Path,
+    copilot_client: Any | None,
 ) -> Callable[..., Coroutine[Any, Any, tuple[CopilotResult, CopilotResult]]]:
     """Run two agents against the same task in isolated directories.
 
     Creates ``baseline/`` and ``treatment/`` subdirectories under
     ``tmp_path``, overrides ``working_directory`` on each agent so they
-    never share a workspace, then runs them sequentially and stashes the
+    never share a workspace, then runs them concurrently and stashes the
     treatment result for pytest-skill-engineering reporting.
 
     Example::
@@ -170,9 +352,28 @@ def ab_run(
         baseline = dataclasses.replace(baseline, working_directory=str(baseline_dir))
         treatment = dataclasses.replace(treatment, working_directory=str(treatment_dir))
 
-        # Run sequentially — agents may write to disk, install packages, etc.
-        baseline_result = await run_copilot(baseline, task)
-        treatment_result = await run_copilot(treatment, task)
+        # Run concurrently — each run gets its own Copilot CLI session and
+        # working directory, so the two LLM round-trips can overlap. The sides
+        # are never coalesced. Without the result cache both are fresh,
+        # independent samples; with it, each side is stored under its own key,
+        # so an A/A run replays two separately recorded samples.
+        keyed = _cache_active(request.config)
+        baseline_result, treatment_result = await asyncio.gather(
+            run_copilot_cached(
+                request.config,
+                baseline,
+                task,
+                key=f"{cache_key(baseline, task)}-baseline" if keyed else None,
+                client=copilot_client,
+            ),
+            run_copilot_cached(
+                request.config,
+                treatment,
+                task,
+                key=f"{cache_key(treatment, task)}-treatment" if keyed else None,
+                client=copilot_client,
+            ),
+        )
 
         # Stash treatment result for pytest-skill-engineering reporting.
         # Treatment is the config being evaluated; its result is what matters.
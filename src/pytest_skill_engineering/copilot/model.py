@@ -40,44 +40,60 @@ if TYPE_CHECKING:
 _logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Lazy singleton CopilotClient
+# Lazy per-loop CopilotClient
 # ---------------------------------------------------------------------------
 
-_client: Any | None = None
-_client_lock: asyncio.Lock | None = None
-_client_lock_loop: asyncio.AbstractEventLoop | None = None
-_client_loop: asyncio.AbstractEventLoop | None = None
+# A CopilotClient is bound to the event loop it started on. Each live loop
+# that makes model calls keeps its own client: the test session's loop and
+# the background loop that runs sync judge calls (``_run_judge_sync``) can
+# alternate without either replacing the other's CLI.
+# Maps loop -> (client, owned). ``owned`` is False for a client lent by
+# share_copilot_model_client(); its owner, not shutdown, stops it.
+_clients: dict[asyncio.AbstractEventLoop, tuple[Any, bool]] = {}
+_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
 
 
 def _get_lock() -> asyncio.Lock:
-    """Get or create the client lock (lazy to avoid event loop issues at import)."""
-    global _client_lock, _client_lock_loop
-    current_loop = asyncio.get_running_loop()
-    if _client_lock is None or _client_lock_loop is not current_loop:
-        _client_lock = asyncio.Lock()
-        _client_lock_loop = current_loop
-    return _client_lock
+    """Get or create the running loop's client lock."""
+    loop = asyncio.get_running_loop()
+    lock = _locks.get(loop)
+    if lock is None:
+        lock = _locks[loop] = asyncio.Lock()
+    return lock
+
+
+def _forget_closed_loops() -> None:
+    """Drop clients whose loop has closed; they can no longer be awaited."""
+    for loop in [loop for loop in _clients if loop.is_closed()]:
+        _logger.debug("Event loop closed — dropping its CopilotClient")
+        del _clients[loop]
+    for loop in [loop for loop in _locks if loop.is_closed()]:
+        del _locks[loop]
+
+
+async def _stop_client(client: Any) -> None:
+    try:
+        await client.stop()
+    except Exception:
+        try:
+            await client.force_stop()
+        except Exception:
+            _logger.debug("Failed to stop CopilotClient", exc_info=True)
 
 
 async def _get_or_create_client() -> Any:
-    """Get or create a shared CopilotClient singleton.
+    """Get or create the CopilotClient for the running event loop.
 
-    The client is expensive to start (spawns a process), so we reuse it
-    across all model calls in the same process.  If the event loop has
-    changed (e.g. between pytest tests), recreates the client.
+    The client is expensive to start (spawns a process), so it is reused
+    by every model call on the same loop. A loop without one (e.g. a new
+    per-test loop) starts its own.
     """
-    global _client, _client_loop
-
     async with _get_lock():
+        _forget_closed_loops()
         current_loop = asyncio.get_running_loop()
-        # If the loop changed, client is stale — reset under lock.
-        if _client_loop is not None and _client_loop is not current_loop:
-            _logger.debug("Event loop changed — resetting CopilotClient singleton")
-            _client = None
-            _client_loop = None
-
-        if _client is not None:
-            return _client
+        entry = _clients.get(current_loop)
+        if entry is not None:
+            return entry[0]
 
         try:
             from copilot import CopilotClient
@@ -98,35 +114,62 @@ async def _get_or_create_client() -> Any:
         if token:
             subprocess_config.github_token = token
 
-        _client = CopilotClient(subprocess_config, auto_start=True)
-        await asyncio.wait_for(_client.start(), timeout=60)
-        _client_loop = current_loop
+        client = CopilotClient(subprocess_config, auto_start=True)
+        await asyncio.wait_for(client.start(), timeout=60)
+        _clients[current_loop] = (client, True)
         _logger.info("Shared CopilotClient started for model provider")
-        return _client
+        return client
+
+
+async def share_copilot_model_client(client: Any | None) -> None:
+    """Serve ``CopilotModel`` requests on this loop from an already-started ``client``.
+
+    Lets a test session that already runs a Copilot CLI (for example a
+    session-scoped ``copilot_client`` fixture) reuse it for summary and
+    async judge calls made on its loop instead of starting a second one.
+    Sync judge calls (``llm_assert``, ``llm_score``) run on their own
+    background loop and keep a separate client there. Must be called on
+    the loop the client runs on. The caller keeps ownership and stops the
+    client itself; pass ``None`` before doing so to detach it.
+    """
+    async with _get_lock():
+        loop = asyncio.get_running_loop()
+        previous = _clients.pop(loop, None)
+        if previous is not None and previous[1]:
+            await _stop_client(previous[0])
+        if client is not None:
+            _clients[loop] = (client, False)
 
 
 async def shutdown_copilot_model_client() -> None:
-    """Shutdown the shared CopilotClient.
+    """Stop every CopilotClient started for model calls.
 
-    Called from ``pytest_sessionfinish`` to clean up the background process.
-    Acquires the client lock to avoid races with concurrent requests.
+    Called from ``pytest_sessionfinish`` to clean up the background
+    processes. Clients on another still-running loop (the judge loop) are
+    stopped on that loop. Lent clients are detached, not stopped.
     """
-    global _client, _client_loop
+    current_loop = asyncio.get_running_loop()
     async with _get_lock():
-        if _client is None:
-            return
-        try:
-            await _client.stop()
-        except Exception:
-            try:
-                await _client.force_stop()
-            except Exception:
-                pass
-        _client = None
-        _client_loop = None
+        _forget_closed_loops()
+        entries = list(_clients.items())
+        _clients.clear()
+    for loop, (client, owned) in entries:
+        if not owned:
+            continue
+        if loop is current_loop:
+            await _stop_client(client)
+        elif loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(_stop_client(client), loop)
+            await asyncio.wrap_future(future)
+    if entries:
         _logger.info("Shared CopilotClient stopped")
 
 
+def has_copilot_model_clients() -> bool:
+    """Return True while any loop holds a model CopilotClient."""
+    return bool(_clients)
+
+
 # ---------------------------------------------------------------------------
 # CopilotModel
 # ---------------------------------------------------------------------------
@@ -136,12 +136,36 @@ class CopilotCLIPersona(Persona):
         _inject_skill_reference_tools(agent, session_config)
 
 
+# ---------------------------------------------------------------------------
+# Subagent dispatch polyfills
+# ---------------------------------------------------------------------------
+
+
+class _DispatchPolyfillPersona(Persona):
+    """Shared options for personas that polyfill subagent dispatch.
+
+    Args:
+        defer_agent_prompts: Register custom agents with ``infer=False``,
+            so the orchestrator sees only their names and descriptions and
+            a subagent's full prompt is sent only when the polyfill
+            dispatches it. Off by default.
+    """
+
+    def __init__(self, *, defer_agent_prompts: bool = False) -> None:
+        self.defer_agent_prompts = defer_agent_prompts
+
+    def __repr__(self) -> str:
+        if self.defer_agent_prompts:
+            return f"{self.__class__.__name__}(defer_agent_prompts=True)"
+        return super().__repr__()
+
+
 # ---------------------------------------------------------------------------
 # VS Code
 # ---------------------------------------------------------------------------
 
 
-class VSCodePersona(Persona):
+class VSCodePersona(_DispatchPolyfillPersona):
     """VS Code Copilot extension persona.
 
     Polyfills ``runSubagent`` so agents written for VS Code (where
@@ -149,7 +173,9 @@ class VSCodePersona(Persona):
     correctly during testing.
 
     The polyfill is only injected when ``agent.custom_agents`` is non-empty,
-    so using this persona with a plain agent has no side-effects.
+    so using this persona with a plain agent has no side-effects. Pass
+    ``defer_agent_prompts=True`` to register the agents with ``infer=False``
+    so their prompts reach the model only on dispatch.
     """
 
     _SYSTEM_MSG = "You are running inside VS Code."
@@ -171,6 +197,8 @@ class VSCodePersona(Persona):
         if agent.custom_agents:
             tool = _make_runsubagent_tool(agent, agent.custom_agents, mapper)
             _inject_tool(session_config, tool)
+            if self.defer_agent_prompts:
+                _disable_native_inference(session_config)
             agents_block = _build_agents_block(agent.custom_agents, tool_name="runSubagent")
             _prepend_system_message(session_config, agents_block)
         _inject_skill_reference_tools(agent, session_config)
@@ -181,7 +209,7 @@ class VSCodePersona(Persona):
 # ---------------------------------------------------------------------------
 
 
-class ClaudeCodePersona(Persona):
+class ClaudeCodePersona(_DispatchPolyfillPersona):
     """Claude Code persona.
 
     Polyfills a ``task``-dispatch tool (same dispatch mechanism as
@@ -189,6 +217,7 @@ class ClaudeCodePersona(Persona):
     agents written for Claude Code can dispatch sub-agents during testing.
 
     The polyfill is only injected when ``agent.custom_agents`` is non-empty.
+    ``defer_agent_prompts`` works as in :class:`VSCodePersona`.
     """
 
     _SYSTEM_MSG = "You are running inside Claude Code."
@@ -210,6 +239,8 @@ class ClaudeCodePersona(Persona):
         if agent.custom_agents:
             tool = _make_task_tool(agent, agent.custom_agents, mapper)
             _inject_tool(session_config, tool)
+            if self.defer_agent_prompts:
+                _disable_native_inference(session_config)
             agents_block = _build_agents_block(agent.custom_agents, tool_name="task")
             _prepend_system_message(session_config, agents_block)
         _inject_skill_reference_tools(agent, session_config)
@@ -247,6 +278,21 @@ def _inject_tool(session_config: dict[str, Any], tool: "Tool") -> None:
     session_config["tools"] = existing + [tool]
 
 
+def _disable_native_inference(session_config: dict[str, Any]) -> None:
+    """Keep the CLI from offering custom agents to the orchestrator itself.
+
+    With a dispatch polyfill in place, the orchestrator only needs each
+    agent's name and description (from the ``<agents>`` block); the full
+    ``prompt`` is sent by the polyfill when, and only when, an agent is
+    dispatched. Agents stay registered, so ``active_agent`` still works, and
+    an explicit ``infer`` on an agent config is left untouched.
+    """
+    if "custom_agents" in session_config:
+        session_config["custom_agents"] = [
+            {**a, "infer": a.get("infer", False)} for a in session_config["custom_agents"]
+        ]
+
+
 def _build_agents_block(custom_agents: list[dict[str, Any]], tool_name: str = "runSubagent") -> str:
     """Build the <agents> XML block that VS Code injects into the system prompt.
 
@@ -328,7 +374,8 @@ def _make_subagent_dispatch_tool(
         custom_agents: List of custom agent config dicts (each with at least
             a ``name`` key, optionally ``prompt``, ``description``).
         mapper: The ``EventMapper`` for the current run, used to record
-            subagent lifecycle events.
+            subagent lifecycle events. Its ``client`` also serves the
+            nested subagent sessions.
     """
     from copilot import Tool, ToolResult
 
@@ -380,7 +427,12 @@ def _make_subagent_dispatch_tool(
             auto_confirm=True,
         )
 
-        sub_result = await run_copilot(sub_agent, prompt_text)
+        # Reuse the parent's running CLI: auth and startup were already paid
+        mapper.dispatches_in_flight += 1
+        try:
+            sub_result = await run_copilot(sub_agent, prompt_text, client=mapper.client)
+        finally:
+            mapper.dispatches_in_flight -= 1
 
         if sub_result.success:
             mapper.record_subagent_complete(eval_name)
@@ -75,6 +75,9 @@ class CopilotResult:
     # Raw SDK events for advanced inspection
     raw_events: list[Any] = field(default_factory=list)
 
+    # Number of SDK events seen, kept even when raw_events capture is off
+    raw_event_count: int = 0
+
     # Back-reference to the agent that produced this result.
     # Set automatically by run_copilot() so the plugin hook can
     # stash results for pytest-skill-engineering without requiring the
@@ -109,7 +112,8 @@ class CopilotResult:
 
     def tool_was_called(self, name: str) -> bool:
         """Check if a specific tool was called."""
-        return name in self.tool_names_called
+        # Stops at the first match instead of collecting every call name
+        return any(call.name == name for turn in self.turns for call in turn.tool_calls)
 
     def tool_call_count(self, name: str) -> int:
         """Count how many times a specific tool was called."""
@@ -13,8 +13,10 @@ No LiteLLM. No outer agent. One LLM. Direct SDK access.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from pytest_skill_engineering.copilot.events import EventMapper
@@ -40,6 +42,8 @@ else:
     CopilotClient = _SdkCopilotClient
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from copilot import CopilotSession, SessionEvent
 
     from pytest_skill_engineering.copilot.eval import CopilotEval
@@ -48,7 +52,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-async def run_copilot(agent: CopilotEval, prompt: str) -> CopilotResult:
+async def run_copilot(
+    agent: CopilotEval,
+    prompt: str,
+    *,
+    client: Any | None = None,
+    success_predicate: Callable[[Path], bool] | None = None,
+) -> CopilotResult:
     """Execute a prompt against GitHub Copilot and return structured results.
 
     This is the primary entry point for test execution. It manages the full
@@ -59,6 +69,10 @@ async def run_copilot(agent: CopilotEval, prompt: str) -> CopilotResult:
     ``agent.max_retries`` times with ``agent.retry_delay_s`` delay between
     attempts.
 
+    ``agent.max_turns`` caps the assistant turns of a run. Once the agent
+    starts one turn more, the session is aborted and a failed result is
+    returned, so a looping agent fails long before ``agent.timeout_s``.
+
     Authentication is resolved in this order:
     1. ``GITHUB_TOKEN`` environment variable (ideal for CI)
     2. Logged-in user via ``gh`` CLI / OAuth (local development)
@@ -66,6 +80,18 @@ async def run_copilot(agent: CopilotEval, prompt: str) -> CopilotResult:
     Args:
         agent: CopilotEval configuration.
         prompt: The prompt to send to Copilot.
+        client: Optional already-started ``CopilotClient`` to open the
+            session on (see :func:`create_copilot_client`). The client is
+            left running; only the session is disconnected afterwards.
+            When omitted, a client is started and stopped for this call.
+        success_predicate: Optional acceptance check, called with the
+            working directory every ``SUCCESS_POLL_INTERVAL_S`` while the
+            agent runs. As soon as it returns True the session is aborted
+            and the events captured so far are returned as a successful
+            result, instead of waiting for the agent to declare itself done.
+            ``agent.timeout_s`` still applies as the hard limit. The check
+            is skipped while a ``runSubagent``/``task`` dispatch is running,
+            so no nested session is left behind by the abort.
 
     Returns:
         CopilotResult with all captured events, tool calls, usage, etc.
@@ -77,7 +103,7 @@ async def run_copilot(agent: CopilotEval, prompt: str) -> CopilotResult:
     last_result: CopilotResult | None = None
 
     for attempt in range(1, agent.max_retries + 2):  # +2: 1 initial + max_retries
-        result = await _run_copilot_once(agent, prompt)
+        result = await _run_copilot_once(agent, prompt, client, success_predicate)
         result.agent = agent  # Back-reference for automated report stashing
 
         if result.success or not _is_transient_error(result.error):
@@ -117,14 +143,55 @@ def _is_transient_error(error: str | None) -> bool:
     return any(pattern in error for pattern in _TRANSIENT_PATTERNS)
 
 
-async def _run_copilot_once(agent: "CopilotEval", prompt: str) -> "CopilotResult":
-    """Execute a single attempt of a prompt against GitHub Copilot."""
-    from copilot import PermissionHandler, SubprocessConfig
+# How often run_copilot() re-checks a success_predicate while the agent works.
+SUCCESS_POLL_INTERVAL_S = 0.5
 
-    subprocess_config = SubprocessConfig(
-        cwd=agent.working_directory or ".",
-        log_level="warning",
-    )
+
+async def _send_until(
+    send: asyncio.Future[Any],
+    session: CopilotSession,
+    accepted: Callable[[], bool] | None,
+    over_budget: Callable[[], str | None],
+) -> SessionEvent | None:
+    """Await ``send`` unless ``accepted()`` or ``over_budget()`` fires first.
+
+    On early acceptance the in-flight turn is aborted and ``None`` is
+    returned. When ``over_budget()`` returns a message the turn is aborted
+    and ``RuntimeError`` is raised with it. Errors and timeouts from
+    ``send`` propagate unchanged.
+    """
+    while True:
+        done, _ = await asyncio.wait({send}, timeout=SUCCESS_POLL_INTERVAL_S)
+        if done:
+            return send.result()
+        if accepted is not None and accepted():
+            logger.info("Success predicate met — stopping before the agent finished")
+            await _abort(send, session)
+            return None
+        exceeded = over_budget()
+        if exceeded:
+            await _abort(send, session)
+            raise RuntimeError(exceeded)
+
+
+async def _abort(send: asyncio.Future[Any], session: CopilotSession) -> None:
+    """Cancel the pending send and abort the session's in-flight turn."""
+    send.cancel()
+    try:
+        await session.abort()
+    except Exception:
+        logger.debug("Session abort failed", exc_info=True)
+
+
+def create_copilot_client(cwd: str | None = None) -> Any:
+    """Build an unstarted ``CopilotClient`` configured for test runs.
+
+    Authenticates with ``GITHUB_TOKEN`` when it is set. Start the client
+    with ``await client.start()`` and stop it with ``await client.stop()``.
+    """
+    from copilot import SubprocessConfig
+
+    subprocess_config = SubprocessConfig(cwd=cwd or ".", log_level="warning")
 
     # Pass GITHUB_TOKEN from environment for CI authentication
     github_token = os.environ.get("GITHUB_TOKEN")
@@ -132,16 +199,33 @@ async def _run_copilot_once(agent: "CopilotEval", prompt: str) -> "CopilotResult
         subprocess_config.github_token = github_token
         logger.info("Using GITHUB_TOKEN from environment for authentication")
 
-    client = CopilotClient(subprocess_config, auto_start=True)
+    return CopilotClient(subprocess_config, auto_start=True)
+
+
+async def _run_copilot_once(
+    agent: "CopilotEval",
+    prompt: str,
+    client: Any | None = None,
+    success_predicate: Callable[[Path], bool] | None = None,
+) -> "CopilotResult":
+    """Execute a single attempt of a prompt against GitHub Copilot."""
+    from copilot import PermissionHandler
+
+    owns_client = client is None
+    if owns_client:
+        client = create_copilot_client(agent.working_directory)
+    session: CopilotSession | None = None
 
-    mapper = EventMapper()
+    mapper = EventMapper(capture_raw_events=agent.capture_raw_events)
+    mapper.client = client
     loop = asyncio.get_running_loop()
     _start = loop.time()
 
     try:
-        # Hard timeout on startup — CLI must start within 60s.
-        await asyncio.wait_for(client.start(), timeout=60)
-        logger.info("Copilot CLI started")
+        if owns_client:
+            # Hard timeout on startup — CLI must start within 60s.
+            await asyncio.wait_for(client.start(), timeout=60)
+            logger.info("Copilot CLI started")
 
         # Build session config from agent
         session_config = agent.build_session_config()
@@ -155,7 +239,7 @@ async def _run_copilot_once(agent: "CopilotEval", prompt: str) -> "CopilotResult
             session_config["on_permission_request"] = PermissionHandler.approve_all
 
         # Hard timeout on session creation — 30s is generous.
-        session: CopilotSession = await asyncio.wait_for(
+        session = await asyncio.wait_for(
             client.create_session(**session_config),
             timeout=30,
         )
@@ -167,10 +251,26 @@ async def _run_copilot_once(agent: "CopilotEval", prompt: str) -> "CopilotResult
         # Send prompt and wait for completion.
         # Pass timeout to both send_and_wait (SDK-internal idle wait)
         # and asyncio.wait_for (hard outer limit).
-        result_event: SessionEvent | None = await asyncio.wait_for(
-            session.send_and_wait(prompt, timeout=agent.timeout_s),
-            timeout=agent.timeout_s,
+        send = asyncio.ensure_future(
+            asyncio.wait_for(
+                session.send_and_wait(prompt, timeout=agent.timeout_s),
+                timeout=agent.timeout_s,
+            )
         )
+        accepted: Callable[[], bool] | None = None
+        if success_predicate is not None:
+            check = functools.partial(success_predicate, Path(agent.working_directory or "."))
+
+            def accepted() -> bool:
+                # Aborting now would orphan a nested subagent session
+                return mapper.dispatches_in_flight == 0 and check()
+
+        def over_budget() -> str | None:
+            if mapper.assistant_turns > agent.max_turns:
+                return f"Exceeded max_turns={agent.max_turns}"
+            return None
+
+        result_event = await _send_until(send, session, accepted, over_budget)
 
         # If send_and_wait returned a final event, process it too
         if result_event is not None:
@@ -201,10 +301,18 @@ async def _run_copilot_once(agent: "CopilotEval", prompt: str) -> "CopilotResult
         return result
 
     finally:
-        try:
-            await client.stop()
-        except Exception:
-            logger.warning("Failed to stop Copilot CLI cleanly, force stopping")
-            await client.force_stop()
+        if not owns_client:
+            # Shared client stays up for the next run; release only this session
+            if session is not None:
+                try:
+                    await session.disconnect()
+                except Exception:
+                    logger.warning("Failed to disconnect Copilot session cleanly")
+        else:
+            try:
+                await client.stop()
+            except Exception:
+                logger.warning("Failed to stop Copilot CLI cleanly, force stopping")
+                await client.force_stop()
 
     return mapper.build()
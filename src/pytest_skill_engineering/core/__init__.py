@@ -1,6 +1,11 @@
 """Core module - agent configuration and result types."""
 
-from pytest_skill_engineering.core.errors import AITestError, EngineTimeoutError, ServerStartError
+from pytest_skill_engineering.core.errors import (
+    AITestError,
+    CacheMissError,
+    EngineTimeoutError,
+    ServerStartError,
+)
 from pytest_skill_engineering.core.eval import (
     ClarificationDetection,
     ClarificationLevel,
@@ -48,6 +53,7 @@ from pytest_skill_engineering.core.skill_grading import export_grading
 
 __all__ = [
     "AITestError",
+    "CacheMissError",
     "Eval",
     "EvalResult",
     "CLIExecution",
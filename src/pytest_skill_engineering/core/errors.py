@@ -33,6 +33,18 @@ class ToolCallError(AITestError):
         super().__init__(f"Tool '{tool_name}' failed: {message}")
 
 
+class CacheMissError(AITestError):
+    """A replay-only cache has no recorded response for a request."""
+
+    def __init__(self, env_var: str, key: str) -> None:
+        self.env_var = env_var
+        self.key = key
+        super().__init__(
+            f"No recorded response for cache key {key} ({env_var}=replay). "
+            f"Re-run with {env_var}=1 to record it."
+        )
+
+
 class RateLimitError(AITestError):
     """Rate limit exceeded."""
 
@@ -301,7 +301,8 @@ class EvalResult:
 
     def tool_was_called(self, name: str) -> bool:
         """Check if a specific tool was called."""
-        return name in self.tool_names_called
+        # Stops at the first match instead of collecting every call name
+        return any(call.name == name for turn in self.turns for call in turn.tool_calls)
 
     def tool_was_called_from_server(self, server_name: str, tool_name: str) -> bool:
         """Check if a specific tool from a named MCP server was called.
@@ -7,7 +7,7 @@ from dataclasses import fields, is_dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from pytest_skill_engineering.reporting.collector import SuiteReport
+    from pytest_skill_engineering.reporting.collector import SuiteReport, TestReport
 
 
 def serialize_dataclass(obj: Any) -> Any:
@@ -47,204 +47,211 @@ def deserialize_suite_report(data: dict[str, Any]) -> SuiteReport:
 
     Reconstructs the full dataclass hierarchy from the serialized format.
     """
+    from pytest_skill_engineering.reporting.collector import SuiteReport
+
+    tests = [deserialize_test_report(test_data) for test_data in data.get("tests", [])]
+
+    # Reconstruct suite report
+    return SuiteReport(
+        name=data["name"],
+        timestamp=data["timestamp"],
+        duration_ms=data["duration_ms"],
+        tests=tests,
+        passed=data.get("passed", 0),
+        failed=data.get("failed", 0),
+        skipped=data.get("skipped", 0),
+        suite_docstring=data.get("suite_docstring"),
+    )
+
+
+def deserialize_test_report(test_data: dict[str, Any]) -> TestReport:
+    """Deserialize a single TestReport from a dict (from JSON).
+
+    Used for each entry of a serialized SuiteReport and for results shipped
+    from pytest-xdist workers to the controller.
+    """
     from pytest_skill_engineering.core.result import EvalResult, ToolCall, Turn
-    from pytest_skill_engineering.reporting.collector import SuiteReport, TestReport
+    from pytest_skill_engineering.reporting.collector import TestReport
 
-    # Reconstruct tests
-    tests = []
-    for test_data in data.get("tests", []):
-        # Reconstruct agent result if present (support both new and legacy field name)
-        eval_result = None
-        if test_data.get("eval_result") or test_data.get("agent_result"):
-            test_data.setdefault("eval_result", test_data.get("agent_result"))
-        if test_data.get("eval_result"):
-            ar_data = test_data["eval_result"]
-
-            # Reconstruct turns
-            turns = []
-            for turn_data in ar_data.get("turns", []):
-                # Reconstruct tool calls
-                tool_calls = []
-                for tc_data in turn_data.get("tool_calls", []):
-                    # Decode base64 image content if present
-                    image_content = None
-                    if tc_data.get("image_content"):
-                        image_content = base64.b64decode(tc_data["image_content"])
-
-                    tool_calls.append(
-                        ToolCall(
-                            name=tc_data["name"],
-                            arguments=tc_data.get("arguments", {}),
-                            result=tc_data.get("result"),
-                            error=tc_data.get("error"),
-                            duration_ms=tc_data.get("duration_ms"),
-                            image_content=image_content,
-                            image_media_type=tc_data.get("image_media_type"),
-                        )
-                    )
+    # Reconstruct agent result if present (support both new and legacy field name)
+    eval_result = None
+    if test_data.get("eval_result") or test_data.get("agent_result"):
+        test_data.setdefault("eval_result", test_data.get("agent_result"))
+    if test_data.get("eval_result"):
+        ar_data = test_data["eval_result"]
+
+        # Reconstruct turns
+        turns = []
+        for turn_data in ar_data.get("turns", []):
+            # Reconstruct tool calls
+            tool_calls = []
+            for tc_data in turn_data.get("tool_calls", []):
+                # Decode base64 image content if present
+                image_content = None
+                if tc_data.get("image_content"):
+                    image_content = base64.b64decode(tc_data["image_content"])
 
-                turns.append(
-                    Turn(
-                        role=turn_data["role"],
-                        content=turn_data["content"],
-                        tool_calls=tool_calls,
+                tool_calls.append(
+                    ToolCall(
+                        name=tc_data["name"],
+                        arguments=tc_data.get("arguments", {}),
+                        result=tc_data.get("result"),
+                        error=tc_data.get("error"),
+                        duration_ms=tc_data.get("duration_ms"),
+                        image_content=image_content,
+                        image_media_type=tc_data.get("image_media_type"),
                     )
                 )
 
-            # Reconstruct clarification stats if present
-            from pytest_skill_engineering.core.result import ClarificationStats
-
-            clarification_stats = None
-            if ar_data.get("clarification_stats") is not None:
-                cs_data = ar_data["clarification_stats"]
-                clarification_stats = ClarificationStats(
-                    count=cs_data.get("count", 0),
-                    turn_indices=cs_data.get("turn_indices", []),
-                    examples=cs_data.get("examples", []),
+            turns.append(
+                Turn(
+                    role=turn_data["role"],
+                    content=turn_data["content"],
+                    tool_calls=tool_calls,
                 )
+            )
 
-            # Reconstruct assertions if present
-            from pytest_skill_engineering.core.result import Assertion
-
-            assertions = []
-            for a_data in ar_data.get("assertions", []):
-                assertions.append(
-                    Assertion(
-                        type=a_data["type"],
-                        passed=a_data["passed"],
-                        message=a_data["message"],
-                        details=a_data.get("details"),
-                    )
-                )
+        # Reconstruct clarification stats if present
+        from pytest_skill_engineering.core.result import ClarificationStats
 
-            # Reconstruct available tools if present
-            from pytest_skill_engineering.core.result import (
-                MCPPrompt,
-                MCPPromptArgument,
-                SkillInfo,
-                ToolInfo,
+        clarification_stats = None
+        if ar_data.get("clarification_stats") is not None:
+            cs_data = ar_data["clarification_stats"]
+            clarification_stats = ClarificationStats(
+                count=cs_data.get("count", 0),
+                turn_indices=cs_data.get("turn_indices", []),
+                examples=cs_data.get("examples", []),
             )
 
-            available_tools = []
-            for t_data in ar_data.get("available_tools", []):
-                available_tools.append(
-                    ToolInfo(
-                        name=t_data["name"],
-                        description=t_data["description"],
-                        input_schema=t_data.get("input_schema", {}),
-                        server_name=t_data.get("server_name", ""),
-                    )
+        # Reconstruct assertions if present
+        from pytest_skill_engineering.core.result import Assertion
+
+        assertions = []
+        for a_data in ar_data.get("assertions", []):
+            assertions.append(
+                Assertion(
+                    type=a_data["type"],
+                    passed=a_data["passed"],
+                    message=a_data["message"],
+                    details=a_data.get("details"),
                 )
+            )
 
-            # Reconstruct MCP prompts if present
-            mcp_prompts = []
-            for p_data in ar_data.get("mcp_prompts", []):
-                args = [
-                    MCPPromptArgument(
-                        name=a["name"],
-                        description=a.get("description", ""),
-                        required=a.get("required", False),
-                    )
-                    for a in p_data.get("arguments", [])
-                ]
-                mcp_prompts.append(
-                    MCPPrompt(
-                        name=p_data["name"],
-                        description=p_data.get("description", ""),
-                        arguments=args,
-                    )
+        # Reconstruct available tools if present
+        from pytest_skill_engineering.core.result import (
+            MCPPrompt,
+            MCPPromptArgument,
+            SkillInfo,
+            ToolInfo,
+        )
+
+        available_tools = []
+        for t_data in ar_data.get("available_tools", []):
+            available_tools.append(
+                ToolInfo(
+                    name=t_data["name"],
+                    description=t_data["description"],
+                    input_schema=t_data.get("input_schema", {}),
+                    server_name=t_data.get("server_name", ""),
                 )
+            )
 
-            # Reconstruct skill info if present
-            skill_info = None
-            si_data = ar_data.get("skill_info")
-            if si_data:
-                skill_info = SkillInfo(
-                    name=si_data["name"],
-                    description=si_data["description"],
-                    instruction_content=si_data.get("instruction_content", ""),
-                    reference_names=si_data.get("reference_names", []),
+        # Reconstruct MCP prompts if present
+        mcp_prompts = []
+        for p_data in ar_data.get("mcp_prompts", []):
+            args = [
+                MCPPromptArgument(
+                    name=a["name"],
+                    description=a.get("description", ""),
+                    required=a.get("required", False),
+                )
+                for a in p_data.get("arguments", [])
+            ]
+            mcp_prompts.append(
+                MCPPrompt(
+                    name=p_data["name"],
+                    description=p_data.get("description", ""),
+                    arguments=args,
                 )
+            )
 
-            # Reconstruct custom agent info if present
-            from pytest_skill_engineering.core.result import CustomAgentInfo, InstructionFileInfo
+        # Reconstruct skill info if present
+        skill_info = None
+        si_data = ar_data.get("skill_info")
+        if si_data:
+            skill_info = SkillInfo(
+                name=si_data["name"],
+                description=si_data["description"],
+                instruction_content=si_data.get("instruction_content", ""),
+                reference_names=si_data.get("reference_names", []),
+            )
 
-            custom_agent_info = None
-            ca_data = ar_data.get("custom_agent_info")
-            if ca_data:
-                custom_agent_info = CustomAgentInfo(
-                    name=ca_data["name"],
-                    description=ca_data.get("description", ""),
-                    file_path=ca_data.get("file_path", ""),
-                )
+        # Reconstruct custom agent info if present
+        from pytest_skill_engineering.core.result import CustomAgentInfo, InstructionFileInfo
 
-            # Reconstruct instruction files if present
-            instruction_files = []
-            for if_data in ar_data.get("instruction_files", []):
-                instruction_files.append(
-                    InstructionFileInfo(
-                        name=if_data["name"],
-                        file_path=if_data.get("file_path", ""),
-                        apply_to=if_data.get("apply_to", ""),
-                        description=if_data.get("description", ""),
-                    )
-                )
+        custom_agent_info = None
+        ca_data = ar_data.get("custom_agent_info")
+        if ca_data:
+            custom_agent_info = CustomAgentInfo(
+                name=ca_data["name"],
+                description=ca_data.get("description", ""),
+                file_path=ca_data.get("file_path", ""),
+            )
 
-            # Reconstruct agent result
-            eval_result = EvalResult(
-                turns=turns,
-                success=ar_data.get("success", False),
-                error=ar_data.get("error"),
-                duration_ms=ar_data.get("duration_ms", 0.0),
-                token_usage=ar_data.get("token_usage", {}),
-                cost_usd=ar_data.get("cost_usd", 0.0),
-                session_context_count=ar_data.get("session_context_count", 0),
-                clarification_stats=clarification_stats,
-                assertions=assertions,
-                available_tools=available_tools,
-                skill_info=skill_info,
-                effective_system_prompt=ar_data.get("effective_system_prompt", ""),
-                mcp_prompts=mcp_prompts,
-                prompt_name=ar_data.get("prompt_name"),
-                custom_agent_info=custom_agent_info,
-                premium_requests=ar_data.get("premium_requests", 0.0),
-                instruction_files=instruction_files,
+        # Reconstruct instruction files if present
+        instruction_files = []
+        for if_data in ar_data.get("instruction_files", []):
+            instruction_files.append(
+                InstructionFileInfo(
+                    name=if_data["name"],
+                    file_path=if_data.get("file_path", ""),
+                    apply_to=if_data.get("apply_to", ""),
+                    description=if_data.get("description", ""),
+                )
             )
 
-        # Read identity from typed fields (support both new and legacy field names)
-        agent_id = test_data.get("agent_id", "")
-        eval_name = test_data.get("eval_name", test_data.get("agent_name", ""))
-        model = test_data.get("model", "")
-        system_prompt_name = test_data.get("system_prompt_name")
-        skill_name = test_data.get("skill_name")
-
-        # Reconstruct test report
-        test_report = TestReport(
-            name=test_data["name"],
-            outcome=test_data["outcome"],
-            duration_ms=test_data["duration_ms"],
-            eval_result=eval_result,
-            error=test_data.get("error"),
-            assertions=test_data.get("assertions", []),
-            docstring=test_data.get("docstring"),
-            class_docstring=test_data.get("class_docstring"),
-            agent_id=agent_id,
-            eval_name=eval_name,
-            model=model,
-            system_prompt_name=system_prompt_name,
-            skill_name=skill_name,
-            iteration=test_data.get("iteration"),
+        # Reconstruct agent result
+        eval_result = EvalResult(
+            turns=turns,
+            success=ar_data.get("success", False),
+            error=ar_data.get("error"),
+            duration_ms=ar_data.get("duration_ms", 0.0),
+            token_usage=ar_data.get("token_usage", {}),
+            cost_usd=ar_data.get("cost_usd", 0.0),
+            session_context_count=ar_data.get("session_context_count", 0),
+            clarification_stats=clarification_stats,
+            assertions=assertions,
+            available_tools=available_tools,
+            skill_info=skill_info,
+            effective_system_prompt=ar_data.get("effective_system_prompt", ""),
+            mcp_prompts=mcp_prompts,
+            prompt_name=ar_data.get("prompt_name"),
+            custom_agent_info=custom_agent_info,
+            premium_requests=ar_data.get("premium_requests", 0.0),
+            instruction_files=instruction_files,
         )
-        tests.append(test_report)
 
-    # Reconstruct suite report
-    return SuiteReport(
-        name=data["name"],
-        timestamp=data["timestamp"],
-        duration_ms=data["duration_ms"],
-        tests=tests,
-        passed=data.get("passed", 0),
-        failed=data.get("failed", 0),
-        skipped=data.get("skipped", 0),
-        suite_docstring=data.get("suite_docstring"),
+    # Read identity from typed fields (support both new and legacy field names)
+    agent_id = test_data.get("agent_id", "")
+    eval_name = test_data.get("eval_name", test_data.get("agent_name", ""))
+    model = test_data.get("model", "")
+    system_prompt_name = test_data.get("system_prompt_name")
+    skill_name = test_data.get("skill_name")
+
+    # Reconstruct test report
+    return TestReport(
+        name=test_data["name"],
+        outcome=test_data["outcome"],
+        duration_ms=test_data["duration_ms"],
+        eval_result=eval_result,
+        error=test_data.get("error"),
+        assertions=test_data.get("assertions", []),
+        docstring=test_data.get("docstring"),
+        class_docstring=test_data.get("class_docstring"),
+        agent_id=agent_id,
+        eval_name=eval_name,
+        model=model,
+        system_prompt_name=system_prompt_name,
+        skill_name=skill_name,
+        iteration=test_data.get("iteration"),
     )
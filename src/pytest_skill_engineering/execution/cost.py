@@ -31,8 +31,6 @@ import re
 from pathlib import Path
 from typing import Any
 
-from litellm import model_cost
-
 _logger = logging.getLogger(__name__)
 
 # Models that callers asked about but had no pricing anywhere.
@@ -111,6 +109,8 @@ def _find_dated_variant(model: str) -> str | None:
     if cached is not None or model in _dated_fallback_cache:
         return cached
 
+    from litellm import model_cost
+
     # Match "{model}-YYYYMMDD" exactly — no extra segments between model and date.
     dated_re = re.compile(re.escape(model) + r"-\d{8}$")
     matches = [k for k in model_cost if dated_re.fullmatch(k)]
@@ -149,6 +149,10 @@ def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
         return (input_tokens * pricing[0] + output_tokens * pricing[1]) / 1_000_000
 
     # 2. litellm exact match (per-token pricing)
+    # Imported lazily: litellm takes seconds to import, and processes that only
+    # load the package (e.g. the bundled MCP test servers) never need pricing.
+    from litellm import model_cost
+
     info = model_cost.get(model)
     if info is None and not _DATE_SUFFIX_RE.search(model):
         # 3. Dated-version fallback: "model" → "model-YYYYMMDD" (exactly one)
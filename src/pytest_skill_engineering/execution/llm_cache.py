@@ -0,0 +1,227 @@
+"""Opt-in on-disk caches for LLM calls.
+
+``llm_assert``, ``llm_assert_image``, ``llm_score`` and
+``optimize_instruction`` send the same rubric and content on every run of
+an unchanged test, and so does an ``eval_run`` agent facing an unchanged
+prompt and tool set. :class:`CachedModel` wraps a PydanticAI model and
+replays earlier responses from disk:
+
+- ``PYTEST_JUDGE_CACHE=1`` wraps judge and optimizer models, under
+  ``~/.cache/pytest-skill-engineering/judge/``.
+- ``PYTEST_EVAL_CACHE=1`` wraps the model of every ``Eval`` run by
+  ``eval_run``, under ``~/.cache/pytest-skill-engineering/eval/``. MCP and
+  CLI tools still execute; only the model round-trips are replayed, so a
+  tool returning different output misses the cache from that turn on.
+
+The key is a SHA-256 over the model name, every message part's content,
+the model settings (temperature, max tokens, ...) and the tool/output
+schemas of the request. Timestamps and tool-call IDs are left out.
+Changing a prompt, rubric, criterion, judged content or sampling setting
+therefore misses the cache on its own, with no manual invalidation.
+
+Concurrent identical requests on one event loop share a single call.
+
+Entries expire after ``PYTEST_JUDGE_CACHE_TTL`` / ``PYTEST_EVAL_CACHE_TTL``
+seconds (default one day).
+
+Setting either variable to ``replay`` makes its cache read-only: entries
+never expire, and a request with no recorded response raises
+:class:`~pytest_skill_engineering.core.errors.CacheMissError` instead of
+calling the model. Record with ``=1``, then run offline with ``=replay``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic_ai.messages import ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models.wrapper import WrapperModel
+
+from pytest_skill_engineering.core.errors import CacheMissError
+from pytest_skill_engineering.execution.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from pydantic_ai.messages import ModelMessage
+    from pydantic_ai.models import KnownModelName, Model, ModelRequestParameters
+    from pydantic_ai.settings import ModelSettings
+
+_logger = logging.getLogger(__name__)
+
+JUDGE_CACHE_ENV = "PYTEST_JUDGE_CACHE"
+JUDGE_CACHE_TTL_ENV = "PYTEST_JUDGE_CACHE_TTL"
+EVAL_CACHE_ENV = "PYTEST_EVAL_CACHE"
+EVAL_CACHE_TTL_ENV = "PYTEST_EVAL_CACHE_TTL"
+DEFAULT_TTL_S = 24 * 60 * 60
+
+# Message and part fields that differ between otherwise identical requests
+_VOLATILE_FIELDS = frozenset({"timestamp", "run_id", "tool_call_id", "provider_details"})
+
+
+def _env_value(name: str) -> str:
+    return os.environ.get(name, "").strip().lower()
+
+
+def _env_enabled(name: str) -> bool:
+    return _env_value(name) in {"1", "true", "yes", "on", "replay"}
+
+
+def _env_ttl(name: str, ttl_name: str) -> float:
+    if _env_value(name) == "replay":
+        return math.inf
+    return float(os.environ.get(ttl_name, DEFAULT_TTL_S))
+
+
+def judge_cache_enabled() -> bool:
+    """Return True when ``PYTEST_JUDGE_CACHE`` opts in to judge caching."""
+    return _env_enabled(JUDGE_CACHE_ENV)
+
+
+def eval_cache_enabled() -> bool:
+    """Return True when ``PYTEST_EVAL_CACHE`` opts in to eval model caching."""
+    return _env_enabled(EVAL_CACHE_ENV)
+
+
+def _cache_dir(kind: str) -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pytest-skill-engineering" / kind
+
+
+def default_judge_cache_dir() -> Path:
+    """Return the judge cache root, honouring ``XDG_CACHE_HOME``."""
+    return _cache_dir("judge")
+
+
+def default_eval_cache_dir() -> Path:
+    """Return the eval model cache root, honouring ``XDG_CACHE_HOME``."""
+    return _cache_dir("eval")
+
+
+def _stable(value: Any) -> Any:
+    """JSON-ready view of ``value`` without volatile per-request fields."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _stable(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+            if f.name not in _VOLATILE_FIELDS
+        }
+    if isinstance(value, dict):
+        return {str(k): _stable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_stable(v) for v in value]
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    return value
+
+
+def request_cache_key(
+    model_name: str,
+    messages: list[ModelMessage],
+    model_settings: ModelSettings | None,
+    model_request_parameters: ModelRequestParameters,
+) -> str:
+    """Build the cache key for one model request."""
+    spec = {
+        "model": model_name,
+        "messages": _stable(messages),
+        "settings": _stable(model_settings),
+        "parameters": _stable(model_request_parameters),
+    }
+    payload = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Requests currently in flight, keyed by (cache root, request key)
+_single_flight: SingleFlight[tuple[Path, str], ModelResponse] = SingleFlight()
+
+
+class CachedModel(WrapperModel):
+    """Model that replays responses for requests it has seen before.
+
+    With ``replay_env`` set the cache is read-only: a miss raises
+    :class:`CacheMissError` naming that variable instead of calling the model.
+    """
+
+    def __init__(
+        self,
+        wrapped: Model | KnownModelName,
+        root: Path,
+        ttl_s: float,
+        replay_env: str | None = None,
+    ) -> None:
+        super().__init__(wrapped)
+        self.root = root
+        self.ttl_s = ttl_s
+        self.replay_env = replay_env
+
+    @classmethod
+    def for_judge(cls, wrapped: Model | KnownModelName) -> CachedModel:
+        """Wrap a judge model in the ``PYTEST_JUDGE_CACHE`` store."""
+        return cls._from_env(
+            wrapped, default_judge_cache_dir(), JUDGE_CACHE_ENV, JUDGE_CACHE_TTL_ENV
+        )
+
+    @classmethod
+    def for_eval(cls, wrapped: Model | KnownModelName) -> CachedModel:
+        """Wrap an eval agent's model in the ``PYTEST_EVAL_CACHE`` store."""
+        return cls._from_env(wrapped, default_eval_cache_dir(), EVAL_CACHE_ENV, EVAL_CACHE_TTL_ENV)
+
+    @classmethod
+    def _from_env(
+        cls, wrapped: Model | KnownModelName, root: Path, env: str, ttl_env: str
+    ) -> CachedModel:
+        replay_env = env if _env_value(env) == "replay" else None
+        return cls(wrapped, root, _env_ttl(env, ttl_env), replay_env)
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        """Return the cached response for this request, or call the model and store it.
+
+        Identical requests issued while the first is still running wait for
+        its response instead of calling the model again.
+        """
+        key = request_cache_key(self.model_name, messages, model_settings, model_request_parameters)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+        if self.replay_env is not None:
+            raise CacheMissError(self.replay_env, key)
+
+        async def _call() -> ModelResponse:
+            response = await super(CachedModel, self).request(
+                messages, model_settings, model_request_parameters
+            )
+            self._store(key, response)
+            return response
+
+        response, _ = await _single_flight.run((self.root, key), _call)
+        return response
+
+    def _load(self, key: str) -> ModelResponse | None:
+        path = self.root / f"{key}.json"
+        if not path.is_file():
+            return None
+        if time.time() - path.stat().st_mtime > self.ttl_s:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            (response,) = ModelMessagesTypeAdapter.validate_json(path.read_bytes())
+        except Exception:
+            _logger.debug("LLM cache entry %s unreadable, ignoring", key, exc_info=True)
+            return None
+        return response if isinstance(response, ModelResponse) else None
+
+    def _store(self, key: str, response: ModelResponse) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / f"{key}.json").write_bytes(ModelMessagesTypeAdapter.dump_json([response]))
@@ -27,6 +27,7 @@ from pydantic import BaseModel
 from pydantic_ai import Agent as PydanticAgent
 from pydantic_ai.models import Model
 
+from pytest_skill_engineering.execution.llm_cache import CachedModel, judge_cache_enabled
 from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
 
 if TYPE_CHECKING:
@@ -117,14 +118,18 @@ async def optimize_instruction(
             in plain English (e.g. ``"Always write docstrings"``).
         model: Provider/model string (e.g. ``"azure/gpt-5.2-chat"``,
             ``"openai/gpt-4o-mini"``) or a pre-configured pydantic-ai
-            ``Model`` object. Defaults to ``"azure/gpt-5.2-chat"``.
+            ``Model`` object. Defaults to ``"azure/gpt-5.2-chat"``. A model
+            string is wrapped in the judge cache when ``PYTEST_JUDGE_CACHE``
+            is set, so an unchanged instruction, result and criterion replay
+            the earlier suggestion.
 
     Returns:
         An :class:`InstructionSuggestion` with the improved instruction.
     """
-    resolved_model: str | Model = (
-        build_model_from_string(model) if isinstance(model, str) else model
-    )
+    resolved_model: str | Model = model
+    if isinstance(model, str):
+        built = build_model_from_string(model)
+        resolved_model = CachedModel.for_judge(built) if judge_cache_enabled() else built
     final_output = result.final_response or "(no response)"
     tool_calls = ", ".join(sorted(result.tool_names_called)) or "none"
 
@@ -44,8 +44,12 @@ def build_pydantic_model(agent: Eval) -> Model:
     """Convert our Provider config into a PydanticAI Model instance.
 
     Handles Azure Entra ID auth (no API key) and standard OpenAI-compatible providers.
+    Wrapped in a replaying cache when ``PYTEST_EVAL_CACHE`` is set.
     """
-    return build_model_from_string(agent.provider.model)
+    from pytest_skill_engineering.execution.llm_cache import CachedModel, eval_cache_enabled
+
+    model = build_model_from_string(agent.provider.model)
+    return CachedModel.for_eval(model) if eval_cache_enabled() else model
 
 
 def build_model_from_string(model_str: str) -> Any:
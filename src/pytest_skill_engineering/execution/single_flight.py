@@ -0,0 +1,72 @@
+"""Share one in-flight call between concurrent identical requests.
+
+Used by the LLM judge/eval cache and by ``copilot_eval`` while the Copilot
+result cache is on: a request that is already running is awaited rather
+than issued a second time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+K = TypeVar("K", bound="Hashable")
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """Coalesce concurrent calls that share a key on the same event loop.
+
+    The first caller for a key runs the call; callers arriving while it is
+    still running wait for its outcome and see its result or exception.
+    In-flight calls are tracked per event loop, so calls on different
+    loops (or threads) never wait on each other. If the running call is
+    cancelled, a waiter that was not cancelled itself retries the call
+    instead of inheriting the cancellation.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[K, asyncio.Future[T]]
+        ] = weakref.WeakKeyDictionary()
+
+    def _table(self) -> dict[K, asyncio.Future[T]]:
+        loop = asyncio.get_running_loop()
+        table = self._inflight.get(loop)
+        if table is None:
+            table = self._inflight[loop] = {}
+        return table
+
+    async def run(self, key: K, call: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Return ``(result, led)``; ``led`` is False when another caller's run was shared."""
+        table = self._table()
+        while (leader := table.get(key)) is not None:
+            try:
+                return await asyncio.shield(leader), False
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not leader.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The leader was cancelled, not us: take over the call
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        table[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved so a waiter-less future logs nothing
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if table.get(key) is future:
+                del table[key]
+        return result, True
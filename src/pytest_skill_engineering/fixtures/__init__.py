@@ -23,8 +23,12 @@ __all__ = [
 
 # Conditionally register copilot fixtures when the SDK is available
 try:
-    from pytest_skill_engineering.copilot.fixtures import ab_run, copilot_eval  # noqa: F401
+    from pytest_skill_engineering.copilot.fixtures import (  # noqa: F401
+        ab_run,
+        copilot_client,
+        copilot_eval,
+    )
 
-    __all__ += ["copilot_eval", "ab_run"]
+    __all__ += ["copilot_eval", "copilot_client", "ab_run"]
 except ImportError:
     pass  # github-copilot-sdk not installed — copilot fixtures not available
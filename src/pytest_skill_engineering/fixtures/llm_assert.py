@@ -6,16 +6,44 @@ plain-English criteria using pydantic-evals' LLM judge.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import pytest
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
     from pydantic_ai.models import Model
 
 _LLM_MODEL_DEFAULT = "openai/gpt-5-mini"
 
+_T = TypeVar("_T")
+
+_judge_loop: asyncio.AbstractEventLoop | None = None
+_judge_loop_lock = threading.Lock()
+
+
+def _run_judge_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a judge coroutine to completion from synchronous code.
+
+    The judge fixtures are called synchronously, often from inside an
+    already-running event loop in async tests, so the coroutine runs on a
+    background loop instead. That loop lives for the whole session: the
+    judge model's HTTP client keeps its pooled connections between
+    assertions rather than losing them with a per-call ``asyncio.run``.
+    """
+    global _judge_loop
+    with _judge_loop_lock:
+        if _judge_loop is None:
+            _judge_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_judge_loop.run_forever, name="aitest-judge", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _judge_loop).result()
+
 
 @dataclass(slots=True)
 class AssertionResult:
@@ -64,9 +92,6 @@ class LLMAssert:
         Returns:
             AssertionResult that is truthy if criterion is met.
         """
-        import asyncio
-        import concurrent.futures
-
         from pydantic_evals.evaluators.llm_as_a_judge import judge_output
 
         async def _judge() -> Any:
@@ -76,11 +101,7 @@ class LLMAssert:
                 model=self._model,
             )
 
-        # judge_output is async, but llm_assert is called synchronously
-        # (often from inside an already-running event loop in async tests).
-        # Run in a new thread with its own event loop.
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            grading = pool.submit(asyncio.run, _judge()).result()
+        grading = _run_judge_sync(_judge())
 
         preview = content[:200] + "..." if len(content) > 200 else content
 
@@ -93,10 +114,15 @@ class LLMAssert:
 
 
 def _build_judge_model(model_str: str) -> Any:
-    """Build a PydanticAI model from a model string for the judge."""
+    """Build a PydanticAI model from a model string for the judge.
+
+    Wrapped in a replaying cache when ``PYTEST_JUDGE_CACHE`` is set.
+    """
+    from pytest_skill_engineering.execution.llm_cache import CachedModel, judge_cache_enabled
     from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
 
-    return build_model_from_string(model_str)
+    model = build_model_from_string(model_str)
+    return CachedModel.for_judge(model) if judge_cache_enabled() else model
 
 
 @pytest.fixture
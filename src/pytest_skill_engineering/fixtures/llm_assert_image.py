@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from pytest_skill_engineering.fixtures.llm_assert import AssertionResult
+from pytest_skill_engineering.fixtures.llm_assert import AssertionResult, _run_judge_sync
 
 if TYPE_CHECKING:
     from pytest_skill_engineering.core.result import ImageContent
@@ -53,9 +53,6 @@ class LLMAssertImage:
         Returns:
             AssertionResult that is truthy if criterion is met.
         """
-        import asyncio
-        import concurrent.futures
-
         from pydantic_ai.messages import BinaryContent
         from pydantic_evals.evaluators.llm_as_a_judge import judge_output
 
@@ -76,9 +73,7 @@ class LLMAssertImage:
                 model=self._model,
             )
 
-        # judge_output is async, but llm_assert_image is called synchronously
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            grading = pool.submit(asyncio.run, _judge()).result()
+        grading = _run_judge_sync(_judge())
 
         return AssertionResult(
             passed=grading.pass_,
@@ -14,8 +14,6 @@ and A/B comparisons.
 
 from __future__ import annotations
 
-import asyncio
-import concurrent.futures
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -238,17 +236,17 @@ class LLMScore:
         Returns:
             ScoreResult with per-dimension scores and reasoning.
         """
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            return pool.submit(
-                asyncio.run,
-                _run_judge(
-                    content,
-                    rubric,
-                    model=self._model,
-                    content_label=content_label,
-                    context=context,
-                ),
-            ).result()
+        from pytest_skill_engineering.fixtures.llm_assert import _run_judge_sync
+
+        return _run_judge_sync(
+            _run_judge(
+                content,
+                rubric,
+                model=self._model,
+                content_label=content_label,
+                context=context,
+            )
+        )
 
     async def async_score(
         self,
@@ -22,6 +22,12 @@ from pytest_skill_engineering.plugin_report import (
     log_report_path,
     shutdown_copilot_model_client,
 )
+from pytest_skill_engineering.plugin_xdist import (
+    XdistReportCollector,
+    attach_for_controller,
+    group_session_tests,
+    is_xdist_worker,
+)
 from pytest_skill_engineering.reporting import (
     TestReport,
     build_suite_report,
@@ -152,7 +158,8 @@ def pytest_configure(config: Config) -> None:
     # Register markers
     config.addinivalue_line(
         "markers",
-        "aitest: Mark test as an AI agent test (optional, enables filtering with -m aitest)",
+        "aitest: Mark test as an AI agent test (auto-applied to tests using model-calling "
+        "fixtures; deselect them with -m 'not aitest')",
     )
     config.addinivalue_line(
         "markers",
@@ -170,6 +177,11 @@ def pytest_configure(config: Config) -> None:
 
     # Always initialize report collection - JSON is always generated
     config.stash[COLLECTOR_KEY] = []
+    # Under pytest-xdist the controller collects the results shipped by workers
+    if config.pluginmanager.hasplugin("xdist") and not is_xdist_worker(config):
+        config.pluginmanager.register(
+            XdistReportCollector(config.stash[COLLECTOR_KEY]), "aitest-xdist-collector"
+        )
     # Initialize session message storage
     config.stash[SESSION_MESSAGES_KEY] = {}
 
@@ -194,6 +206,15 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     )
 
 
+# Fixtures that call a model. Tests using any of them are auto-marked
+# ``aitest``, so ``-m "not aitest"`` runs only the offline tests.
+_MODEL_FIXTURES = frozenset(
+    {"eval_run", "copilot_eval", "ab_run", "llm_assert", "llm_assert_image", "llm_score"}
+)
+
+
+# tryfirst: xdist reads xdist_group marks in its own modifyitems hook
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(
     session: pytest.Session,
     config: Config,
@@ -206,8 +227,7 @@ def pytest_collection_modifyitems(
     for item in items:
         # Check if test uses any aitest fixtures
         fixturenames = getattr(item, "fixturenames", [])
-        aitest_fixtures = {"eval_run", "copilot_eval"}
-        if (aitest_fixtures & set(fixturenames)) and not any(
+        if (_MODEL_FIXTURES & set(fixturenames)) and not any(
             m.name == "aitest" for m in item.iter_markers()
         ):
             item.add_marker(pytest.mark.aitest)
@@ -218,6 +238,9 @@ def pytest_collection_modifyitems(
         if "copilot_eval" in fixturenames:
             has_copilot_eval = True
 
+    # Keep multi-turn sessions on one worker under --dist=loadgroup
+    group_session_tests(items)
+
     # Hard block: do not allow mixing Eval and CopilotEval in a single session
     if has_eval_run and has_copilot_eval:
         raise pytest.UsageError(
@@ -362,6 +385,8 @@ def pytest_runtest_makereport(item: Item, call: Any) -> Any:
         test_report._copilot_test = True
 
     tests.append(test_report)
+    if is_xdist_worker(item.config):
+        attach_for_controller(report, test_report)
 
     # Enrich JUnit XML with agent metadata (user_properties → <property> elements)
     _add_junit_properties(report, eval_result, agent)
@@ -462,7 +487,8 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
     config = session.config
     tests = config.stash.get(COLLECTOR_KEY, None)
 
-    if tests is None or not tests:
+    # xdist workers ship their results to the controller, which writes the reports
+    if tests is None or not tests or is_xdist_worker(config):
         return
 
     html_path = config.getoption("--aitest-html")
@@ -124,3 +124,14 @@ def add_aitest_options(group: OptionGroup) -> None:
             "Use a model that supports image input (e.g., gpt-4o, claude-sonnet-4)."
         ),
     )
+
+    # Copilot result cache (opt-in via PYTEST_COPILOT_CACHE=1)
+    group.addoption(
+        "--no-copilot-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Bypass the on-disk Copilot result cache enabled by PYTEST_COPILOT_CACHE=1. "
+            "Every copilot_eval/ab_run call runs against Copilot."
+        ),
+    )
@@ -238,13 +238,13 @@ def shutdown_copilot_model_client() -> None:
     """Shut down the shared CopilotClient if it was started."""
     try:
         from pytest_skill_engineering.copilot.model import (
-            _client,
+            has_copilot_model_clients,
         )
         from pytest_skill_engineering.copilot.model import (
             shutdown_copilot_model_client as _shutdown,
         )
 
-        if _client is not None:
+        if has_copilot_model_clients():
             import asyncio
 
             loop = asyncio.new_event_loop()
@@ -0,0 +1,97 @@
+"""pytest-xdist support for aitest reporting.
+
+Each xdist worker runs its tests in a separate process, so the worker's
+report collector never reaches the controller that writes the JSON/HTML/MD
+reports. Workers therefore attach a serialized copy of every aitest
+``TestReport`` to the pytest report, which xdist ships to the controller,
+where :class:`XdistReportCollector` rebuilds it into the controller's
+collector.
+
+Tests sharing a ``@pytest.mark.session`` conversation are pinned to one
+worker via :func:`group_session_tests`, so ``--dist=loadgroup`` keeps
+their order and shared state intact.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_skill_engineering.core.serialization import (
+    deserialize_test_report,
+    serialize_dataclass,
+)
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+    from _pytest.nodes import Item
+    from _pytest.reports import TestReport as PytestTestReport
+
+    from pytest_skill_engineering.reporting import TestReport
+
+# Attribute carried on pytest reports from worker to controller. xdist
+# serializes every entry of ``report.__dict__``, so a plain JSON string
+# survives the round-trip.
+XDIST_REPORT_ATTR = "_aitest_report"
+
+
+def is_xdist_worker(config: Config) -> bool:
+    """Return True when running inside a pytest-xdist worker process."""
+    return hasattr(config, "workerinput")
+
+
+def group_session_tests(items: list[Item]) -> None:
+    """Put every test of a ``@pytest.mark.session`` conversation in one xdist group.
+
+    Session tests build on the previous test's messages, so they must run
+    in order on the same worker. The group name mirrors the ``eval_run``
+    session key, including the parametrize id. Tests that already carry
+    an ``xdist_group`` mark are left alone.
+    """
+    for item in items:
+        marker = item.get_closest_marker("session")
+        if marker is None or not marker.args or item.get_closest_marker("xdist_group"):
+            continue
+        group = f"session-{marker.args[0]}"
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and callspec.id:
+            group = f"{group}[{callspec.id}]"
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+def attach_for_controller(report: PytestTestReport, test_report: TestReport) -> None:
+    """Attach a serialized aitest report so the xdist controller can collect it."""
+    data = serialize_dataclass(test_report)
+    # serialize_dataclass drops private fields; keep the copilot flag
+    data["_copilot_test"] = test_report._copilot_test
+    setattr(report, XDIST_REPORT_ATTR, json.dumps(data, default=str))
+
+
+class XdistReportCollector:
+    """Controller-side plugin that collects aitest reports from xdist workers."""
+
+    def __init__(self, tests: list[TestReport]) -> None:
+        self._tests = tests
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        payload = getattr(report, XDIST_REPORT_ATTR, None)
+        if payload is None:
+            return
+        data = json.loads(payload)
+        test_report = deserialize_test_report(data)
+        test_report._copilot_test = data.get("_copilot_test", False)
+        self._tests.append(test_report)
+
+
+def set_xdist_group(item: Item, group: str) -> None:
+    """Put ``item`` in exactly one xdist group, replacing any group it had.
+
+    pytest-xdist joins every ``xdist_group`` mark on an item into a single
+    ``a_b`` group, so adding a second mark would create a new group instead
+    of moving the item. Call this from a ``tryfirst`` collection hook;
+    xdist reads the marks in its own ``pytest_collection_modifyitems``.
+    """
+    item.own_markers[:] = [m for m in item.own_markers if m.name != "xdist_group"]
+    item.add_marker(pytest.mark.xdist_group(group))
@@ -5,8 +5,7 @@ Tests should import constants from here and create agents inline.
 
 Example:
     from tests.integration.conftest import (
-        DEFAULT_MODEL, DEFAULT_RPM, DEFAULT_TPM, DEFAULT_MAX_TURNS,
-        BENCHMARK_MODELS, BANKING_PROMPT, TODO_PROMPT,
+        DEFAULT_MAX_TURNS, BENCHMARK_MODELS, BANKING_PROMPT, TODO_PROMPT, get_provider,
     )
 
     @pytest.mark.asyncio
@@ -14,7 +13,7 @@ Example:
         agent = Eval.from_instructions(
             "banking-test",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -24,14 +23,28 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from _pytest.mark import ParameterSet
+
+    from pytest_skill_engineering import MCPServer, Provider
+
+# tests/integration/ — root of the agents/, plugins/, prompts/ and skills/ fixtures
+INTEGRATION_DIR = Path(__file__).resolve().parent
+
 # Load .env from workspace root
-_env_file = Path(__file__).parents[4] / ".env"
+_env_file = INTEGRATION_DIR.parents[3] / ".env"
 if _env_file.exists():
     from dotenv import load_dotenv
 
@@ -42,13 +55,25 @@ if _env_file.exists():
 if os.environ.get("AZURE_OPENAI_ENDPOINT") and not os.environ.get("AZURE_API_BASE"):
     os.environ["AZURE_API_BASE"] = os.environ["AZURE_OPENAI_ENDPOINT"]
 
-from pytest_skill_engineering import MCPServer, Wait
-
 # =============================================================================
 # Pytest Configuration Hooks
 # =============================================================================
 
 
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the integration tests' event loops on uvloop when it is installed.
+
+    Falls back to asyncio's default loop on Windows or without uvloop.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        import uvloop
+
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
 # =============================================================================
 # Test Configuration Constants
 # =============================================================================
@@ -56,8 +81,25 @@ from pytest_skill_engineering import MCPServer, Wait
 # Default model for most tests (cheapest Azure deployment)
 DEFAULT_MODEL = "gpt-5-mini"
 
-# Models for benchmark comparison (cheap vs capable)
-BENCHMARK_MODELS = ["gpt-5-mini", "gpt-4.1-mini"]
+# Models for benchmark comparison (cheap vs capable). AITEST_SMOKE=1 keeps
+# only the first one, for quick pre-merge runs.
+ALL_BENCHMARK_MODELS: tuple[str, ...] = ("gpt-5-mini", "gpt-4.1-mini")
+BENCHMARK_MODELS: tuple[str, ...] = (
+    ALL_BENCHMARK_MODELS[:1] if os.environ.get("AITEST_SMOKE") else ALL_BENCHMARK_MODELS
+)
+
+
+def benchmark_model_params() -> list[ParameterSet]:
+    """``BENCHMARK_MODELS`` as params pinned to one pytest-xdist group per model.
+
+    Under ``-n auto --dist=loadgroup`` each deployment's tests run on their
+    own worker: models run in parallel, while one model's calls stay in a
+    single process whose ``Provider`` enforces its rpm/tpm limits.
+    """
+    return [
+        pytest.param(m, id=m, marks=pytest.mark.xdist_group(f"model-{m}")) for m in BENCHMARK_MODELS
+    ]
+
 
 # Rate limits for Azure deployments
 DEFAULT_RPM = 10
@@ -66,6 +108,20 @@ DEFAULT_TPM = 10000
 # Default turn limits
 DEFAULT_MAX_TURNS = 5
 
+
+@functools.cache
+def get_provider(
+    deployment: str = DEFAULT_MODEL, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM
+) -> Provider:
+    """Return the shared Azure Provider for a (deployment, rpm, tpm) tuple.
+
+    Built once per session so parametrized tests reuse the same instance.
+    """
+    from pytest_skill_engineering import Provider
+
+    return Provider(model=f"azure/{deployment}", rpm=rpm, tpm=tpm)
+
+
 # =============================================================================
 # System Prompts
 # =============================================================================
@@ -84,6 +140,11 @@ Available tools:
 
 When asked about accounts, ALWAYS call the appropriate tool first, then respond based on the tool's output."""
 
+# Terse counterpart to BANKING_PROMPT for prompt-comparison tests
+CONCISE_BANKING_PROMPT = """You are a banking assistant. Be extremely brief.
+
+Use the banking tools to answer questions. Give short, direct answers."""
+
 TODO_PROMPT = """You are a task management assistant with access to a todo list system.
 
 IMPORTANT: Always use the available tools to manage tasks. The tools are the only way to create, modify, or view tasks.
@@ -105,43 +166,46 @@ KEYVALUE_PROMPT = "You are a helpful assistant. Use the tools to complete tasks.
 # =============================================================================
 
 
-@pytest.fixture(scope="module")
-def todo_server():
-    """Todo MCP server - stateful task management."""
+def make_testing_server(module: str, tools: list[str]) -> MCPServer:
+    """Build a stdio MCPServer for a built-in ``pytest_skill_engineering.testing`` module.
+
+    Args:
+        module: Module name under ``pytest_skill_engineering.testing`` (e.g. ``"banking_mcp"``).
+        tools: Tool names the server must expose before it is considered ready.
+    """
+    from pytest_skill_engineering import MCPServer, Wait
+
     return MCPServer(
-        command=[
-            sys.executable,
-            "-u",
-            "-m",
-            "pytest_skill_engineering.testing.todo_mcp",
-        ],
-        wait=Wait.for_tools(["add_task", "list_tasks", "complete_task"]),
+        command=[sys.executable, "-u", "-m", f"pytest_skill_engineering.testing.{module}"],
+        wait=Wait.for_tools(tools),
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def todo_server():
+    """Todo MCP server - stateful task management."""
+    return make_testing_server("todo_mcp", ["add_task", "list_tasks", "complete_task"])
+
+
+@pytest.fixture(scope="session")
 def banking_server():
     """Banking MCP server - realistic banking scenario.
 
+    The fixture is only the launch config; every ``eval_run`` starts its
+    own server process, so each test sees fresh account balances.
+
     Provides:
     - 2 accounts: checking ($1,500), savings ($3,000)
     - Tools: get_balance, get_all_balances, transfer, deposit, withdraw, get_transactions
     """
-    return MCPServer(
-        command=[
-            sys.executable,
-            "-u",
-            "-m",
-            "pytest_skill_engineering.testing.banking_mcp",
+    return make_testing_server(
+        "banking_mcp",
+        [
+            "get_balance",
+            "get_all_balances",
+            "transfer",
+            "deposit",
+            "withdraw",
+            "get_transactions",
         ],
-        wait=Wait.for_tools(
-            [
-                "get_balance",
-                "get_all_balances",
-                "transfer",
-                "deposit",
-                "withdraw",
-                "get_transactions",
-            ]
-        ),
     )
@@ -2,27 +2,214 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
+import mmap
 import os
 import subprocess
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from pydantic_ai import Agent as Eval
+import pytest_asyncio
 
-from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
+from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.result import CopilotResult
+from pytest_skill_engineering.plugin_xdist import is_xdist_worker
+
+if TYPE_CHECKING:
+    from _pytest.mark import ParameterSet
+
+_COPILOT_DIR = Path(__file__).resolve().parent
 
 # Default model — None means Copilot picks its default
 DEFAULT_MODEL: str | None = None
 
-# Models for parametrized tests
-MODELS: list[str] = ["gpt-5.2", "claude-sonnet-4.6"]
+# Models for parametrized tests. AITEST_SMOKE=1 keeps only the first one,
+# for quick pre-merge runs; nightly runs cover the full matrix.
+ALL_MODELS: tuple[str, ...] = ("gpt-5.2", "claude-sonnet-4.6")
+MODELS: tuple[str, ...] = ALL_MODELS[:1] if os.environ.get("AITEST_SMOKE") else ALL_MODELS
+
+
+def model_params() -> list[ParameterSet]:
+    """``MODELS`` as params pinned to one pytest-xdist group per model.
+
+    Under ``-n auto --dist=loadgroup`` each model's tests run on their own
+    worker, so models run in parallel while calls to a single model stay
+    sequential (and within its rate limit).
+    """
+    return [pytest.param(m, marks=pytest.mark.xdist_group(f"model-{m}")) for m in MODELS]
+
+
+Run = tuple[CopilotEval, CopilotResult]
+
+
+class ModelBatch:
+    """Runs one task for every selected model concurrently, on first request.
+
+    Each parametrized test then only asserts against its model's result, so
+    the class pays ``max(model latency)`` instead of the sum. A model whose
+    run raises fails only its own test. Set ``AITEST_NO_PREWARM=1`` to run
+    each model lazily from its own test; under pytest-xdist that is the
+    default, since ``--dist=loadgroup`` already gives every model its own
+    worker.
+    """
+
+    def __init__(
+        self, run_one: Callable[[str], Awaitable[Run]], models: list[str], batch: bool
+    ) -> None:
+        self._run_one = run_one
+        self._models = models
+        self._batch = batch
+        self._runs: dict[str, Run | BaseException] = {}
+
+    async def get(self, model: str) -> Run:
+        if model not in self._runs:
+            wanted = self._models if self._batch else [model]
+            pending = [m for m in wanted if m not in self._runs] or [model]
+            runs = await asyncio.gather(
+                *(self._run_one(m) for m in pending), return_exceptions=True
+            )
+            self._runs.update(zip(pending, runs, strict=True))
+        run = self._runs[model]
+        if isinstance(run, BaseException):
+            raise run
+        return run
+
+
+def model_batch(
+    request: pytest.FixtureRequest,
+    test_name: str,
+    run_one: Callable[[str], Awaitable[Run]],
+) -> ModelBatch:
+    """Batch ``run_one`` over the models selected for ``test_name`` in this session."""
+    models = sorted(
+        {
+            str(item.callspec.params["model"])
+            for item in request.session.items
+            if isinstance(item, pytest.Function)
+            and item.originalname == test_name
+            and hasattr(item, "callspec")
+        }
+    )
+    batch = not is_xdist_worker(request.config) and not os.environ.get("AITEST_NO_PREWARM")
+    return ModelBatch(run_one, models, batch)
+
+
+def file_contains(path: Path, needle: bytes) -> bool:
+    """Scan a generated file for a token without decoding it into a str.
+
+    Decode with ``read_text()`` only for the failure message.
+    """
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(needle) != -1
+
+
+# Directories an agent may create that hold no code it wrote
+_SKIPPED_DIRS = frozenset({"__pycache__", "node_modules", "site-packages"})
+
+
+def python_files(root: Path) -> list[Path]:
+    """``.py`` files the agent wrote under ``root``, in one ``os.walk`` pass.
+
+    Hidden directories (``.venv``, ``.git``, ...), ``__pycache__`` and
+    ``node_modules`` are pruned, so a virtualenv the agent installed into
+    is neither read nor mistaken for its own code.
+    """
+    found: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in _SKIPPED_DIRS]
+        found.extend(Path(dirpath, f) for f in filenames if f.endswith(".py"))
+    return found
+
 
 # Timeouts
 DEFAULT_TIMEOUT_S: float = 300.0
+JUDGE_PROBE_TIMEOUT_S: float = 30.0
 
 # Turn limits
 DEFAULT_MAX_TURNS: int = 25
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run copilot async tests on the session loop so they can share one client.
+
+    When the SDK or GitHub auth is missing, the copilot tests are skipped
+    up front instead of each failing on CLI startup.
+    """
+    copilot_items = [item for item in items if item.path.is_relative_to(_COPILOT_DIR)]
+    if not copilot_items:
+        return
+    unavailable = _copilot_unavailable()
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in copilot_items:
+        if unavailable:
+            item.add_marker(pytest.mark.skip(reason=unavailable))
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def _copilot_unavailable() -> str | None:
+    """Why Copilot tests cannot run here, or None when they can."""
+    if importlib.util.find_spec("copilot") is None:
+        return "github-copilot-sdk not installed (uv sync --extra copilot)"
+    if not _has_github_auth():
+        return "no GitHub auth (set GITHUB_TOKEN or run `gh auth login`)"
+    return None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def copilot_client() -> AsyncIterator[Any]:
+    """One Copilot CLI for the whole session (overrides the per-run default).
+
+    CLI startup and authentication are paid once; each ``copilot_eval`` /
+    ``ab_run`` call still opens its own session with its own config.
+    Async ``copilot/`` judge calls on the session loop (``llm_score.async_score``,
+    ``optimize_instruction``) run on the same CLI. Sync ``llm_assert`` and
+    ``llm_score`` calls run on the background judge loop, which starts one
+    CLI of its own.
+    """
+    from pytest_skill_engineering.copilot.model import share_copilot_model_client
+    from pytest_skill_engineering.copilot.runner import create_copilot_client
+
+    client = create_copilot_client()
+    await asyncio.wait_for(client.start(), timeout=60)
+    await share_copilot_model_client(client)
+    yield client
+    await share_copilot_model_client(None)
+    try:
+        await client.stop()
+    except Exception:  # noqa: BLE001
+        await client.force_stop()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def copilot_health(copilot_client: Any) -> None:
+    """Skip dependent tests when Copilot cannot answer a trivial prompt.
+
+    One tool-less request probes auth, model access and quota before any
+    long agentic session is spent on a test that could only fail.
+    """
+    from pytest_skill_engineering.copilot.runner import run_copilot
+
+    probe = CopilotEval(
+        name="health-probe",
+        instructions="Reply with exactly: OK",
+        allowed_tools=[],
+        timeout_s=60.0,
+        max_retries=0,
+    )
+    result = await run_copilot(probe, "Reply with exactly: OK", client=copilot_client)
+    if not result.success:
+        pytest.skip(f"Copilot health probe failed: {result.error}")
+
+
+@functools.cache
 def _has_github_auth() -> bool:
     """Check whether GitHub auth is available for Copilot-backed models."""
     if os.environ.get("GITHUB_TOKEN"):
@@ -61,6 +248,10 @@ async def integration_judge_model() -> str:
 
     Fails loudly when no configured provider can serve a minimal request.
     """
+    from pydantic_ai import Agent as Eval
+
+    from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
+
     candidates = _candidate_judge_models()
     if not candidates:
         pytest.fail(
@@ -69,17 +260,27 @@ async def integration_judge_model() -> str:
             "or GitHub auth (GITHUB_TOKEN or `gh auth login`)."
         )
 
-    errors: list[str] = []
-    for model_str in candidates:
+    async def probe(model_str: str) -> str | None:
+        """Return an error description, or None when the model answered."""
         try:
-            model = build_model_from_string(model_str)
-            agent = Eval(model)
-            result = await agent.run("Reply with exactly: OK")
-            if "OK" in result.output:
-                return model_str
-            errors.append(f"{model_str}: unexpected probe output {result.output!r}")
+            agent = Eval(build_model_from_string(model_str))
+            result = await asyncio.wait_for(
+                agent.run("Reply with exactly: OK"), timeout=JUDGE_PROBE_TIMEOUT_S
+            )
+        except TimeoutError:
+            return f"{model_str}: no reply within {JUDGE_PROBE_TIMEOUT_S:.0f}s"
         except Exception as exc:  # noqa: BLE001
-            errors.append(f"{model_str}: {exc}")
+            return f"{model_str}: {exc}"
+        if "OK" in result.output:
+            return None
+        return f"{model_str}: unexpected probe output {result.output!r}"
+
+    # Probe concurrently so one unreachable provider can't stall the others,
+    # but still pick the first working candidate in preference order.
+    errors = await asyncio.gather(*(probe(model_str) for model_str in candidates))
+    for model_str, error in zip(candidates, errors, strict=True):
+        if error is None:
+            return model_str
 
-    joined = "\n- ".join(errors)
+    joined = "\n- ".join(error for error in errors if error)
     pytest.fail(f"Model access probe failed for all configured providers:\n- {joined}")
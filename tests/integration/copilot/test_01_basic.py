@@ -10,60 +10,79 @@ Run with: pytest tests/integration/copilot/test_01_basic.py -v
 
 from __future__ import annotations
 
+import shutil
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.fixtures import run_copilot_cached, stash_on_item
 
-from .conftest import MODELS
+from .conftest import ModelBatch, Run, model_batch, model_params
 
 pytestmark = [pytest.mark.copilot]
 
-
-class TestFileOperations:
-    """Test file creation and code quality across models."""
-
-    @pytest.mark.parametrize("model", MODELS)
-    async def test_create_module_with_tests(self, copilot_eval, tmp_path, model):
-        """Eval creates a module with working code and all required functions."""
+_CREATE_TASK = (
+    "Create a Python module called calculator.py with functions add, subtract, "
+    "multiply, and divide. The divide function should raise ValueError on "
+    "division by zero. Do NOT run or test the code, just create the file."
+)
+_REFACTOR_TASK = "Read messy.py, refactor it for clarity, and save the improved version."
+_MESSY_SOURCE = (
+    "def f(x,y,z):\n"
+    "    result = x + y\n"
+    "    result = result * z\n"
+    "    if result > 100:\n"
+    "        return True\n"
+    "    else:\n"
+    "        return False\n"
+)
+
+
+@pytest.fixture(scope="class")
+def calculator_runs(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    copilot_client: Any,
+) -> ModelBatch:
+    """``create calculator.py`` results, one per model."""
+
+    async def run_one(model: str) -> Run:
         agent = CopilotEval(
             name=f"coder-{model}",
             model=model,
             instructions="You are a Python developer. Create production-quality code.",
-            working_directory=str(tmp_path),
+            working_directory=str(tmp_path_factory.mktemp(f"coder-{model}")),
         )
-        result = await copilot_eval(
-            agent,
-            "Create a Python module called calculator.py with functions add, subtract, "
-            "multiply, and divide. The divide function should raise ValueError on "
-            "division by zero. Do NOT run or test the code, just create the file.",
+        return agent, await run_copilot_cached(
+            request.config, agent, _CREATE_TASK, client=copilot_client
         )
-        assert result.success, f"{model} failed: {result.error}"
 
-        assert (tmp_path / "calculator.py").exists(), f"{model}: calculator.py missing"
+    return model_batch(request, "test_create_module_with_tests", run_one)
 
-        calc = (tmp_path / "calculator.py").read_text()
-        for fn in ("def add", "def subtract", "def multiply", "def divide"):
-            assert fn in calc, f"{model}: {fn} not found in calculator.py"
 
-        assert "ValueError" in calc or "ZeroDivisionError" in calc, (
-            f"{model}: no error handling in divide"
-        )
-        assert len(result.all_tool_calls) > 0, f"{model}: no tool calls"
+@pytest.fixture(scope="session")
+def messy_seed(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """``messy.py`` written once per session, copied into each refactor workdir."""
+    seed = tmp_path_factory.mktemp("seed") / "messy.py"
+    seed.write_text(_MESSY_SOURCE)
+    return seed
 
-    @pytest.mark.parametrize("model", MODELS)
-    async def test_refactor_existing_code(self, copilot_eval, tmp_path, model):
-        """Eval reads existing code and refactors it for clarity."""
-        messy = tmp_path / "messy.py"
-        messy.write_text(
-            "def f(x,y,z):\n"
-            "    result = x + y\n"
-            "    result = result * z\n"
-            "    if result > 100:\n"
-            "        return True\n"
-            "    else:\n"
-            "        return False\n"
-        )
 
+@pytest.fixture(scope="class")
+def refactor_runs(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    copilot_client: Any,
+    messy_seed: Path,
+) -> ModelBatch:
+    """``refactor messy.py`` results, one per model."""
+
+    async def run_one(model: str) -> Run:
+        workdir = tmp_path_factory.mktemp(f"refactorer-{model}")
+        # A copy, not a hardlink: the agent rewrites messy.py in place
+        shutil.copy2(messy_seed, workdir / "messy.py")
         agent = CopilotEval(
             name=f"refactorer-{model}",
             model=model,
@@ -71,12 +90,43 @@ class TestFileOperations:
                 "You are a code reviewer. Refactor code for clarity: "
                 "use descriptive names, simplify logic, add type hints and a docstring."
             ),
-            working_directory=str(tmp_path),
+            working_directory=str(workdir),
         )
-        result = await copilot_eval(
-            agent,
-            "Read messy.py, refactor it for clarity, and save the improved version.",
+        return agent, await run_copilot_cached(
+            request.config, agent, _REFACTOR_TASK, client=copilot_client
         )
+
+    return model_batch(request, "test_refactor_existing_code", run_one)
+
+
+class TestFileOperations:
+    """Test file creation and code quality across models."""
+
+    @pytest.mark.parametrize("model", model_params())
+    async def test_create_module_with_tests(self, calculator_runs, request, model):
+        """Eval creates a module with working code and all required functions."""
+        agent, result = await calculator_runs.get(model)
+        stash_on_item(request.node, agent, result)
+        tmp_path = Path(agent.working_directory)
+        assert result.success, f"{model} failed: {result.error}"
+
+        assert (tmp_path / "calculator.py").exists(), f"{model}: calculator.py missing"
+
+        calc = (tmp_path / "calculator.py").read_text()
+        for fn in ("def add", "def subtract", "def multiply", "def divide"):
+            assert fn in calc, f"{model}: {fn} not found in calculator.py"
+
+        assert "ValueError" in calc or "ZeroDivisionError" in calc, (
+            f"{model}: no error handling in divide"
+        )
+        assert len(result.all_tool_calls) > 0, f"{model}: no tool calls"
+
+    @pytest.mark.parametrize("model", model_params())
+    async def test_refactor_existing_code(self, refactor_runs, request, model):
+        """Eval reads existing code and refactors it for clarity."""
+        agent, result = await refactor_runs.get(model)
+        stash_on_item(request.node, agent, result)
+        messy = Path(agent.working_directory) / "messy.py"
         assert result.success, f"{model} failed: {result.error}"
 
         refactored = messy.read_text()
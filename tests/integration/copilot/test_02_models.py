@@ -1,7 +1,8 @@
 """Level 02 — Model comparison: same task across different Copilot models.
 
 Parametrizes models to compare code quality and error handling.
-Report shows model leaderboard.
+Report shows model leaderboard. Each task runs for every selected model
+concurrently; the per-model tests then assert on their model's result.
 
 Mirrors pydantic/test_02_models.py — same level, different harness.
 
@@ -10,49 +11,114 @@ Run with: pytest tests/integration/copilot/test_02_models.py -v
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.fixtures import run_copilot_cached, stash_on_item
 
-from .conftest import MODELS
+from .conftest import ModelBatch, Run, file_contains, model_batch, model_params
 
 pytestmark = [pytest.mark.copilot]
 
+_FIBONACCI_TASK = (
+    "Create fibonacci.py with a function fibonacci(n) that returns the nth Fibonacci number."
+)
+_PARSER_TASK = (
+    "Create a file parser.py that reads a JSON file and returns its contents. "
+    "Handle FileNotFoundError and json.JSONDecodeError gracefully."
+)
+_FIBONACCI_INSTRUCTIONS = "Create files as requested. Be concise."
+_PARSER_INSTRUCTIONS = "Write production-quality code with proper error handling."
 
-class TestModelComparison:
-    """Compare models on the same coding task."""
 
-    @pytest.mark.parametrize("model", MODELS)
-    async def test_simple_function(self, copilot_eval, tmp_path, model):
-        """Each model should create a working Fibonacci function."""
-        agent = CopilotEval(
+@pytest.fixture(scope="class")
+def model_agents(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[str, str, str], CopilotEval]:
+    """One agent and workspace per model; each task gets its own subdirectory.
+
+    ``agent_for(model, task, instructions)`` returns the model's agent with
+    the task's instructions, working in ``<model workspace>/<task>``, so
+    neither task sees the other's files.
+    """
+
+    @functools.cache
+    def base_agent(model: str) -> CopilotEval:
+        return CopilotEval(
             name=f"model-{model}",
             model=model,
-            instructions="Create files as requested. Be concise.",
-            working_directory=str(tmp_path),
+            working_directory=str(tmp_path_factory.mktemp(f"model-{model}")),
         )
-        result = await copilot_eval(
-            agent,
-            "Create fibonacci.py with a function fibonacci(n) that returns "
-            "the nth Fibonacci number.",
+
+    def agent_for(model: str, task: str, instructions: str) -> CopilotEval:
+        agent = base_agent(model)
+        task_dir = Path(agent.working_directory or "") / task
+        task_dir.mkdir(exist_ok=True)
+        return dataclasses.replace(
+            agent, instructions=instructions, working_directory=str(task_dir)
         )
-        assert result.success, f"Model {model} failed: {result.error}"
-        assert (tmp_path / "fibonacci.py").exists()
 
-    @pytest.mark.parametrize("model", MODELS)
-    async def test_error_handling(self, copilot_eval, tmp_path, model):
-        """Each model should produce code with proper error handling."""
-        agent = CopilotEval(
-            name=f"model-{model}",
-            model=model,
-            instructions="Write production-quality code with proper error handling.",
-            working_directory=str(tmp_path),
+    return agent_for
+
+
+@pytest.fixture(scope="class")
+def fibonacci_runs(
+    request: pytest.FixtureRequest,
+    model_agents: Callable[[str, str, str], CopilotEval],
+    copilot_client: Any,
+) -> ModelBatch:
+    """``create fibonacci.py`` results, one per model."""
+
+    async def run_one(model: str) -> Run:
+        agent = model_agents(model, "fibonacci", _FIBONACCI_INSTRUCTIONS)
+        return agent, await run_copilot_cached(
+            request.config, agent, _FIBONACCI_TASK, client=copilot_client
         )
-        result = await copilot_eval(
-            agent,
-            "Create a file parser.py that reads a JSON file and returns its contents. "
-            "Handle FileNotFoundError and json.JSONDecodeError gracefully.",
+
+    return model_batch(request, "test_simple_function", run_one)
+
+
+@pytest.fixture(scope="class")
+def parser_runs(
+    request: pytest.FixtureRequest,
+    model_agents: Callable[[str, str, str], CopilotEval],
+    copilot_client: Any,
+) -> ModelBatch:
+    """``create parser.py`` results, one per model."""
+
+    async def run_one(model: str) -> Run:
+        agent = model_agents(model, "parser", _PARSER_INSTRUCTIONS)
+        return agent, await run_copilot_cached(
+            request.config, agent, _PARSER_TASK, client=copilot_client
         )
+
+    return model_batch(request, "test_error_handling", run_one)
+
+
+class TestModelComparison:
+    """Compare models on the same coding task."""
+
+    @pytest.mark.parametrize("model", model_params())
+    async def test_simple_function(self, fibonacci_runs, request, model):
+        """Each model should create a working Fibonacci function."""
+        agent, result = await fibonacci_runs.get(model)
+        stash_on_item(request.node, agent, result)
+        assert result.success, f"Model {model} failed: {result.error}"
+        assert (Path(agent.working_directory) / "fibonacci.py").exists()
+
+    @pytest.mark.parametrize("model", model_params())
+    async def test_error_handling(self, parser_runs, request, model):
+        """Each model should produce code with proper error handling."""
+        agent, result = await parser_runs.get(model)
+        stash_on_item(request.node, agent, result)
         assert result.success
-        content = (tmp_path / "parser.py").read_text()
-        assert "FileNotFoundError" in content or "except" in content
+        parser = Path(agent.working_directory) / "parser.py"
+        assert file_contains(parser, b"FileNotFoundError") or file_contains(parser, b"except"), (
+            f"No error handling in parser.py:\n{parser.read_text()}"
+        )
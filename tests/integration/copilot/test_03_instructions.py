@@ -15,55 +15,67 @@ import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from .conftest import python_files
+
 pytestmark = [pytest.mark.copilot]
 
 
+@pytest.mark.usefixtures("copilot_health")
 class TestInstructionsDifferentiate:
-    """Different instructions produce measurably different outputs."""
+    """Different instructions produce measurably different outputs.
 
-    async def test_verbose_instructions_produce_documented_code(self, copilot_eval, tmp_path):
-        """Instructions requiring docstrings produce documented code."""
-        agent = CopilotEval(
-            name="documented-coder",
-            instructions=(
+    Each test is a full coding session graded only by its output file, so
+    the class is skipped up front when Copilot is unreachable.
+    """
+
+    @pytest.mark.parametrize(
+        "name,instructions,must_contain,must_not_contain",
+        [
+            pytest.param(
+                "documented-coder",
                 "You write fully documented Python. EVERY function MUST have:\n"
                 '- A docstring: """What this function does."""\n'
                 "- Type hints on all parameters and the return value.\n"
-                "No exceptions to these rules."
+                "No exceptions to these rules.",
+                ('"""', "->"),
+                (),
+                id="verbose",
             ),
-            working_directory=str(tmp_path),
-        )
-        result = await copilot_eval(
-            agent,
-            "Create calculator.py with add(a, b), subtract(a, b), multiply(a, b), divide(a, b).",
-        )
-        assert result.success
-        content = (tmp_path / "calculator.py").read_text()
-        assert '"""' in content or "'''" in content, (
-            "Verbose instructions required docstrings — none found."
-        )
-        assert "->" in content, "Verbose instructions required return type hints — none found."
-
-    async def test_concise_instructions_suppress_documentation(self, copilot_eval, tmp_path):
-        """Instructions forbidding documentation produce minimal code."""
-        agent = CopilotEval(
-            name="minimal-coder",
-            instructions=(
+            pytest.param(
+                "minimal-coder",
                 "Write minimal Python code only. "
                 "NO docstrings whatsoever. NO type hints. NO comments of any kind. "
-                "Pure function definitions and logic only. Violating this is an error."
+                "Pure function definitions and logic only. Violating this is an error.",
+                (),
+                ('"""',),
+                id="concise",
             ),
-            working_directory=str(tmp_path),
-        )
+        ],
+    )
+    async def test_instruction_style_shapes_documentation(
+        self,
+        copilot_eval,
+        tmp_path,
+        name: str,
+        instructions: str,
+        must_contain: tuple[str, ...],
+        must_not_contain: tuple[str, ...],
+    ):
+        """The same calculator prompt is documented or bare depending on instructions."""
+        agent = CopilotEval(name=name, instructions=instructions, working_directory=str(tmp_path))
         result = await copilot_eval(
             agent,
             "Create calculator.py with add(a, b), subtract(a, b), multiply(a, b), divide(a, b).",
         )
         assert result.success
-        content = (tmp_path / "calculator.py").read_text()
-        assert '"""' not in content and "'''" not in content, (
-            "Concise instructions forbade docstrings — but they appeared."
-        )
+        # Either docstring quote style counts as a docstring
+        content = (tmp_path / "calculator.py").read_text().replace("'''", '"""')
+        for needle in must_contain:
+            assert needle in content, f"{name} instructions required {needle!r} — not found."
+        for needle in must_not_contain:
+            assert needle not in content, (
+                f"{name} instructions forbade {needle!r} — but it appeared."
+            )
 
     async def test_framework_instruction_steers_library_choice(self, copilot_eval, tmp_path):
         """Instructions specifying FastAPI result in FastAPI being used."""
@@ -80,7 +92,7 @@ class TestInstructionsDifferentiate:
             'Create a web API with a GET /health endpoint that returns {"status": "ok"}.',
         )
         assert result.success
-        py_files = list(tmp_path.rglob("*.py"))
+        py_files = python_files(tmp_path)
         assert len(py_files) > 0, "No Python files created"
         all_code = "\n".join(f.read_text() for f in py_files)
         assert "fastapi" in all_code.lower(), (
@@ -10,159 +10,167 @@ Run with: pytest tests/integration/copilot/test_05_skills.py -v
 
 from __future__ import annotations
 
+import filecmp
+from pathlib import Path
+
 import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from .conftest import file_contains
+
 pytestmark = [pytest.mark.copilot]
 
 
+_VERSIONING_SKILL = (
+    "# Module Versioning Standards\n\n"
+    "Every Python module MUST declare its version at the top of the file:\n\n"
+    '    __version__ = "1.0.0"\n\n'
+    "Place this immediately after imports. "
+    "Modules without __version__ are considered unversioned and will "
+    "fail release checks.\n"
+)
+_MODULE_EXPORTS_SKILL = (
+    "# Module Export Standards\n\n"
+    "Every Python module MUST declare its public API using __all__.\n\n"
+    "Place this at the top of every module (after imports):\n"
+    '    __all__ = ["FunctionName", "ClassName"]\n\n'
+    "Modules without __all__ are considered incomplete and will fail review.\n"
+)
+_DOCSTRING_SKILL = (
+    "# Docstring Standards — Google Style\n\n"
+    "Every function MUST have a Google-style docstring with these sections:\n\n"
+    "    def example(x: int) -> str:\n"
+    '        """One-line summary.\n\n'
+    "        Args:\n"
+    "            x: Description of x.\n\n"
+    "        Returns:\n"
+    "            Description of return value.\n"
+    '        """\n\n'
+    "Docstrings without Args: and Returns: sections are non-compliant.\n"
+)
+
+
+def _skill_dir(tmp_path_factory: pytest.TempPathFactory, filename: str, content: str) -> Path:
+    """A skills directory holding a single skill file, written once per session."""
+    skill_dir = tmp_path_factory.mktemp("skills")
+    (skill_dir / filename).write_text(content)
+    return skill_dir
+
+
+@pytest.fixture(scope="session")
+def versioning_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skill mandating a ``__version__`` declaration."""
+    return _skill_dir(tmp_path_factory, "versioning.md", _VERSIONING_SKILL)
+
+
+@pytest.fixture(scope="session")
+def module_exports_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skill mandating an ``__all__`` declaration."""
+    return _skill_dir(tmp_path_factory, "module-exports.md", _MODULE_EXPORTS_SKILL)
+
+
+@pytest.fixture(scope="session")
+def docstring_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skill mandating Google-style docstrings."""
+    return _skill_dir(tmp_path_factory, "docstring-format.md", _DOCSTRING_SKILL)
+
+
 class TestSkillABComparison:
     """Same task, two configs — skill produces measurably different output."""
 
-    async def test_version_declaration_skill_adds_dunder_version(self, copilot_eval, tmp_path):
+    async def test_version_declaration_skill_adds_dunder_version(
+        self, ab_run, versioning_skill_dir
+    ):
         """Skill mandating __version__ produces a module version declaration."""
-        skill_dir = tmp_path / "skills"
-        skill_dir.mkdir()
-        (skill_dir / "versioning.md").write_text(
-            "# Module Versioning Standards\n\n"
-            "Every Python module MUST declare its version at the top of the file:\n\n"
-            '    __version__ = "1.0.0"\n\n'
-            "Place this immediately after imports. "
-            "Modules without __version__ are considered unversioned and will "
-            "fail release checks.\n"
-        )
-
         task = "Create math_ops.py with functions: add(a, b), subtract(a, b)."
 
-        baseline_dir = tmp_path / "baseline"
-        baseline_dir.mkdir()
         baseline = CopilotEval(
             name="baseline",
             instructions="Write a Python module.",
-            working_directory=str(baseline_dir),
         )
 
-        treatment_dir = tmp_path / "treatment"
-        treatment_dir.mkdir()
         treatment = CopilotEval(
             name="treatment",
             instructions="Write a Python module. Apply all versioning standards from your skills.",
-            working_directory=str(treatment_dir),
-            skill_directories=[str(skill_dir)],
+            skill_directories=[str(versioning_skill_dir)],
         )
 
-        result_a = await copilot_eval(baseline, task)
-        result_b = await copilot_eval(treatment, task)
+        result_a, result_b = await ab_run(baseline, treatment, task)
 
         assert result_a.success and result_b.success
 
-        content_a = (baseline_dir / "math_ops.py").read_text()
-        content_b = (treatment_dir / "math_ops.py").read_text()
+        file_a = result_a.working_directory / "math_ops.py"
+        file_b = result_b.working_directory / "math_ops.py"
 
-        assert "__version__" in content_b, (
+        assert file_contains(file_b, b"__version__"), (
             "Versioning skill should have added __version__ — not found in treatment.\n"
-            f"Treatment output:\n{content_b}"
+            f"Treatment output:\n{file_b.read_text()}"
         )
-        assert "__version__" not in content_a, (
-            f"Baseline (no skill) unexpectedly contains __version__.\nBaseline output:\n{content_a}"
+        assert not file_contains(file_a, b"__version__"), (
+            "Baseline (no skill) unexpectedly contains __version__.\n"
+            f"Baseline output:\n{file_a.read_text()}"
         )
 
-    async def test_module_exports_skill_adds_all_declaration(self, copilot_eval, tmp_path):
+    async def test_module_exports_skill_adds_all_declaration(
+        self, ab_run, module_exports_skill_dir
+    ):
         """Skill mandating __all__ exports produces explicit public API declarations."""
-        skill_dir = tmp_path / "skills"
-        skill_dir.mkdir()
-        (skill_dir / "module-exports.md").write_text(
-            "# Module Export Standards\n\n"
-            "Every Python module MUST declare its public API using __all__.\n\n"
-            "Place this at the top of every module (after imports):\n"
-            '    __all__ = ["FunctionName", "ClassName"]\n\n'
-            "Modules without __all__ are considered incomplete and will fail review.\n"
-        )
-
         task = "Create math_utils.py with functions: add(a, b), subtract(a, b), multiply(a, b)."
 
-        baseline_dir = tmp_path / "baseline"
-        baseline_dir.mkdir()
         baseline = CopilotEval(
             name="baseline",
             instructions="Write a Python module.",
-            working_directory=str(baseline_dir),
         )
 
-        treatment_dir = tmp_path / "treatment"
-        treatment_dir.mkdir()
         treatment = CopilotEval(
             name="treatment",
             instructions="Write a Python module. Apply all module export standards from your skills.",
-            working_directory=str(treatment_dir),
-            skill_directories=[str(skill_dir)],
+            skill_directories=[str(module_exports_skill_dir)],
         )
 
-        result_a = await copilot_eval(baseline, task)
-        result_b = await copilot_eval(treatment, task)
+        result_a, result_b = await ab_run(baseline, treatment, task)
 
         assert result_a.success and result_b.success
 
-        content_a = (baseline_dir / "math_utils.py").read_text()
-        content_b = (treatment_dir / "math_utils.py").read_text()
+        file_a = result_a.working_directory / "math_utils.py"
+        file_b = result_b.working_directory / "math_utils.py"
 
-        assert "__all__" in content_b, (
+        assert file_contains(file_b, b"__all__"), (
             "Module exports skill should have added __all__ — not found in treatment.\n"
-            f"Treatment output:\n{content_b}"
+            f"Treatment output:\n{file_b.read_text()}"
         )
-        assert "__all__" not in content_a, (
-            f"Baseline (no skill) unexpectedly contains __all__.\nBaseline output:\n{content_a}"
+        assert not file_contains(file_a, b"__all__"), (
+            "Baseline (no skill) unexpectedly contains __all__.\n"
+            f"Baseline output:\n{file_a.read_text()}"
         )
 
-    async def test_docstring_format_skill_produces_google_style(self, copilot_eval, tmp_path):
+    async def test_docstring_format_skill_produces_google_style(self, ab_run, docstring_skill_dir):
         """Skill mandating Google-style docstrings produces Args:/Returns: sections."""
-        skill_dir = tmp_path / "skills"
-        skill_dir.mkdir()
-        (skill_dir / "docstring-format.md").write_text(
-            "# Docstring Standards — Google Style\n\n"
-            "Every function MUST have a Google-style docstring with these sections:\n\n"
-            "    def example(x: int) -> str:\n"
-            '        """One-line summary.\n\n'
-            "        Args:\n"
-            "            x: Description of x.\n\n"
-            "        Returns:\n"
-            "            Description of return value.\n"
-            '        """\n\n'
-            "Docstrings without Args: and Returns: sections are non-compliant.\n"
-        )
-
         task = "Create converter.py with functions: to_celsius(f), to_fahrenheit(c), to_kelvin(c)."
 
-        baseline_dir = tmp_path / "baseline"
-        baseline_dir.mkdir()
         baseline = CopilotEval(
             name="baseline",
             instructions="Write a Python module with minimal documentation.",
-            working_directory=str(baseline_dir),
         )
 
-        treatment_dir = tmp_path / "treatment"
-        treatment_dir.mkdir()
         treatment = CopilotEval(
             name="treatment",
             instructions="Write a Python module. Apply all docstring standards from your skills.",
-            working_directory=str(treatment_dir),
-            skill_directories=[str(skill_dir)],
+            skill_directories=[str(docstring_skill_dir)],
         )
 
-        result_a = await copilot_eval(baseline, task)
-        result_b = await copilot_eval(treatment, task)
+        result_a, result_b = await ab_run(baseline, treatment, task)
 
         assert result_a.success and result_b.success
 
-        content_a = (baseline_dir / "converter.py").read_text()
-        content_b = (treatment_dir / "converter.py").read_text()
+        file_a = result_a.working_directory / "converter.py"
+        file_b = result_b.working_directory / "converter.py"
 
-        assert "Args:" in content_b and "Returns:" in content_b, (
+        assert file_contains(file_b, b"Args:") and file_contains(file_b, b"Returns:"), (
             "Google docstring skill should have added Args:/Returns: — not found.\n"
-            f"Treatment output:\n{content_b}"
+            f"Treatment output:\n{file_b.read_text()}"
         )
-        assert content_a != content_b, (
+        assert not filecmp.cmp(file_a, file_b, shallow=False), (
             "Skill had no effect — both configs produced identical output."
         )
@@ -16,6 +16,8 @@ import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from .conftest import python_files
+
 pytestmark = [pytest.mark.copilot]
 
 CLARIFICATION_PHRASES = [
@@ -103,7 +105,7 @@ class TestClarificationDetection:
         )
         assert result.success, f"Agent failed: {result.error}"
 
-        created_files = list(tmp_path.rglob("*.py"))
+        created_files = python_files(tmp_path)
         response = result.final_response or ""
 
         acted = len(created_files) > 0
@@ -141,7 +143,7 @@ class TestClarificationDetection:
             "Agent asked for clarification despite instructions forbidding it.\n"
             f"Response: {response}"
         )
-        created_files = list(tmp_path.rglob("*.py"))
+        created_files = python_files(tmp_path)
         assert len(created_files) > 0, (
             f"Agent with 'never ask' instructions produced no files.\nResponse: {response}"
         )
@@ -65,7 +65,7 @@ class TestPromptScoring:
         )
         assert result.success, f"Verbose run failed: {result.error}"
 
-        score = llm_score(result.final_response, PROMPT_QUALITY_RUBRIC)
+        score = await llm_score.async_score(result.final_response, PROMPT_QUALITY_RUBRIC)
         assert_score(score, min_pct=0.4)
 
     async def test_direct_instructions_score(self, copilot_eval, tmp_path, llm_score):
@@ -85,7 +85,7 @@ class TestPromptScoring:
         )
         assert result.success, f"Direct run failed: {result.error}"
 
-        score = llm_score(result.final_response, PROMPT_QUALITY_RUBRIC)
+        score = await llm_score.async_score(result.final_response, PROMPT_QUALITY_RUBRIC)
         assert_score(score, min_pct=0.4)
 
     async def test_production_instructions_score(self, copilot_eval, tmp_path, llm_score):
@@ -107,5 +107,5 @@ class TestPromptScoring:
         )
         assert result.success, f"Production run failed: {result.error}"
 
-        score = llm_score(result.final_response, PROMPT_QUALITY_RUBRIC)
+        score = await llm_score.async_score(result.final_response, PROMPT_QUALITY_RUBRIC)
         assert_score(score, min_pct=0.5)
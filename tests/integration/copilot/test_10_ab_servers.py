@@ -16,6 +16,8 @@ import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from .conftest import python_files
+
 pytestmark = [pytest.mark.copilot]
 
 INSTRUCTIONS = {
@@ -35,12 +37,10 @@ class TestInstructionABComparison:
     @pytest.mark.parametrize("variant", ["detailed", "minimal"])
     async def test_code_creation_quality(self, copilot_eval, tmp_path, variant):
         """Compare file creation quality between detailed and minimal instructions."""
-        work_dir = tmp_path / variant
-        work_dir.mkdir()
         agent = CopilotEval(
             name=f"coder-{variant}",
             instructions=INSTRUCTIONS[variant],
-            working_directory=str(work_dir),
+            working_directory=str(tmp_path),
         )
         result = await copilot_eval(
             agent,
@@ -49,7 +49,7 @@ class TestInstructionABComparison:
         )
         assert result.success, f"{variant} failed: {result.error}"
 
-        py_files = list(work_dir.rglob("*.py"))
+        py_files = python_files(tmp_path)
         assert len(py_files) > 0, f"{variant}: no Python files created"
 
         content = "\n".join(f.read_text() for f in py_files)
@@ -59,12 +59,10 @@ class TestInstructionABComparison:
     @pytest.mark.parametrize("variant", ["detailed", "minimal"])
     async def test_error_handling_presence(self, copilot_eval, tmp_path, variant):
         """Compare error handling quality between instruction variants."""
-        work_dir = tmp_path / variant
-        work_dir.mkdir()
         agent = CopilotEval(
             name=f"error-handling-{variant}",
             instructions=INSTRUCTIONS[variant],
-            working_directory=str(work_dir),
+            working_directory=str(tmp_path),
         )
         result = await copilot_eval(
             agent,
@@ -74,7 +72,7 @@ class TestInstructionABComparison:
         )
         assert result.success, f"{variant} failed: {result.error}"
 
-        py_files = list(work_dir.rglob("*.py"))
+        py_files = python_files(tmp_path)
         assert len(py_files) > 0, f"{variant}: no Python files created"
 
         content = "\n".join(f.read_text() for f in py_files)
@@ -88,12 +86,10 @@ class TestDocumentationQualityImpact:
     @pytest.mark.parametrize("variant", ["detailed", "minimal"])
     async def test_documentation_presence(self, copilot_eval, tmp_path, variant):
         """Detailed instructions should produce more documented code."""
-        work_dir = tmp_path / variant
-        work_dir.mkdir()
         agent = CopilotEval(
             name=f"docs-{variant}",
             instructions=INSTRUCTIONS[variant],
-            working_directory=str(work_dir),
+            working_directory=str(tmp_path),
         )
         result = await copilot_eval(
             agent,
@@ -102,7 +98,7 @@ class TestDocumentationQualityImpact:
         )
         assert result.success, f"{variant} failed: {result.error}"
 
-        py_files = list(work_dir.rglob("*.py"))
+        py_files = python_files(tmp_path)
         assert len(py_files) > 0, f"{variant}: no Python files created"
 
         content = "\n".join(f.read_text() for f in py_files)
@@ -15,6 +15,8 @@ import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from .conftest import python_files
+
 pytestmark = [pytest.mark.copilot]
 
 
@@ -93,7 +95,7 @@ class TestIterationBaseline:
         )
         assert result.success, f"Multi-file creation failed: {result.error}"
 
-        py_files = list(tmp_path.rglob("*.py"))
+        py_files = python_files(tmp_path)
         assert len(py_files) >= 2, (
             f"Expected at least 2 Python files, got {len(py_files)}: {[f.name for f in py_files]}"
         )
@@ -10,9 +10,15 @@ Run with: pytest tests/integration/copilot/test_12_custom_agents.py -v
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
 import pytest
+import pytest_asyncio
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.result import CopilotResult
+from pytest_skill_engineering.copilot.runner import run_copilot
 
 pytestmark = [pytest.mark.copilot]
 
@@ -27,115 +33,147 @@ _WRITE_TOOLS = [
     "create_directory",
 ]
 
+# Shared orchestrator preamble: identical leading tokens across the forced
+# dispatch tests so the provider can prefix-cache them.
+_ORCH_PREAMBLE = (
+    "You are an orchestrator. Delegate all file creation to the file-writer agent via runSubagent."
+)
+
+# Module the test-writer agent writes tests for (proj_calc/). Seeded rather than generated:
+# producing it is test_01_basic's job, not this file's.
+_CALCULATOR_SOURCE = (
+    "def add(a: float, b: float) -> float:\n"
+    "    return a + b\n\n\n"
+    "def subtract(a: float, b: float) -> float:\n"
+    "    return a - b\n\n\n"
+    "def multiply(a: float, b: float) -> float:\n"
+    "    return a * b\n\n\n"
+    "def divide(a: float, b: float) -> float:\n"
+    "    if b == 0:\n"
+    '        raise ValueError("division by zero")\n'
+    "    return a / b\n"
+)
+
+# Every status SubagentInvocation may report.
+_VALID_STATUSES = frozenset({"selected", "started", "completed", "failed"})
+
+# Custom agents for the outcome tests.
+_TEST_WRITER = {
+    "name": "test-writer",
+    "prompt": "Write pytest tests (happy path and edge cases) to a test_*.py file.",
+    "description": "Writes pytest unit tests for Python code.",
+}
+
+_DOCS_WRITER = {
+    "name": "docs-writer",
+    "prompt": "Write a concise README.md: description, installation, usage example.",
+    "description": "Writes README.md project documentation.",
+    "tools": ["create_file", "read_file", "insert_edit_into_file"],
+}
+
+_CODE_REVIEWER = {
+    "name": "code-reviewer",
+    "prompt": "Review Python code for correctness, style, and edge cases.",
+    "description": "Reviews Python code quality and correctness.",
+}
+
+# Shared file-writer subagent for the forced dispatch tests.
+_FILE_WRITER = {
+    "name": "file-writer",
+    "prompt": "Write the requested Python files to disk.",
+    "description": "Creates Python source files on disk.",
+}
+
+
+def _forced_orchestrator(
+    name: str, workdir: Path, instructions: str = _ORCH_PREAMBLE
+) -> CopilotEval:
+    """Orchestrator that cannot write files and must dispatch to file-writer."""
+    return CopilotEval(
+        name=name,
+        instructions=instructions,
+        working_directory=str(workdir),
+        timeout_s=300.0,
+        max_turns=20,
+        excluded_tools=_WRITE_TOOLS,
+        custom_agents=[_FILE_WRITER],
+    )
+
 
 # =============================================================================
 # Custom Agent Outcomes
 # =============================================================================
 
 
+_MULTIPROJECT_TASK = (
+    "Work on three independent projects, each in its own folder:\n"
+    "1. proj_calc/: calculator.py already exists. Have tests written for it.\n"
+    "2. proj_greet/: create greeting.py with a greet(name: str) -> str function that "
+    "returns 'Hello, {name}!', then have documentation written for the project.\n"
+    "3. proj_sort/: create sort.py with bubble_sort(arr) and quick_sort(arr) functions, "
+    "then have the code-reviewer check the implementation."
+)
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def multiproject_result(
+    tmp_path_factory: pytest.TempPathFactory, copilot_client: Any
+) -> CopilotResult:
+    """One session exercising all three outcome agents, one project folder each."""
+    workdir = tmp_path_factory.mktemp("custom-agents")
+    (workdir / "proj_calc").mkdir()
+    (workdir / "proj_calc" / "calculator.py").write_text(_CALCULATOR_SOURCE)
+    agent = CopilotEval(
+        name="with-custom-agents",
+        instructions=(
+            "Delegate all test writing to the test-writer agent. "
+            "Create code yourself, then delegate README writing to the docs-writer agent. "
+            "After creating code, have the code-reviewer agent check it."
+        ),
+        working_directory=str(workdir),
+        # A looping orchestrator trips max_turns well before the timeout
+        timeout_s=300.0,
+        max_turns=40,
+        custom_agents=[_TEST_WRITER, _DOCS_WRITER, _CODE_REVIEWER],
+    )
+    return await run_copilot(agent, _MULTIPROJECT_TASK, client=copilot_client)
+
+
 class TestCustomAgentOutcomes:
-    """Custom agents produce their expected file-based outcomes."""
-
-    async def test_test_writer_agent_creates_test_file(self, copilot_eval, tmp_path):
-        """Custom test-writer agent produces a pytest test file alongside code."""
-        agent = CopilotEval(
-            name="with-test-writer",
-            instructions=(
-                "You are a senior developer. When you create code, "
-                "always delegate test writing to the test-writer agent."
-            ),
-            working_directory=str(tmp_path),
-            timeout_s=600.0,
-            custom_agents=[
-                {
-                    "name": "test-writer",
-                    "prompt": (
-                        "You are a test specialist. Write pytest unit tests "
-                        "for the given code. Include happy path and edge cases. "
-                        "Save tests to a test_*.py file."
-                    ),
-                    "description": "Writes pytest unit tests for Python code.",
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Create calculator.py with add, subtract, multiply, and divide functions "
-            "(divide raises ValueError on division by zero). Then have tests written for it.",
-        )
-        assert result.success, f"Failed: {result.error}"
-        assert list(tmp_path.rglob("calculator.py")), "calculator.py was not created"
-        test_files = list(tmp_path.rglob("test_*.py"))
-        assert len(test_files) > 0, (
+    """Custom agents produce their expected file-based outcomes.
+
+    The three agents share one run (``multiproject_result``); each test
+    checks its own project folder.
+    """
+
+    async def test_test_writer_agent_creates_test_file(self, multiproject_result):
+        """Custom test-writer agent produces a pytest test file for existing code."""
+        assert multiproject_result.success, f"Failed: {multiproject_result.error}"
+        project = Path(multiproject_result.agent.working_directory) / "proj_calc"
+        # Test file name is up to the agent; stop at the first match
+        assert next(project.rglob("test_*.py"), None) is not None, (
             "No test_*.py file created — test-writer custom agent may not have been invoked"
         )
 
-    async def test_docs_writer_agent_creates_readme(self, copilot_eval, tmp_path):
+    async def test_docs_writer_agent_creates_readme(self, multiproject_result):
         """Custom docs-writer agent produces a README.md for the project."""
-        agent = CopilotEval(
-            name="with-docs-writer",
-            instructions=(
-                "You are a project lead. Create the requested code, then "
-                "delegate README documentation to the docs-writer agent."
-            ),
-            working_directory=str(tmp_path),
-            custom_agents=[
-                {
-                    "name": "docs-writer",
-                    "prompt": (
-                        "You write README.md documentation for Python projects. "
-                        "Create a clear, concise README with a description, "
-                        "installation instructions, and a usage example."
-                    ),
-                    "description": "Writes README.md project documentation.",
-                    "tools": ["create_file", "read_file", "insert_edit_into_file"],
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Create greeting.py with a greet(name: str) -> str function that returns "
-            "'Hello, {name}!', then have documentation written for the project.",
-        )
-        assert result.success, f"Failed: {result.error}"
-        assert (tmp_path / "greeting.py").exists(), "greeting.py was not created"
-        assert (tmp_path / "README.md").exists(), (
+        assert multiproject_result.success, f"Failed: {multiproject_result.error}"
+        project = Path(multiproject_result.agent.working_directory) / "proj_greet"
+        assert (project / "greeting.py").exists(), "greeting.py was not created"
+        assert (project / "README.md").exists(), (
             "README.md was not created — docs-writer agent may not have been invoked"
         )
 
-    async def test_subagent_lifecycle_captured_when_invoked(self, copilot_eval, tmp_path):
+    async def test_subagent_lifecycle_captured_when_invoked(self, multiproject_result):
         """When a custom agent is invoked, lifecycle events are captured correctly."""
-        agent = CopilotEval(
-            name="with-code-reviewer",
-            instructions=(
-                "You manage a development team. After creating code, "
-                "always ask the code-reviewer to check it before finishing."
-            ),
-            working_directory=str(tmp_path),
-            custom_agents=[
-                {
-                    "name": "code-reviewer",
-                    "prompt": (
-                        "You review Python code for correctness, style, and edge cases. "
-                        "Report any issues found."
-                    ),
-                    "description": "Reviews Python code quality and correctness.",
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Create sort.py with bubble_sort(arr) and quick_sort(arr) functions, "
-            "then have the code-reviewer check the implementation.",
-        )
-        assert result.success, f"Failed: {result.error}"
-        assert list(tmp_path.rglob("sort.py")), "sort.py was not created"
+        assert multiproject_result.success, f"Failed: {multiproject_result.error}"
+        project = Path(multiproject_result.agent.working_directory) / "proj_sort"
+        assert (project / "sort.py").exists(), "sort.py was not created"
 
-        for invocation in result.subagent_invocations:
-            assert invocation.name, "SubagentInvocation.name must not be empty"
-            assert invocation.status in ("selected", "started", "completed", "failed"), (
-                f"Unexpected SubagentInvocation.status: {invocation.status!r}"
-            )
+        invocations = multiproject_result.subagent_invocations
+        assert all(inv.name for inv in invocations), "SubagentInvocation.name must not be empty"
+        bad = {inv.status for inv in invocations} - _VALID_STATUSES
+        assert not bad, f"Unexpected SubagentInvocation.status values: {sorted(bad)}"
 
 
 # =============================================================================
@@ -143,101 +181,53 @@ class TestCustomAgentOutcomes:
 # =============================================================================
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def forced_dispatch_result(
+    tmp_path_factory: pytest.TempPathFactory, copilot_client: Any
+) -> CopilotResult:
+    """One forced-delegation run, read by every dispatch test below."""
+    agent = _forced_orchestrator(
+        "forced-orchestrator",
+        tmp_path_factory.mktemp("forced-dispatch"),
+        f"{_ORCH_PREAMBLE} Never create files yourself.",
+    )
+    return await run_copilot(
+        agent,
+        "Use the file-writer agent to create output.py containing: x = 42",
+        client=copilot_client,
+    )
+
+
 class TestForcedSubagentDispatch:
-    """When write tools are excluded, the orchestrator must delegate to a subagent."""
+    """When write tools are excluded, the orchestrator must delegate to a subagent.
+
+    The three checks share one run (``forced_dispatch_result``).
+    """
 
-    async def test_subagent_invocations_non_empty(self, copilot_eval, tmp_path):
+    async def test_subagent_invocations_non_empty(self, forced_dispatch_result):
         """Orchestrator with excluded write tools dispatches to a subagent."""
-        agent = CopilotEval(
-            name="forced-orchestrator",
-            instructions=(
-                "You are an orchestrator. You MUST delegate all file creation "
-                "to the file-writer agent via runSubagent. "
-                "Do not attempt to create files yourself."
-            ),
-            working_directory=str(tmp_path),
-            timeout_s=300.0,
-            max_turns=20,
-            excluded_tools=_WRITE_TOOLS,
-            custom_agents=[
-                {
-                    "name": "file-writer",
-                    "prompt": (
-                        "You create Python files. When asked to create a file, "
-                        "write it to disk using your file creation tools."
-                    ),
-                    "description": "Creates Python source files on disk.",
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Use the file-writer agent to create hello.py containing: print('hello world')",
-        )
+        result = forced_dispatch_result
         assert result.success, f"Run failed: {result.error}"
         assert result.subagent_invocations, (
             "No subagent invocations recorded — orchestrator may have attempted "
             "to implement directly despite excluded write tools"
         )
 
-    async def test_subagent_file_created(self, copilot_eval, tmp_path):
+    async def test_subagent_file_created(self, forced_dispatch_result):
         """File created by subagent exists in the workspace."""
-        agent = CopilotEval(
-            name="forced-orchestrator-file",
-            instructions=(
-                "You are an orchestrator. Delegate all file creation to the "
-                "file-writer agent via runSubagent."
-            ),
-            working_directory=str(tmp_path),
-            timeout_s=300.0,
-            max_turns=20,
-            excluded_tools=_WRITE_TOOLS,
-            custom_agents=[
-                {
-                    "name": "file-writer",
-                    "prompt": "You create Python files. Write requested files to disk.",
-                    "description": "Creates Python source files on disk.",
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Use the file-writer agent to create output.py containing: x = 42",
-        )
+        result = forced_dispatch_result
         assert result.success, f"Run failed: {result.error}"
-        assert (tmp_path / "output.py").exists(), (
+        assert (Path(result.agent.working_directory) / "output.py").exists(), (
             "output.py not created — subagent did not write the file"
         )
 
-    async def test_subagent_invocation_fields(self, copilot_eval, tmp_path):
+    async def test_subagent_invocation_fields(self, forced_dispatch_result):
         """SubagentInvocation objects have valid name and status fields."""
-        agent = CopilotEval(
-            name="forced-orchestrator-fields",
-            instructions=(
-                "You are an orchestrator. Delegate file creation to the "
-                "file-writer agent via runSubagent."
-            ),
-            working_directory=str(tmp_path),
-            timeout_s=300.0,
-            max_turns=20,
-            excluded_tools=_WRITE_TOOLS,
-            custom_agents=[
-                {
-                    "name": "file-writer",
-                    "prompt": "You create Python files on disk.",
-                    "description": "Creates Python source files.",
-                }
-            ],
-        )
-        result = await copilot_eval(
-            agent,
-            "Use the file-writer agent to create result.py containing: done = True",
-        )
+        result = forced_dispatch_result
         assert result.success, f"Run failed: {result.error}"
         assert result.subagent_invocations, "No subagent invocations recorded"
 
-        for inv in result.subagent_invocations:
-            assert inv.name, "SubagentInvocation.name must not be empty"
-            assert inv.status in ("selected", "started", "completed", "failed"), (
-                f"Unexpected SubagentInvocation.status: {inv.status!r}"
-            )
+        invocations = result.subagent_invocations
+        assert all(inv.name for inv in invocations), "SubagentInvocation.name must not be empty"
+        bad = {inv.status for inv in invocations} - _VALID_STATUSES
+        assert not bad, f"Unexpected SubagentInvocation.status values: {sorted(bad)}"
@@ -11,18 +11,17 @@ Run with: pytest tests/integration/copilot/test_13_plugins.py -v
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
 from pytest_skill_engineering.copilot.eval import CopilotEval
 
+from ..conftest import INTEGRATION_DIR
 from .conftest import DEFAULT_MODEL
 
 pytestmark = [pytest.mark.copilot]
 
-PLUGIN_DIR = Path(__file__).parents[1] / "plugins" / "banking-plugin"
-CLAUDE_DIR = Path(__file__).parents[1] / "plugins" / "claude-project"
+PLUGIN_DIR = INTEGRATION_DIR / "plugins" / "banking-plugin"
+CLAUDE_DIR = INTEGRATION_DIR / "plugins" / "claude-project"
 
 
 # =============================================================================
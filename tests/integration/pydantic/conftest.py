@@ -2,3 +2,33 @@
 
 Inherits all fixtures and constants from the parent conftest.
 """
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_skill_engineering.plugin_xdist import set_xdist_group
+
+from ..conftest import DEFAULT_MODEL
+
+# Tests that reach an Azure deployment through get_provider()
+_AZURE_FIXTURES = frozenset({"eval_run", "ab_run"})
+
+
+# tryfirst: xdist reads xdist_group marks in its own modifyitems hook
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Pin every Azure test outside a model group to ``DEFAULT_MODEL``'s xdist group.
+
+    Each worker has its own rate limiter, so one deployment's calls must stay
+    on a single worker to respect its rpm/tpm quota. ``benchmark_model_params``
+    already groups each benchmark model; the rest default to ``DEFAULT_MODEL``.
+    Any other group, such as a per-session one, is replaced: a session's
+    tests still run in order, on that one worker.
+    """
+    for item in items:
+        if not _AZURE_FIXTURES & set(getattr(item, "fixturenames", ())):
+            continue
+        groups = [str(m.args[0]) for m in item.iter_markers("xdist_group") if m.args]
+        model_group = next((g for g in groups if g.startswith("model-")), f"model-{DEFAULT_MODEL}")
+        set_xdist_group(item, model_group)
@@ -13,14 +13,12 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering import Eval
 
 from ..conftest import (
     BANKING_PROMPT,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
     TODO_PROMPT,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.basic]
@@ -34,7 +32,7 @@ class TestBankingBasic:
         agent = Eval.from_instructions(
             "balance-transfer",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=10,
         )
@@ -61,7 +59,7 @@ class TestBankingBasic:
         agent = Eval.from_instructions(
             "error-handler",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=8,
         )
@@ -85,7 +83,7 @@ class TestTodoBasic:
         agent = Eval.from_instructions(
             "project-setup",
             TODO_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[todo_server],
             max_turns=12,
         )
@@ -117,7 +115,7 @@ class TestBankingNegative:
         agent = Eval.from_instructions(
             "tool-assertion-check",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=5,
         )
@@ -138,7 +136,7 @@ class TestBankingNegative:
         agent = Eval.from_instructions(
             "out-of-scope",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=3,
         )
@@ -160,7 +158,7 @@ class TestBankingNegative:
         agent = Eval.from_instructions(
             "turns-exhausted",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=1,
         )
@@ -183,7 +181,7 @@ class TestBankingNegative:
         agent = Eval.from_instructions(
             "bad-account",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=5,
         )
@@ -5,6 +5,9 @@ with winner selection based on pass rate and cost.
 
 Permutation: Model varies.
 
+Each model is its own xdist group, so the models run side by side under
+``-n auto --dist=loadgroup``.
+
 Run with: pytest tests/integration/pydantic/test_02_models.py -v
 """
 
@@ -12,14 +15,13 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering import Eval
 
 from ..conftest import (
     BANKING_PROMPT,
-    BENCHMARK_MODELS,
     DEFAULT_MAX_TURNS,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    benchmark_model_params,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.model]
@@ -28,13 +30,13 @@ pytestmark = [pytest.mark.integration, pytest.mark.model]
 class TestModelComparison:
     """Same banking tasks across models — report shows model leaderboard."""
 
-    @pytest.mark.parametrize("model", BENCHMARK_MODELS, ids=BENCHMARK_MODELS)
+    @pytest.mark.parametrize("model", benchmark_model_params())
     async def test_balance_check(self, eval_run, banking_server, model: str):
         """Simple balance query — compare cost and speed across models."""
         agent = Eval.from_instructions(
             "model-balance",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{model}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(model),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -44,13 +46,13 @@ class TestModelComparison:
         assert result.success
         assert result.tool_was_called("get_balance")
 
-    @pytest.mark.parametrize("model", BENCHMARK_MODELS, ids=BENCHMARK_MODELS)
+    @pytest.mark.parametrize("model", benchmark_model_params())
     async def test_transfer_workflow(self, eval_run, banking_server, model: str):
         """Multi-step transfer — compare reasoning quality across models."""
         agent = Eval.from_instructions(
             "model-transfer",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{model}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(model),
             mcp_servers=[banking_server],
             max_turns=10,
         )
@@ -12,22 +12,17 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering import Eval
 
 from ..conftest import (
     BANKING_PROMPT,
+    CONCISE_BANKING_PROMPT,
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.sysprompt]
 
-CONCISE_BANKING_PROMPT = """You are a banking assistant. Be extremely brief.
-
-Use the banking tools to answer questions. Give short, direct answers."""
-
 TEST_PROMPTS = {
     "detailed": BANKING_PROMPT,
     "concise": CONCISE_BANKING_PROMPT,
@@ -37,6 +32,9 @@ TEST_PROMPTS = {
 class TestPromptComparison:
     """Same banking task with different system prompts — report shows prompt leaderboard."""
 
+    # The matrix runs this query to completion for every model, DEFAULT_MODEL
+    # included. Drop this marker if the matrix cell ever stops short of the answer.
+    @pytest.mark.redundant_in_matrix
     @pytest.mark.parametrize(
         "prompt_name,system_prompt", TEST_PROMPTS.items(), ids=TEST_PROMPTS.keys()
     )
@@ -51,7 +49,7 @@ class TestPromptComparison:
         agent = Eval.from_instructions(
             prompt_name,
             system_prompt,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -75,7 +73,7 @@ class TestPromptComparison:
         agent = Eval.from_instructions(
             prompt_name,
             system_prompt,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
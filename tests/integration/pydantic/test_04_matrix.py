@@ -1,7 +1,8 @@
 """Level 04 — Model × Prompt matrix: 2×2 grid of model and prompt combinations.
 
-Double parametrize produces 4 runs. The report detects both model and
-system prompt dimensions and shows a matrix leaderboard.
+The session-scoped ``model`` fixture and a prompt parametrize produce 4
+runs. The report detects both model and system prompt dimensions and
+shows a matrix leaderboard.
 
 Permutation: Model varies × System prompt varies.
 
@@ -12,32 +13,38 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering import Eval
 
 from ..conftest import (
     BANKING_PROMPT,
-    BENCHMARK_MODELS,
+    CONCISE_BANKING_PROMPT,
     DEFAULT_MAX_TURNS,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    benchmark_model_params,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.matrix]
 
-CONCISE_BANKING_PROMPT = """You are a banking assistant. Be extremely brief.
-
-Use the banking tools to answer questions. Give short, direct answers."""
-
 TEST_PROMPTS = {
     "detailed": BANKING_PROMPT,
     "concise": CONCISE_BANKING_PROMPT,
 }
 
 
+@pytest.fixture(scope="session", params=benchmark_model_params())
+def model(request: pytest.FixtureRequest) -> str:
+    """Benchmark model for this cell of the matrix.
+
+    As a session-scoped param, pytest runs every cell for one model before
+    moving to the next, so each model's cached provider and HTTP client
+    serve a contiguous block of tests.
+    """
+    return request.param
+
+
 class TestModelPromptMatrix:
     """2×2 matrix: model × system prompt — report shows full grid leaderboard."""
 
-    @pytest.mark.parametrize("model", BENCHMARK_MODELS, ids=BENCHMARK_MODELS)
     @pytest.mark.parametrize(
         "prompt_name,system_prompt", TEST_PROMPTS.items(), ids=TEST_PROMPTS.keys()
     )
@@ -53,7 +60,7 @@ class TestModelPromptMatrix:
         agent = Eval.from_instructions(
             prompt_name,
             system_prompt,
-            provider=Provider(model=f"azure/{model}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(model),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -63,7 +70,6 @@ class TestModelPromptMatrix:
         assert result.success
         assert result.tool_was_called("get_balance")
 
-    @pytest.mark.parametrize("model", BENCHMARK_MODELS, ids=BENCHMARK_MODELS)
     @pytest.mark.parametrize(
         "prompt_name,system_prompt", TEST_PROMPTS.items(), ids=TEST_PROMPTS.keys()
     )
@@ -79,7 +85,7 @@ class TestModelPromptMatrix:
         agent = Eval.from_instructions(
             prompt_name,
             system_prompt,
-            provider=Provider(model=f"azure/{model}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(model),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
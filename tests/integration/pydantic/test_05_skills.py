@@ -7,22 +7,17 @@ use via virtual tools (list_skill_references, read_skill_reference).
 Permutation: Skill added to eval.
 
 Run with: pytest tests/integration/pydantic/test_05_skills.py -v
+Offline only (skill loading, no LLM calls): add -m "not aitest"
 """
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pytest
 
 from pytest_skill_engineering import (
     Eval,
-    MCPServer,
-    Provider,
     Skill,
     SkillError,
-    Wait,
     export_grading,
     has_skill_evals,
     load_skill,
@@ -30,12 +25,29 @@ from pytest_skill_engineering import (
 )
 from pytest_skill_engineering.core.result import EvalResult
 
-from ..conftest import DEFAULT_MODEL, DEFAULT_RPM, DEFAULT_TPM
+from ..conftest import INTEGRATION_DIR, get_provider
 
 pytestmark = [pytest.mark.integration, pytest.mark.skill]
 
-# Skills live in the parent integration/skills/ directory
-SKILLS_DIR = Path(__file__).parent.parent / "skills"
+SKILLS_DIR = INTEGRATION_DIR / "skills"
+
+
+@pytest.fixture(scope="module")
+def math_helper_skill() -> Skill:
+    """``math-helper`` skill (has references/), parsed once per module."""
+    return load_skill(SKILLS_DIR / "math-helper")
+
+
+@pytest.fixture(scope="module")
+def simple_assistant_skill() -> Skill:
+    """``simple-assistant`` skill (no optional directories), parsed once per module."""
+    return load_skill(SKILLS_DIR / "simple-assistant")
+
+
+@pytest.fixture(scope="module")
+def spec_compliant_skill() -> Skill:
+    """``spec-compliant`` skill (scripts, assets, references), parsed once per module."""
+    return load_skill(SKILLS_DIR / "spec-compliant")
 
 
 # =============================================================================
@@ -46,9 +58,9 @@ SKILLS_DIR = Path(__file__).parent.parent / "skills"
 class TestSkillLoading:
     """Tests for load_skill() and skill validation."""
 
-    def test_load_skill_with_references(self):
+    def test_load_skill_with_references(self, math_helper_skill):
         """Load a skill that has a references/ directory."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
+        skill = math_helper_skill
 
         assert skill.name == "math-helper"
         assert (
@@ -61,9 +73,9 @@ class TestSkillLoading:
         assert skill.has_references
         assert "formulas.md" in skill.references
 
-    def test_load_skill_without_references(self):
+    def test_load_skill_without_references(self, simple_assistant_skill):
         """Load a skill without references/ directory."""
-        skill = load_skill(SKILLS_DIR / "simple-assistant")
+        skill = simple_assistant_skill
 
         assert skill.name == "simple-assistant"
         assert skill.description == "A simple helpful assistant skill"
@@ -76,9 +88,9 @@ class TestSkillLoading:
 
         assert skill.name == "simple-assistant"
 
-    def test_skill_content_contains_body(self):
+    def test_skill_content_contains_body(self, math_helper_skill):
         """Verify skill content contains the markdown body."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
+        skill = math_helper_skill
 
         assert "Math Helper Skill" in skill.content
         assert "show your work step-by-step" in skill.content
@@ -88,9 +100,9 @@ class TestSkillLoading:
         with pytest.raises(SkillError, match="Invalid skill path"):
             load_skill(SKILLS_DIR / "nonexistent-skill")
 
-    def test_metadata_tags_as_tuple(self):
+    def test_metadata_tags_as_tuple(self, math_helper_skill):
         """Tags should be accessible as a tuple."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
+        skill = math_helper_skill
         assert isinstance(skill.metadata.tags, tuple)
         assert "math" in skill.metadata.tags
 
@@ -103,14 +115,14 @@ class TestSkillLoading:
 class TestSkillWithAgent:
     """Integration tests for skills with actual LLM calls."""
 
-    async def test_skill_prepends_to_system_prompt(self, eval_run):
+    async def test_skill_prepends_to_system_prompt(self, eval_run, simple_assistant_skill):
         """Skill content should be prepended to eval's system prompt."""
-        skill = load_skill(SKILLS_DIR / "simple-assistant")
+        skill = simple_assistant_skill
 
         agent = Eval.from_instructions(
             "skill-prepend-test",
             "Be extremely brief.",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             skill=skill,
             max_turns=5,
         )
@@ -120,14 +132,11 @@ class TestSkillWithAgent:
         assert result.success
         assert "hello" in result.final_response.lower()
 
-    async def test_skill_with_references_provides_tools(self, eval_run):
+    async def test_skill_with_references_provides_tools(
+        self, eval_run, banking_server, math_helper_skill
+    ):
         """Skills with references/ should inject virtual tools."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
-
-        banking_server = MCPServer(
-            command=[sys.executable, "-u", "-m", "pytest_skill_engineering.testing.banking_mcp"],
-            wait=Wait.for_tools(["get_balance"]),
-        )
+        skill = math_helper_skill
 
         agent = Eval.from_instructions(
             "skill-references-test",
@@ -135,7 +144,7 @@ class TestSkillWithAgent:
                 "You MUST use the available tools to look up formulas. "
                 "Start by listing available references, then read the formulas file."
             ),
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             skill=skill,
             mcp_servers=[banking_server],
             max_turns=10,
@@ -149,9 +158,9 @@ class TestSkillWithAgent:
         )
         assert "π" in result.final_response or "pi" in result.final_response.lower()
 
-    async def test_skill_references_list_tool_returns_files(self, eval_run):
+    async def test_skill_references_list_tool_returns_files(self, eval_run, math_helper_skill):
         """The list_skill_references tool should return available filenames."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
+        skill = math_helper_skill
 
         agent = Eval.from_instructions(
             "skill-list-refs-test",
@@ -159,7 +168,7 @@ class TestSkillWithAgent:
                 "When asked to list references, use the list_skill_references tool. "
                 "Report exactly what files are available."
             ),
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             skill=skill,
             max_turns=5,
         )
@@ -170,9 +179,9 @@ class TestSkillWithAgent:
         assert result.tool_was_called("list_skill_references")
         assert "formulas" in result.final_response.lower()
 
-    async def test_skill_read_reference_returns_content(self, eval_run):
+    async def test_skill_read_reference_returns_content(self, eval_run, math_helper_skill):
         """The read_skill_reference tool should return file content."""
-        skill = load_skill(SKILLS_DIR / "math-helper")
+        skill = math_helper_skill
 
         agent = Eval.from_instructions(
             "skill-read-ref-test",
@@ -180,7 +189,7 @@ class TestSkillWithAgent:
                 "When asked about Pythagorean theorem, use read_skill_reference to read "
                 "formulas.md and then quote the exact formula from the reference."
             ),
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             skill=skill,
             max_turns=5,
         )
@@ -202,9 +211,9 @@ class TestSkillWithAgent:
 class TestAgentSkillsSpec:
     """Test full agentskills.io spec compliance."""
 
-    async def test_load_spec_compliant_skill(self):
+    async def test_load_spec_compliant_skill(self, spec_compliant_skill):
         """Load a skill with all agentskills.io fields."""
-        skill = Skill.from_path(SKILLS_DIR / "spec-compliant")
+        skill = spec_compliant_skill
 
         # Required fields
         assert skill.metadata.name == "spec-compliant"
@@ -220,38 +229,38 @@ class TestAgentSkillsSpec:
         assert skill.metadata.version == "2.0.0"
         assert skill.metadata.license == "MIT"
 
-    async def test_scripts_discovery(self):
+    async def test_scripts_discovery(self, spec_compliant_skill):
         """Scripts directory is discovered and loaded."""
-        skill = Skill.from_path(SKILLS_DIR / "spec-compliant")
+        skill = spec_compliant_skill
         assert skill.has_scripts
         assert "validate.py" in skill.scripts
         assert "def validate" in skill.scripts["validate.py"]
 
-    async def test_assets_discovery(self):
+    async def test_assets_discovery(self, spec_compliant_skill):
         """Assets directory is discovered (filenames only)."""
-        skill = Skill.from_path(SKILLS_DIR / "spec-compliant")
+        skill = spec_compliant_skill
         assert skill.has_assets
         assert "template.txt" in skill.assets
         assert "schema.json" in skill.assets
         assert skill.assets_dir is not None
 
-    async def test_references_still_work(self):
+    async def test_references_still_work(self, spec_compliant_skill):
         """References directory still works with new features."""
-        skill = Skill.from_path(SKILLS_DIR / "spec-compliant")
+        skill = spec_compliant_skill
         assert skill.has_references
         assert "guide.md" in skill.references
 
-    async def test_skill_without_optional_dirs(self):
+    async def test_skill_without_optional_dirs(self, simple_assistant_skill):
         """Skills without scripts/assets still load fine."""
-        skill = Skill.from_path(SKILLS_DIR / "simple-assistant")
+        skill = simple_assistant_skill
         assert not skill.has_scripts
         assert not skill.has_assets
         assert skill.scripts == {}
         assert skill.assets == ()
 
-    async def test_metadata_entries_frozen_compatible(self):
+    async def test_metadata_entries_frozen_compatible(self, spec_compliant_skill):
         """Metadata entries work with frozen dataclass."""
-        skill = Skill.from_path(SKILLS_DIR / "spec-compliant")
+        skill = spec_compliant_skill
         meta = skill.metadata
         # Access as dict via property
         assert isinstance(meta.metadata_dict, dict)
@@ -11,19 +11,21 @@ Run with: pytest tests/integration/pydantic/test_06_sessions.py -v
 
 from __future__ import annotations
 
-import sys
-
 import pytest
 
-from pytest_skill_engineering import Eval, MCPServer, Provider, Wait
+from pytest_skill_engineering import Eval
 
-from ..conftest import BENCHMARK_MODELS, DEFAULT_RPM, DEFAULT_TPM
+from ..conftest import (
+    DEFAULT_MODEL,
+    benchmark_model_params,
+    get_provider,
+    make_testing_server,
+)
 
 pytestmark = [pytest.mark.integration, pytest.mark.session_test]
 
-DEFAULT_MODEL = "gpt-5-mini"
-
-BANKING_PROMPT = (
+# Conversational variant of the shared BANKING_PROMPT, tuned for multi-turn sessions
+SESSION_BANKING_PROMPT = (
     "You are a helpful banking assistant. Help users manage their checking "
     "and savings accounts. Be concise but thorough. When users ask about "
     "balances or transactions, always use the available tools to get "
@@ -34,9 +36,18 @@ BANKING_PROMPT = (
 @pytest.fixture(scope="module")
 def banking_server():
     """Module-scoped banking server — state persists across session tests."""
-    return MCPServer(
-        command=[sys.executable, "-u", "-m", "pytest_skill_engineering.testing.banking_mcp"],
-        wait=Wait.for_tools(["get_balance", "transfer", "get_transactions"]),
+    return make_testing_server("banking_mcp", ["get_balance", "transfer", "get_transactions"])
+
+
+@pytest.fixture(scope="class")
+def session_agent(banking_server) -> Eval:
+    """The agent all five turns of TestBankingWorkflow's conversation talk to."""
+    return Eval.from_instructions(
+        "banking-session",
+        SESSION_BANKING_PROMPT,
+        provider=get_provider(DEFAULT_MODEL),
+        mcp_servers=[banking_server],
+        max_turns=10,
     )
 
 
@@ -56,20 +67,15 @@ class TestBankingWorkflow:
     test_03: Ask "what was I saving for?" — ONLY answerable from context
     test_04: Complex question requiring context + tool calls
     test_05: Summary — tests full history retention
+
+    Every turn runs the same ``session_agent``, so the report shows one
+    agent for the whole conversation.
     """
 
-    async def test_01_introduce_context(self, eval_run, llm_assert, banking_server):
+    async def test_01_introduce_context(self, eval_run, llm_assert, session_agent):
         """Establish memorable context (Paris trip) and check balances."""
-        agent = Eval.from_instructions(
-            "banking-session-01",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
-            mcp_servers=[banking_server],
-            max_turns=10,
-        )
-
         result = await eval_run(
-            agent,
+            session_agent,
             "Hi! I'm planning a trip to Paris next summer and want to start "
             "saving for it. Can you check my account balances first?",
         )
@@ -84,18 +90,10 @@ class TestBankingWorkflow:
             "Response shows account balances (checking and/or savings amounts)",
         )
 
-    async def test_02_reference_prior_context(self, eval_run, llm_assert, banking_server):
+    async def test_02_reference_prior_context(self, eval_run, llm_assert, session_agent):
         """Reference prior context — says 'that trip' not 'Paris'."""
-        agent = Eval.from_instructions(
-            "banking-session-02",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
-            mcp_servers=[banking_server],
-            max_turns=10,
-        )
-
         result = await eval_run(
-            agent,
+            session_agent,
             "Great! Let's start saving. Move $500 from checking to savings "
             "for that trip I mentioned.",
         )
@@ -107,41 +105,28 @@ class TestBankingWorkflow:
             "Response confirms the transfer of $500 to savings was completed",
         )
 
-    async def test_03_pure_context_question(self, eval_run, banking_server):
+    async def test_03_pure_context_question(self, eval_run, session_agent):
         """CRITICAL: question only answerable from conversation history.
 
         No tool provides "Paris" — the eval MUST remember it from test_01.
         """
-        agent = Eval.from_instructions(
-            "banking-session-03",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
-            mcp_servers=[banking_server],
-            max_turns=10,
+        result = await eval_run(
+            session_agent, "Wait, remind me - what was I saving for again?", max_turns=2
         )
 
-        result = await eval_run(agent, "Wait, remind me - what was I saving for again?")
-
         assert result.success
         assert "paris" in result.final_response.lower(), (
             f"Eval must remember 'Paris' from conversation history.\nGot: {result.final_response}"
         )
 
-    async def test_04_multi_turn_reasoning(self, eval_run, llm_assert, banking_server):
+    async def test_04_multi_turn_reasoning(self, eval_run, llm_assert, session_agent):
         """Complex question requiring both context retention AND tool usage."""
-        agent = Eval.from_instructions(
-            "banking-session-04",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
-            mcp_servers=[banking_server],
-            max_turns=10,
-        )
-
         result = await eval_run(
-            agent,
+            session_agent,
             "If I keep saving $500 per month for my trip, and flights to "
             "where I'm going cost about $800, how many months until I can "
             "afford the flight? Check my current savings balance first.",
+            max_turns=3,
         )
 
         assert result.success
@@ -152,18 +137,12 @@ class TestBankingWorkflow:
             "until they can afford an $800 flight (likely already can with ~$3,500)",
         )
 
-    async def test_05_context_summary(self, eval_run, llm_assert, banking_server):
+    async def test_05_context_summary(self, eval_run, llm_assert, session_agent):
         """Summary — verifies full conversation history retention."""
-        agent = Eval.from_instructions(
-            "banking-session-05",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
-            mcp_servers=[banking_server],
-            max_turns=10,
-        )
-
         result = await eval_run(
-            agent, "Give me a quick summary of what we've discussed and done today."
+            session_agent,
+            "Give me a quick summary of what we've discussed and done today.",
+            max_turns=2,
         )
 
         assert result.success
@@ -186,8 +165,8 @@ class TestSessionIsolation:
         """This class should NOT see TestBankingWorkflow's conversation."""
         agent = Eval.from_instructions(
             "isolated-session-test",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            SESSION_BANKING_PROMPT,
+            provider=get_provider(DEFAULT_MODEL),
             mcp_servers=[banking_server],
             max_turns=10,
         )
@@ -211,13 +190,13 @@ class TestModelSessionComparison:
     requires understanding embedded context.
     """
 
-    @pytest.mark.parametrize("model", BENCHMARK_MODELS)
+    @pytest.mark.parametrize("model", benchmark_model_params())
     async def test_session_context_retention(self, eval_run, banking_server, model):
         """Single prompt with rich context — model must reference it."""
         agent = Eval.from_instructions(
             f"model-comparison-{model}",
-            BANKING_PROMPT,
-            provider=Provider(model=f"azure/{model}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            SESSION_BANKING_PROMPT,
+            provider=get_provider(model),
             mcp_servers=[banking_server],
             max_turns=10,
         )
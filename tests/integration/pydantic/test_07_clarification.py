@@ -13,14 +13,12 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import ClarificationDetection, ClarificationLevel, Eval, Provider
+from pytest_skill_engineering import ClarificationDetection, ClarificationLevel, Eval
 
 from ..conftest import (
     BANKING_PROMPT,
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.clarification]
@@ -34,7 +32,7 @@ class TestClarificationDetection:
         agent = Eval.from_instructions(
             "no-clarification",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
             clarification_detection=ClarificationDetection(
@@ -55,7 +53,7 @@ class TestClarificationDetection:
         agent = Eval.from_instructions(
             "transfer-no-clarification",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
             clarification_detection=ClarificationDetection(
@@ -75,7 +73,7 @@ class TestClarificationDetection:
         agent = Eval.from_instructions(
             "multi-step-no-clarification",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=8,
             clarification_detection=ClarificationDetection(
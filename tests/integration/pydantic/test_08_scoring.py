@@ -13,14 +13,12 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering import Eval
 from pytest_skill_engineering.fixtures.llm_score import ScoringDimension, assert_score
 
 from ..conftest import (
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.scoring]
@@ -64,7 +62,7 @@ class TestPromptScoring:
         agent = Eval.from_instructions(
             "verbose-prompt",
             VERBOSE_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -83,7 +81,7 @@ class TestPromptScoring:
         agent = Eval.from_instructions(
             "direct-prompt",
             DIRECT_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
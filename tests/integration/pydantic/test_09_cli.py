@@ -12,13 +12,11 @@ from __future__ import annotations
 
 import pytest
 
-from pytest_skill_engineering import CLIServer, Eval, Provider
+from pytest_skill_engineering import CLIServer, Eval
 
 from ..conftest import (
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.cli]
@@ -77,7 +75,7 @@ class TestCLIServerBasicUsage:
         agent = Eval.from_instructions(
             "ls-test",
             FILE_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[ls_cli_server, cat_cli_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -92,7 +90,7 @@ class TestCLIServerBasicUsage:
         agent = Eval.from_instructions(
             "cat-test",
             FILE_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[ls_cli_server, cat_cli_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -112,7 +110,7 @@ class TestCLIServerBasicUsage:
         agent = Eval.from_instructions(
             "echo-test",
             ECHO_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[echo_cli_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -136,7 +134,7 @@ class TestCLIServerMultiStep:
         agent = Eval.from_instructions(
             "explore-read",
             FILE_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[ls_cli_server, cat_cli_server],
             max_turns=8,
         )
@@ -156,7 +154,7 @@ class TestCLIServerMultiStep:
         agent = Eval.from_instructions(
             "file-analysis",
             FILE_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[ls_cli_server, cat_cli_server],
             max_turns=8,
         )
@@ -185,7 +183,7 @@ class TestCLIServerErrorHandling:
         agent = Eval.from_instructions(
             "error-handling",
             FILE_CLI_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             cli_servers=[ls_cli_server, cat_cli_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
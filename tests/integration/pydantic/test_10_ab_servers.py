@@ -11,58 +11,29 @@ Run with: pytest tests/integration/pydantic/test_10_ab_servers.py -v
 
 from __future__ import annotations
 
-import sys
-
 import pytest
 
-from pytest_skill_engineering import Eval, MCPServer, Provider, Wait
+from pytest_skill_engineering import Eval
 
 from ..conftest import (
     BANKING_PROMPT,
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration, pytest.mark.abtest]
 
 
-@pytest.fixture(scope="module")
-def banking_server_v1():
-    """Banking server v1 — original implementation."""
-    return MCPServer(
-        command=[
-            sys.executable,
-            "-u",
-            "-m",
-            "pytest_skill_engineering.testing.banking_mcp",
-        ],
-        wait=Wait.for_tools(
-            [
-                "get_balance",
-                "get_all_balances",
-                "transfer",
-                "deposit",
-                "withdraw",
-                "get_transactions",
-            ]
-        ),
-    )
-
-
-@pytest.fixture(scope="module")
-def todo_server_v1():
-    """Todo server v1 — original implementation."""
-    return MCPServer(
-        command=[
-            sys.executable,
-            "-u",
-            "-m",
-            "pytest_skill_engineering.testing.todo_mcp",
-        ],
-        wait=Wait.for_tools(["add_task", "list_tasks", "complete_task"]),
-    )
+@pytest.fixture(scope="session")
+def banking_server_v1(banking_server):
+    """Banking server v1 — original implementation (the shared banking server)."""
+    return banking_server
+
+
+@pytest.fixture(scope="session")
+def todo_server_v1(todo_server):
+    """Todo server v1 — original implementation (the shared todo server)."""
+    return todo_server
 
 
 # =============================================================================
@@ -85,7 +56,7 @@ class TestServerABComparison:
         agent = Eval.from_instructions(
             f"banking-{server_version}",
             system_prompt,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server_v1],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -107,7 +78,7 @@ class TestServerABComparison:
         agent = Eval.from_instructions(
             f"banking-transfer-{server_version}",
             system_prompt,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server_v1],
             max_turns=8,
         )
@@ -144,7 +115,7 @@ class TestToolDescriptionImpact:
         agent = Eval.from_instructions(
             f"ambiguous-{description_quality}",
             system_prompt,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server_v1],
             max_turns=8,
         )
@@ -172,7 +143,7 @@ class TestServerMigration:
         agent = Eval.from_instructions(
             "todo-migration-test",
             "You manage tasks. Add, complete, and list tasks as requested.",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[todo_server_v1],
             max_turns=10,
         )
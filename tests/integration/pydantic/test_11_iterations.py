@@ -11,31 +11,15 @@ Run with: pytest tests/integration/pydantic/test_11_iterations.py -v --aitest-it
 
 from __future__ import annotations
 
-import sys
-
 import pytest
 
-from pytest_skill_engineering import Eval, MCPServer, Provider, Wait
+from pytest_skill_engineering import Eval
 
-from ..conftest import BANKING_PROMPT, DEFAULT_MAX_TURNS, DEFAULT_MODEL, DEFAULT_RPM, DEFAULT_TPM
+from ..conftest import BANKING_PROMPT, DEFAULT_MAX_TURNS, get_provider
 
 pytestmark = [pytest.mark.integration, pytest.mark.iterations]
 
 
-@pytest.fixture(scope="module")
-def banking_server():
-    """Banking MCP server for iteration tests."""
-    return MCPServer(
-        command=[
-            sys.executable,
-            "-u",
-            "-m",
-            "pytest_skill_engineering.testing.banking_mcp",
-        ],
-        wait=Wait.for_tools(["get_balance", "get_all_balances", "transfer"]),
-    )
-
-
 class TestIterationBaseline:
     """Run banking tests multiple times to establish reliability baselines.
 
@@ -49,7 +33,7 @@ class TestIterationBaseline:
         agent = Eval.from_instructions(
             "default",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -62,7 +46,7 @@ class TestIterationBaseline:
         agent = Eval.from_instructions(
             "default",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -75,7 +59,7 @@ class TestIterationBaseline:
         agent = Eval.from_instructions(
             "default",
             BANKING_PROMPT,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
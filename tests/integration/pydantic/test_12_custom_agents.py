@@ -10,22 +10,19 @@ Run with: pytest tests/integration/pydantic/test_12_custom_agents.py -v
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
-from pytest_skill_engineering import Eval, Provider, load_custom_agent, load_custom_agents
+from pytest_skill_engineering import Eval, load_custom_agent, load_custom_agents
 
 from ..conftest import (
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    INTEGRATION_DIR,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration]
 
-AGENTS_DIR = Path(__file__).parents[1] / "agents"
+AGENTS_DIR = INTEGRATION_DIR / "agents"
 
 
 # =============================================================================
@@ -97,7 +94,7 @@ class TestFromAgentFile:
         """Banking advisor agent file produces a working eval that checks balances."""
         agent = Eval.from_agent_file(
             AGENTS_DIR / "banking-advisor.agent.md",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -111,7 +108,7 @@ class TestFromAgentFile:
         """Banking advisor agent file handles transfer requests."""
         agent = Eval.from_agent_file(
             AGENTS_DIR / "banking-advisor.agent.md",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -125,7 +122,7 @@ class TestFromAgentFile:
         """Todo manager agent file produces a working eval that adds tasks."""
         agent = Eval.from_agent_file(
             AGENTS_DIR / "todo-manager.agent.md",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[todo_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -139,7 +136,7 @@ class TestFromAgentFile:
         """Minimal agent file (no frontmatter) works with explicit MCP servers."""
         agent = Eval.from_agent_file(
             AGENTS_DIR / "minimal.agent.md",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
@@ -162,7 +159,7 @@ class TestAgentIdentity:
         """Result captures custom_agent_name from the agent file."""
         agent = Eval.from_agent_file(
             AGENTS_DIR / "banking-advisor.agent.md",
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             mcp_servers=[banking_server],
             max_turns=DEFAULT_MAX_TURNS,
         )
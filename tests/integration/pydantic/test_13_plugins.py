@@ -10,24 +10,21 @@ Run with: pytest tests/integration/pydantic/test_13_plugins.py -v
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
-from pytest_skill_engineering import Eval, Provider, load_plugin
+from pytest_skill_engineering import Eval, load_plugin
 from pytest_skill_engineering.core.plugin import PluginMetadata
 
 from ..conftest import (
     DEFAULT_MAX_TURNS,
-    DEFAULT_MODEL,
-    DEFAULT_RPM,
-    DEFAULT_TPM,
+    INTEGRATION_DIR,
+    get_provider,
 )
 
 pytestmark = [pytest.mark.integration]
 
-PLUGIN_DIR = Path(__file__).parents[1] / "plugins" / "banking-plugin"
-CLAUDE_DIR = Path(__file__).parents[1] / "plugins" / "claude-project"
+PLUGIN_DIR = INTEGRATION_DIR / "plugins" / "banking-plugin"
+CLAUDE_DIR = INTEGRATION_DIR / "plugins" / "claude-project"
 
 
 # =============================================================================
@@ -81,7 +78,7 @@ class TestPluginEval:
         """Eval.from_plugin() creates a working eval."""
         agent = Eval.from_plugin(
             PLUGIN_DIR,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             max_turns=DEFAULT_MAX_TURNS,
             mcp_servers=[banking_server],
         )
@@ -93,7 +90,7 @@ class TestPluginEval:
         """Eval.from_plugin() picks up copilot-instructions.md as system prompt."""
         agent = Eval.from_plugin(
             PLUGIN_DIR,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             max_turns=DEFAULT_MAX_TURNS,
             mcp_servers=[banking_server],
         )
@@ -109,7 +106,7 @@ class TestPluginEval:
         """Eval.from_plugin() handles Claude Code project layout (CLAUDE.md)."""
         agent = Eval.from_plugin(
             CLAUDE_DIR,
-            provider=Provider(model=f"azure/{DEFAULT_MODEL}", rpm=DEFAULT_RPM, tpm=DEFAULT_TPM),
+            provider=get_provider(),
             max_turns=DEFAULT_MAX_TURNS,
             mcp_servers=[banking_server],
         )
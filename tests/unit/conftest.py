@@ -0,0 +1,12 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def no_copilot_stash(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep copilot_eval/ab_run off the plugin stash and the result cache."""
+    monkeypatch.setattr("pytest_skill_engineering.copilot.fixtures.stash_on_item", lambda *a: None)
+    monkeypatch.delenv("PYTEST_COPILOT_CACHE", raising=False)
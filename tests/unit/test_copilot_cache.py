@@ -0,0 +1,207 @@
+"""Unit tests for the opt-in Copilot result cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pytest_skill_engineering.copilot.cache import (
+    CopilotResultCache,
+    cache_enabled,
+    cache_key,
+    cache_replay_only,
+)
+from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.result import CopilotResult, ToolCall, Turn, UsageInfo
+from pytest_skill_engineering.core.errors import CacheMissError
+
+
+def _make_result(success: bool = True) -> CopilotResult:
+    return CopilotResult(
+        turns=[
+            Turn(role="user", content="Create hello.py"),
+            Turn(
+                role="assistant",
+                content="Created hello.py",
+                tool_calls=[ToolCall(name="create_file", arguments={"path": "hello.py"})],
+            ),
+        ],
+        success=success,
+        usage=[UsageInfo(model="gpt-5.2", input_tokens=100, output_tokens=20)],
+        model_used="gpt-5.2",
+        raw_events=[object()],
+    )
+
+
+class TestCacheKey:
+    def test_same_inputs_same_key(self, tmp_path: Path) -> None:
+        agent = CopilotEval(instructions="Be terse.", working_directory=str(tmp_path))
+        assert cache_key(agent, "task") == cache_key(agent, "task")
+
+    def test_prompt_and_instructions_change_key(self) -> None:
+        agent = CopilotEval(instructions="Be terse.")
+        assert cache_key(agent, "task") != cache_key(agent, "other task")
+        assert cache_key(agent, "task") != cache_key(
+            CopilotEval(instructions="Be verbose."), "task"
+        )
+
+    def test_working_directory_path_is_ignored(self, tmp_path: Path) -> None:
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        assert cache_key(CopilotEval(working_directory=str(a)), "task") == cache_key(
+            CopilotEval(working_directory=str(b)), "task"
+        )
+
+    def test_seeded_workspace_content_changes_key(self, tmp_path: Path) -> None:
+        agent = CopilotEval(working_directory=str(tmp_path))
+        empty_key = cache_key(agent, "refactor messy.py")
+        (tmp_path / "messy.py").write_text("def f(x): return x\n")
+        assert cache_key(agent, "refactor messy.py") != empty_key
+
+    def test_plugin_version_changes_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = cache_key(CopilotEval(), "task")
+        monkeypatch.setattr("pytest_skill_engineering.copilot.cache._PLUGIN_VERSION", "0.0.0")
+        assert cache_key(CopilotEval(), "task") != before
+
+    def test_skill_content_changes_key(self, tmp_path: Path) -> None:
+        (tmp_path / "skill.md").write_text("Use __all__.")
+        agent = CopilotEval(skill_directories=[str(tmp_path)])
+        before = cache_key(agent, "task")
+        (tmp_path / "skill.md").write_text("Use __version__.")
+        assert cache_key(agent, "task") != before
+
+
+class TestCacheEnabled:
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_truthy_values_enable(self, monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+        monkeypatch.setenv("PYTEST_COPILOT_CACHE", value)
+        assert cache_enabled()
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PYTEST_COPILOT_CACHE", raising=False)
+        assert not cache_enabled()
+        assert not cache_replay_only()
+
+    def test_replay_enables_read_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYTEST_COPILOT_CACHE", "replay")
+        assert cache_enabled()
+        assert cache_replay_only()
+
+
+class TestCopilotResultCache:
+    def test_round_trip_restores_result_and_files(self, tmp_path: Path) -> None:
+        cache = CopilotResultCache(root=tmp_path / "cache", ttl_s=60)
+        first_ws = tmp_path / "run1"
+        first_ws.mkdir()
+        agent = CopilotEval(working_directory=str(first_ws))
+        (first_ws / "hello.py").write_text("print('hello')\n")
+
+        cache.store("k", agent, _make_result())
+
+        second_ws = tmp_path / "run2"
+        second_ws.mkdir()
+        rerun_agent = CopilotEval(working_directory=str(second_ws))
+        cached = cache.load("k", rerun_agent)
+
+        assert cached is not None
+        assert cached.success
+        assert cached.tool_was_called("create_file")
+        assert cached.total_input_tokens == 100
+        assert cached.model_used == "gpt-5.2"
+        assert cached.raw_events == []
+        assert cached.agent is rerun_agent
+        assert (second_ws / "hello.py").read_text() == "print('hello')\n"
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        assert CopilotResultCache(root=tmp_path, ttl_s=60).load("missing", CopilotEval()) is None
+
+    def test_failed_results_are_not_stored(self, tmp_path: Path) -> None:
+        cache = CopilotResultCache(root=tmp_path, ttl_s=60)
+        cache.store("k", CopilotEval(), _make_result(success=False))
+        assert cache.load("k", CopilotEval()) is None
+
+    def test_expired_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = CopilotResultCache(root=tmp_path, ttl_s=60)
+        cache.store("k", CopilotEval(), _make_result())
+        result_file = tmp_path / "k" / "result.json"
+        stale = result_file.stat().st_mtime - 120
+        os.utime(result_file, (stale, stale))
+
+        assert cache.load("k", CopilotEval()) is None
+        assert not (tmp_path / "k").exists()
+
+
+@pytest.mark.usefixtures("no_copilot_stash")
+class TestCopilotEvalFixtureCache:
+    @pytest.fixture(autouse=True)
+    def _isolated_cache(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    async def test_second_call_is_served_from_cache(
+        self, copilot_eval, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("PYTEST_COPILOT_CACHE", "1")
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await copilot_eval(CopilotEval(), "task")
+            cached = await copilot_eval(CopilotEval(), "task")
+
+        assert mock.await_count == 1
+        assert cached.success
+
+    async def test_cache_is_off_without_env(
+        self, copilot_eval, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delenv("PYTEST_COPILOT_CACHE", raising=False)
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await copilot_eval(CopilotEval(), "task")
+            await copilot_eval(CopilotEval(), "task")
+
+        assert mock.await_count == 2
+
+    async def test_replay_serves_recorded_results_and_raises_on_miss(
+        self, copilot_eval, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            monkeypatch.setenv("PYTEST_COPILOT_CACHE", "1")
+            await copilot_eval(CopilotEval(), "task")
+            monkeypatch.setenv("PYTEST_COPILOT_CACHE", "replay")
+            replayed = await copilot_eval(CopilotEval(), "task")
+            with pytest.raises(CacheMissError, match="PYTEST_COPILOT_CACHE=replay"):
+                await copilot_eval(CopilotEval(), "another task")
+
+        assert mock.await_count == 1
+        assert replayed.success
+
+
+@pytest.mark.usefixtures("no_copilot_stash")
+class TestAbRunCache:
+    async def test_aa_run_stores_one_entry_per_side(
+        self, ab_run, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        monkeypatch.setenv("PYTEST_COPILOT_CACHE", "1")
+        mock = AsyncMock(side_effect=lambda *a, **kw: _make_result())
+        agent = CopilotEval(instructions="Write Python.")
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await ab_run(agent, agent, "task")
+            await ab_run(agent, agent, "task")
+
+        entries = sorted(
+            p.name
+            for p in (tmp_path / "xdg").rglob("*")
+            if p.name.endswith(("-baseline", "-treatment"))
+        )
+        assert mock.await_count == 2
+        assert len(entries) == 2
+        assert entries[0].removesuffix("-baseline") == entries[1].removesuffix("-treatment")
@@ -332,6 +332,16 @@ class TestEventMapperBuild:
         mapper.handle(e2)
         result = mapper.build()
         assert len(result.raw_events) == 2
+        assert result.raw_event_count == 2
+
+    def test_raw_events_count_only(self):
+        mapper = EventMapper(capture_raw_events=False)
+        mapper.handle(_make_event("assistant.message", content="hi"))
+        mapper.handle(_make_event("assistant.message", content="bye"))
+        result = mapper.build()
+        assert result.raw_events == []
+        assert result.raw_event_count == 2
+        assert result.final_response == "bye"
 
 
 class TestEventMapperUserMessage:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -9,6 +11,8 @@ import pytest
 from pytest_skill_engineering.copilot.eval import CopilotEval
 from pytest_skill_engineering.copilot.result import CopilotResult
 
+pytestmark = pytest.mark.usefixtures("no_copilot_stash")
+
 
 def _make_result(success: bool = True) -> CopilotResult:
     return CopilotResult(success=success)
@@ -17,13 +21,6 @@ def _make_result(success: bool = True) -> CopilotResult:
 class TestAbRunFixture:
     """Tests for the ab_run fixture."""
 
-    @pytest.fixture(autouse=True)
-    def _no_stash(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Prevent ab_run from registering test reports in the plugin stash."""
-        monkeypatch.setattr(
-            "pytest_skill_engineering.copilot.fixtures.stash_on_item", lambda *a: None
-        )
-
     @pytest.fixture
     def baseline_agent(self) -> CopilotEval:
         return CopilotEval(name="baseline", instructions="Write plain Python.")
@@ -102,21 +99,25 @@ class TestAbRunFixture:
         assert captured[0].working_directory == str(tmp_path / "baseline")
         assert captured[1].working_directory == str(tmp_path / "treatment")
 
-    async def test_runs_baseline_before_treatment(self, ab_run, tmp_path):
-        """ab_run runs baseline first, then treatment (sequential)."""
-        call_order: list[str] = []
+    async def test_runs_baseline_and_treatment_concurrently(self, ab_run, tmp_path):
+        """ab_run overlaps the two runs instead of awaiting them one at a time."""
+        treatment_started = asyncio.Event()
 
         async def _capture(agent, task):
-            call_order.append(agent.name)
+            if agent.name == "baseline":
+                # Only completes if treatment starts while baseline is still running
+                await asyncio.wait_for(treatment_started.wait(), timeout=1)
+            else:
+                treatment_started.set()
             return _make_result()
 
         baseline = CopilotEval(name="baseline")
         treatment = CopilotEval(name="treatment")
 
         with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", side_effect=_capture):
-            await ab_run(baseline, treatment, "task")
+            b, t = await ab_run(baseline, treatment, "task")
 
-        assert call_order == ["baseline", "treatment"]
+        assert b.success and t.success
 
     async def test_does_not_mutate_original_agents(self, ab_run, tmp_path):
         """ab_run does not mutate the original CopilotEval objects."""
@@ -164,3 +165,138 @@ class TestAbRunFixture:
             await ab_run(CopilotEval(), CopilotEval(), "my specific task")
 
         assert captured_tasks == ["my specific task", "my specific task"]
+
+
+class TestCopilotEvalCoalescing:
+    """Tests for in-flight deduplication in the copilot_eval fixture."""
+
+    @pytest.fixture(autouse=True)
+    def _cache_on(
+        self, no_copilot_stash: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        # Coalescing is tied to the result cache; set it after no_copilot_stash clears it
+        monkeypatch.setenv("PYTEST_COPILOT_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+    async def test_concurrent_identical_calls_share_one_run(self, copilot_eval, tmp_path):
+        """Identical in-flight requests issue a single Copilot run."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        calls = 0
+
+        async def _capture(agent, task):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            (Path(agent.working_directory) / "calculator.py").write_text("def add(a, b): ...\n")
+            return CopilotResult(agent=agent)
+
+        first = CopilotEval(name="first", working_directory=str(first_dir))
+        second = CopilotEval(name="second", working_directory=str(second_dir))
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", side_effect=_capture):
+            a, b = await asyncio.gather(
+                copilot_eval(first, "Create calculator.py"),
+                copilot_eval(second, "Create calculator.py"),
+            )
+
+        assert calls == 1
+        assert a.agent is first
+        assert b.agent is second
+        assert b.file("calculator.py") == "def add(a, b): ...\n"
+
+    async def test_without_cache_identical_calls_run_separately(self, copilot_eval, monkeypatch):
+        """Repeated samples of one prompt stay independent while the cache is off."""
+        monkeypatch.delenv("PYTEST_COPILOT_CACHE")
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await asyncio.gather(*(copilot_eval(CopilotEval(), "task") for _ in range(3)))
+
+        assert mock.await_count == 3
+
+    async def test_different_prompts_run_separately(self, copilot_eval):
+        """Requests with different prompts are not coalesced."""
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await asyncio.gather(
+                copilot_eval(CopilotEval(), "task one"),
+                copilot_eval(CopilotEval(), "task two"),
+            )
+
+        assert mock.await_count == 2
+
+    async def test_failure_propagates_to_waiters(self, copilot_eval):
+        """An exception in the shared run reaches every caller."""
+
+        async def _boom(agent, task):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("CLI failed to start")
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", side_effect=_boom):
+            results = await asyncio.gather(
+                copilot_eval(CopilotEval(), "task"),
+                copilot_eval(CopilotEval(), "task"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestCopilotClientFixture:
+    """Tests for sharing a Copilot client through the copilot_client fixture."""
+
+    def test_default_is_no_shared_client(self, copilot_client):
+        """Without an override every run starts its own CLI."""
+        assert copilot_client is None
+
+    @pytest.mark.parametrize("copilot_client", [object()])
+    async def test_override_is_passed_to_run_copilot(self, copilot_eval, ab_run, copilot_client):
+        """An overridden client reaches run_copilot for copilot_eval and ab_run."""
+        mock = AsyncMock(return_value=_make_result())
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await copilot_eval(CopilotEval(), "task")
+            await ab_run(CopilotEval(name="b"), CopilotEval(name="t"), "task")
+
+        assert mock.await_count == 3
+        assert all(call.kwargs["client"] is copilot_client for call in mock.await_args_list)
+
+
+class TestSuccessPredicateOption:
+    """copilot_eval forwards success_predicate to run_copilot."""
+
+    async def test_predicate_is_forwarded(self, copilot_eval):
+        mock = AsyncMock(return_value=_make_result())
+
+        def predicate(wd: Path) -> bool:
+            return (wd / "README.md").exists()
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=mock):
+            await copilot_eval(CopilotEval(), "task", success_predicate=predicate)
+
+        assert mock.await_args.kwargs["success_predicate"] is predicate
+
+
+class TestInflightLimit:
+    """copilot_eval caps concurrent Copilot sessions per event loop."""
+
+    async def test_concurrent_runs_respect_limit(self, copilot_eval, monkeypatch):
+        monkeypatch.setenv("PYTEST_COPILOT_MAX_INFLIGHT", "2")
+        running = peak = 0
+
+        async def fake_run(agent, prompt, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _make_result()
+
+        with patch("pytest_skill_engineering.copilot.fixtures.run_copilot", new=fake_run):
+            await asyncio.gather(*(copilot_eval(CopilotEval(), f"task {i}") for i in range(5)))
+
+        assert peak == 2
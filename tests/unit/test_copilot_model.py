@@ -17,8 +17,15 @@ from pydantic_ai.messages import (
     UserPromptPart,
 )
 from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.tools import ToolDefinition
 
-from pytest_skill_engineering.copilot.model import CopilotModel, _convert_messages
+from pytest_skill_engineering.copilot import model as copilot_model
+from pytest_skill_engineering.copilot.model import (
+    CopilotModel,
+    _convert_messages,
+    shutdown_copilot_model_client,
+)
+from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -191,15 +198,11 @@ class TestBuildModelFromString:
     """Test that copilot/ prefix is handled correctly."""
 
     def test_copilot_prefix_creates_copilot_model(self) -> None:
-        from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
-
         model = build_model_from_string("copilot/gpt-5-mini")
         assert isinstance(model, CopilotModel)
         assert model.model_name == "copilot:gpt-5-mini"
 
     def test_copilot_prefix_preserves_model_name(self) -> None:
-        from pytest_skill_engineering.execution.pydantic_adapter import build_model_from_string
-
         model = build_model_from_string("copilot/claude-opus-4.5")
         assert isinstance(model, CopilotModel)
         assert model.model_name == "copilot:claude-opus-4.5"
@@ -219,8 +222,6 @@ class TestRequest:
 
     @pytest.fixture()
     def mock_request_params(self) -> ModelRequestParameters:
-        from pydantic_ai.models import ModelRequestParameters
-
         return ModelRequestParameters()
 
     async def test_text_only_response(
@@ -258,8 +259,6 @@ class TestRequest:
 
     async def test_tool_call_response(self, model: CopilotModel) -> None:
         """When function tools are defined, captured tool calls appear as ToolCallPart."""
-        from pydantic_ai.tools import ToolDefinition
-
         params = ModelRequestParameters(
             function_tools=[
                 ToolDefinition(
@@ -499,11 +498,54 @@ class TestClientLifecycle:
 
     async def test_shutdown_when_no_client(self) -> None:
         """Shutdown is a no-op when no client exists."""
-        from pytest_skill_engineering.copilot.model import shutdown_copilot_model_client
-
         # Should not raise
         await shutdown_copilot_model_client()
 
+    async def test_shared_client_serves_requests(self) -> None:
+        """A shared client is returned as-is, without starting another CLI."""
+        shared = AsyncMock()
+        await copilot_model.share_copilot_model_client(shared)
+        try:
+            assert await copilot_model._get_or_create_client() is shared
+        finally:
+            await copilot_model.share_copilot_model_client(None)
+        assert not copilot_model.has_copilot_model_clients()
+
+    async def test_shutdown_leaves_shared_client_running(self) -> None:
+        """Session shutdown detaches a shared client but leaves stopping to its owner."""
+        shared = AsyncMock()
+        await copilot_model.share_copilot_model_client(shared)
+        await copilot_model.shutdown_copilot_model_client()
+
+        shared.stop.assert_not_awaited()
+        assert not copilot_model.has_copilot_model_clients()
+
+    async def test_judge_loop_keeps_its_own_client(self) -> None:
+        """Sync judge calls on the judge loop neither drop nor leak the shared client."""
+        from pytest_skill_engineering.fixtures.llm_assert import _run_judge_sync
+
+        started: list[MagicMock] = []
+
+        def _new_client(*_args: Any, **_kwargs: Any) -> MagicMock:
+            client = MagicMock(start=AsyncMock(), stop=AsyncMock())
+            started.append(client)
+            return client
+
+        shared = AsyncMock()
+        await copilot_model.share_copilot_model_client(shared)
+        try:
+            with patch("copilot.CopilotClient", side_effect=_new_client):
+                first = _run_judge_sync(copilot_model._get_or_create_client())
+                assert await copilot_model._get_or_create_client() is shared
+                second = _run_judge_sync(copilot_model._get_or_create_client())
+        finally:
+            await copilot_model.shutdown_copilot_model_client()
+
+        assert first is second is started[0]
+        assert len(started) == 1
+        started[0].stop.assert_awaited_once()
+        shared.stop.assert_not_awaited()
+
     def test_import_error_message(self) -> None:
         """Clear error message when SDK is not installed."""
 
@@ -162,3 +162,28 @@ class TestOptimizeInstruction:
                 "inst", _make_result(tools=["create_file", "read_file"]), "criterion"
             )
         assert "create_file" in agent_instance.run.call_args[0][0]
+
+    async def test_judge_cache_wraps_model_string(self, monkeypatch, tmp_path):
+        """PYTEST_JUDGE_CACHE replays optimizer calls through the judge cache."""
+        from pydantic_ai.models.test import TestModel
+
+        from pytest_skill_engineering.execution.llm_cache import CachedModel
+
+        monkeypatch.setenv("PYTEST_JUDGE_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        agent_class = _make_agent_mock("inst", "reason", "changes")
+        model = TestModel()
+        with patch(_BUILD_MODEL_PATCH, return_value=model), patch(_AGENT_PATCH, agent_class):
+            await optimize_instruction("inst", _make_result(), "criterion")
+        cached = agent_class.call_args[0][0]
+        assert isinstance(cached, CachedModel)
+        assert cached.wrapped is model
+
+    async def test_judge_cache_leaves_model_object_alone(self, monkeypatch):
+        """A caller-supplied Model object is used as given."""
+        monkeypatch.setenv("PYTEST_JUDGE_CACHE", "1")
+        agent_class = _make_agent_mock("inst", "reason", "changes")
+        fake_model = MagicMock()
+        with patch(_AGENT_PATCH, agent_class):
+            await optimize_instruction("inst", _make_result(), "criterion", model=fake_model)
+        assert agent_class.call_args[0][0] is fake_model
@@ -150,3 +150,96 @@ class TestPersonaSkillRefIntegration:
         persona.apply(agent, config, mapper)  # type: ignore[arg-type]
         tool_names = [t.name for t in config.get("tools", [])]
         assert "list_skill_references" in tool_names
+
+
+class TestSubagentDispatchClient:
+    """The runSubagent polyfill runs subagents on the parent run's client."""
+
+    async def test_dispatch_reuses_parent_client(self, tmp_path: Path) -> None:
+        from unittest.mock import AsyncMock, patch
+
+        from copilot import ToolInvocation
+
+        from pytest_skill_engineering.copilot.eval import CopilotEval
+        from pytest_skill_engineering.copilot.events import EventMapper
+        from pytest_skill_engineering.copilot.result import CopilotResult, Turn
+
+        parent = CopilotEval(
+            working_directory=str(tmp_path),
+            custom_agents=[{"name": "file-writer", "prompt": "Write files."}],
+        )
+        mapper = EventMapper()
+        mapper.client = object()
+        config: dict = {}
+
+        run = AsyncMock(return_value=CopilotResult(turns=[Turn(role="assistant", content="done")]))
+        with patch("pytest_skill_engineering.copilot.runner.run_copilot", new=run):
+            VSCodePersona().apply(parent, config, mapper)
+            tool = next(t for t in config["tools"] if t.name == "runSubagent")
+            await tool.handler(
+                ToolInvocation(
+                    session_id="s",
+                    tool_call_id="c",
+                    tool_name="runSubagent",
+                    arguments={"eval_name": "file-writer", "prompt": "Create a.py"},
+                )
+            )
+
+        assert run.await_args.kwargs["client"] is mapper.client
+        assert run.await_args.args[0].instructions == "Write files."
+
+
+class TestCustomAgentPromptDisclosure:
+    """defer_agent_prompts keeps full subagent prompts out of the orchestrator."""
+
+    @pytest.mark.parametrize("persona_cls", [VSCodePersona, ClaudeCodePersona])
+    def test_native_inference_left_alone_by_default(self, persona_cls: type) -> None:
+        from pytest_skill_engineering.copilot.eval import CopilotEval
+
+        agent = CopilotEval(custom_agents=[{"name": "reviewer", "prompt": "Review."}])
+        config = agent.build_session_config()
+        persona_cls().apply(agent, config, MagicMock())
+
+        assert "infer" not in config["custom_agents"][0]
+
+    @pytest.mark.parametrize("persona_cls", [VSCodePersona, ClaudeCodePersona])
+    def test_native_inference_disabled(self, persona_cls: type) -> None:
+        from pytest_skill_engineering.copilot.eval import CopilotEval
+
+        agent = CopilotEval(
+            custom_agents=[{"name": "test-writer", "prompt": "Write pytest tests."}],
+        )
+        config = agent.build_session_config()
+        persona_cls(defer_agent_prompts=True).apply(agent, config, MagicMock())
+
+        assert config["custom_agents"] == [
+            {"name": "test-writer", "prompt": "Write pytest tests.", "infer": False}
+        ]
+        assert "Write pytest tests." not in config["system_message"]["content"]
+        assert agent.custom_agents[0] == {"name": "test-writer", "prompt": "Write pytest tests."}
+
+    def test_explicit_infer_is_kept(self) -> None:
+        from pytest_skill_engineering.copilot.eval import CopilotEval
+
+        agent = CopilotEval(
+            custom_agents=[{"name": "reviewer", "prompt": "Review.", "infer": True}]
+        )
+        config = agent.build_session_config()
+        VSCodePersona(defer_agent_prompts=True).apply(agent, config, MagicMock())
+
+        assert config["custom_agents"][0]["infer"] is True
+
+    def test_option_shows_in_repr(self) -> None:
+        assert repr(VSCodePersona()) == "VSCodePersona()"
+        assert repr(ClaudeCodePersona(defer_agent_prompts=True)) == (
+            "ClaudeCodePersona(defer_agent_prompts=True)"
+        )
+
+    def test_copilot_cli_persona_keeps_native_dispatch(self) -> None:
+        from pytest_skill_engineering.copilot.eval import CopilotEval
+
+        agent = CopilotEval(custom_agents=[{"name": "reviewer", "prompt": "Review."}])
+        config = agent.build_session_config()
+        CopilotCLIPersona().apply(agent, config, MagicMock())
+
+        assert "infer" not in config["custom_agents"][0]
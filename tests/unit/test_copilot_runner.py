@@ -0,0 +1,171 @@
+"""Unit tests for run_copilot client handling, early stopping and turn limits."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pytest_skill_engineering.copilot.eval import CopilotEval
+from pytest_skill_engineering.copilot.runner import run_copilot
+
+
+def _make_client() -> MagicMock:
+    session = MagicMock()
+    session.session_id = "s-1"
+    session.send_and_wait = AsyncMock(return_value=None)
+    session.disconnect = AsyncMock()
+
+    client = MagicMock()
+    client.start = AsyncMock()
+    client.stop = AsyncMock()
+    client.create_session = AsyncMock(return_value=session)
+    return client
+
+
+class TestSharedClient:
+    """run_copilot(client=...) reuses a running CLI instead of spawning one."""
+
+    async def test_shared_client_is_not_started_or_stopped(self, tmp_path):
+        client = _make_client()
+        agent = CopilotEval(working_directory=str(tmp_path))
+
+        result = await run_copilot(agent, "Create hello.py", client=client)
+
+        assert result.success
+        client.start.assert_not_awaited()
+        client.stop.assert_not_awaited()
+        session_config = client.create_session.await_args.kwargs
+        assert session_config["working_directory"] == str(tmp_path)
+
+    async def test_session_is_disconnected_after_run(self):
+        client = _make_client()
+
+        await run_copilot(CopilotEval(), "task", client=client)
+
+        session = client.create_session.return_value
+        session.disconnect.assert_awaited_once()
+
+
+class TestSuccessPredicate:
+    """run_copilot(success_predicate=...) stops once the acceptance check passes."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_poll(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("pytest_skill_engineering.copilot.runner.SUCCESS_POLL_INTERVAL_S", 0.01)
+
+    async def test_stops_early_when_predicate_passes(self, tmp_path):
+        client = _make_client()
+        session = client.create_session.return_value
+        session.abort = AsyncMock()
+
+        async def _slow_send(prompt, timeout):
+            (tmp_path / "README.md").write_text("# Project\n")
+            await asyncio.sleep(30)
+
+        session.send_and_wait = _slow_send
+        agent = CopilotEval(working_directory=str(tmp_path), timeout_s=60)
+
+        result = await asyncio.wait_for(
+            run_copilot(
+                agent,
+                "Write a README",
+                client=client,
+                success_predicate=lambda wd: (wd / "README.md").exists(),
+            ),
+            timeout=5,
+        )
+
+        assert result.success
+        session.abort.assert_awaited_once()
+
+    async def test_does_not_stop_while_a_subagent_dispatch_runs(self, tmp_path):
+        client = _make_client()
+        session = client.create_session.return_value
+        session.abort = AsyncMock()
+        dispatch_done = False
+
+        async def _send_with_dispatch(prompt, timeout):
+            nonlocal dispatch_done
+            mapper = session.on.call_args.args[0].__self__
+            (tmp_path / "README.md").write_text("# Project\n")
+            mapper.dispatches_in_flight += 1
+            await asyncio.sleep(0.1)
+            dispatch_done = True
+            mapper.dispatches_in_flight -= 1
+            await asyncio.sleep(30)
+
+        session.send_and_wait = _send_with_dispatch
+        session.abort.side_effect = lambda: None if dispatch_done else pytest.fail("aborted early")
+        agent = CopilotEval(working_directory=str(tmp_path), timeout_s=60)
+
+        result = await asyncio.wait_for(
+            run_copilot(
+                agent,
+                "Write a README",
+                client=client,
+                success_predicate=lambda wd: (wd / "README.md").exists(),
+            ),
+            timeout=5,
+        )
+
+        assert result.success
+        session.abort.assert_awaited_once()
+
+    async def test_waits_for_completion_when_predicate_never_passes(self, tmp_path):
+        client = _make_client()
+        session = client.create_session.return_value
+        session.abort = AsyncMock()
+        agent = CopilotEval(working_directory=str(tmp_path))
+
+        result = await run_copilot(agent, "task", client=client, success_predicate=lambda wd: False)
+
+        assert result.success
+        session.send_and_wait.assert_awaited_once()
+        session.abort.assert_not_awaited()
+
+
+class TestMaxTurns:
+    """run_copilot aborts a run that starts more than agent.max_turns turns."""
+
+    @pytest.fixture(autouse=True)
+    def _fast_poll(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("pytest_skill_engineering.copilot.runner.SUCCESS_POLL_INTERVAL_S", 0.01)
+
+    async def test_runaway_agent_fails_fast(self):
+        client = _make_client()
+        session = client.create_session.return_value
+        session.abort = AsyncMock()
+
+        async def _looping_send(prompt, timeout):
+            (handler,) = session.on.call_args.args
+            for _ in range(3):
+                handler(SimpleNamespace(type="assistant.turn_start", data=SimpleNamespace()))
+            await asyncio.sleep(30)
+
+        session.send_and_wait = _looping_send
+        agent = CopilotEval(max_turns=2, timeout_s=60, max_retries=0)
+
+        result = await asyncio.wait_for(run_copilot(agent, "task", client=client), timeout=5)
+
+        assert not result.success
+        assert result.error == "Exceeded max_turns=2"
+        session.abort.assert_awaited_once()
+
+    async def test_run_within_budget_succeeds(self):
+        client = _make_client()
+        session = client.create_session.return_value
+        session.abort = AsyncMock()
+
+        async def _short_send(prompt, timeout):
+            (handler,) = session.on.call_args.args
+            handler(SimpleNamespace(type="assistant.turn_start", data=SimpleNamespace()))
+
+        session.send_and_wait = _short_send
+
+        result = await run_copilot(CopilotEval(max_turns=1), "task", client=client)
+
+        assert result.success
+        session.abort.assert_not_awaited()
@@ -0,0 +1,159 @@
+"""Unit tests for the opt-in LLM judge and eval caches."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from pathlib import Path
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from pytest_skill_engineering import Eval, Provider
+from pytest_skill_engineering.core.errors import CacheMissError
+from pytest_skill_engineering.execution.llm_cache import (
+    CachedModel,
+    eval_cache_enabled,
+    judge_cache_enabled,
+)
+from pytest_skill_engineering.execution.pydantic_adapter import build_pydantic_model
+
+
+def _counting_model() -> tuple[FunctionModel, list[str]]:
+    calls: list[str] = []
+
+    def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        prompt = str(messages[-1].parts[-1].content)  # type: ignore[union-attr]
+        calls.append(prompt)
+        return ModelResponse(parts=[TextPart(f"verdict for {prompt}")])
+
+    return FunctionModel(respond), calls
+
+
+class TestCachedModel:
+    async def test_repeat_request_is_replayed(self, tmp_path: Path) -> None:
+        model, calls = _counting_model()
+        agent = Agent(CachedModel(model, root=tmp_path, ttl_s=60))
+
+        first = await agent.run("is this polite?")
+        second = await agent.run("is this polite?")
+
+        assert len(calls) == 1
+        assert second.output == first.output == "verdict for is this polite?"
+
+    async def test_changed_prompt_misses(self, tmp_path: Path) -> None:
+        model, calls = _counting_model()
+        agent = Agent(CachedModel(model, root=tmp_path, ttl_s=60))
+
+        await agent.run("is this polite?")
+        await agent.run("is this rude?")
+
+        assert len(calls) == 2
+
+    async def test_changed_model_settings_miss(self, tmp_path: Path) -> None:
+        model, calls = _counting_model()
+        cached = CachedModel(model, root=tmp_path, ttl_s=60)
+        precise = Agent(cached, model_settings={"temperature": 0.0})
+        creative = Agent(cached, model_settings={"temperature": 1.5, "max_tokens": 5})
+
+        await precise.run("is this polite?")
+        await creative.run("is this polite?")
+        await precise.run("is this polite?")
+
+        assert len(calls) == 2
+
+    async def test_expired_entries_are_refreshed(self, tmp_path: Path) -> None:
+        model, calls = _counting_model()
+        agent = Agent(CachedModel(model, root=tmp_path, ttl_s=-1))
+
+        await agent.run("is this polite?")
+        await agent.run("is this polite?")
+
+        assert len(calls) == 2
+
+    async def test_replay_only_miss_raises(self, tmp_path: Path) -> None:
+        model, calls = _counting_model()
+        recorder = Agent(CachedModel(model, root=tmp_path, ttl_s=60))
+        replayer = Agent(CachedModel(model, root=tmp_path, ttl_s=60, replay_env="PYTEST_X"))
+
+        await recorder.run("is this polite?")
+        replayed = await replayer.run("is this polite?")
+        with pytest.raises(CacheMissError, match="PYTEST_X=replay"):
+            await replayer.run("is this rude?")
+
+        assert calls == ["is this polite?"]
+        assert replayed.output == "verdict for is this polite?"
+
+    async def test_concurrent_identical_requests_share_one_call(self, tmp_path: Path) -> None:
+        calls: list[str] = []
+
+        async def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            calls.append("call")
+            await asyncio.sleep(0.05)
+            return ModelResponse(parts=[TextPart("verdict")])
+
+        agent = Agent(CachedModel(FunctionModel(respond), root=tmp_path, ttl_s=60))
+
+        results = await asyncio.gather(*(agent.run("is this polite?") for _ in range(3)))
+
+        assert len(calls) == 1
+        assert [r.output for r in results] == ["verdict"] * 3
+
+    async def test_tool_loop_is_replayed(self, tmp_path: Path) -> None:
+        calls: list[int] = []
+        tool_runs: list[str] = []
+
+        def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            calls.append(len(messages))
+            if len(messages) == 1:
+                return ModelResponse(parts=[ToolCallPart("get_balance", {"account": "checking"})])
+            return ModelResponse(parts=[TextPart("Checking has $1,500.")])
+
+        agent = Agent(CachedModel(FunctionModel(respond), root=tmp_path, ttl_s=60))
+
+        @agent.tool_plain
+        def get_balance(account: str) -> str:
+            tool_runs.append(account)
+            return "$1,500"
+
+        first = await agent.run("balance?")
+        second = await agent.run("balance?")
+
+        assert len(calls) == 2
+        assert tool_runs == ["checking", "checking"]
+        assert second.output == first.output
+
+
+class TestJudgeCacheEnabled:
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PYTEST_JUDGE_CACHE", raising=False)
+        assert not judge_cache_enabled()
+
+    def test_opt_in(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYTEST_JUDGE_CACHE", "1")
+        assert judge_cache_enabled()
+        assert CachedModel.for_judge(_counting_model()[0]).replay_env is None
+
+    def test_replay_is_read_only_and_never_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("PYTEST_JUDGE_CACHE", "replay")
+        assert judge_cache_enabled()
+        model = CachedModel.for_judge(_counting_model()[0])
+        assert model.replay_env == "PYTEST_JUDGE_CACHE"
+        assert model.ttl_s == math.inf
+
+
+class TestEvalCache:
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("PYTEST_EVAL_CACHE", raising=False)
+        assert not eval_cache_enabled()
+        agent = Eval(provider=Provider(model="test"))
+        assert not isinstance(build_pydantic_model(agent), CachedModel)
+
+    def test_opt_in_wraps_eval_model(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("PYTEST_EVAL_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        model = build_pydantic_model(Eval(provider=Provider(model="test")))
+        assert isinstance(model, CachedModel)
+        assert model.root == tmp_path / "pytest-skill-engineering" / "eval"
@@ -318,3 +318,30 @@ class TestLLMScore:
         # heavy: 5/5 * 3.0 = 3.0, light: 1/5 * 1.0 = 0.2
         # total_weight = 4.0, weighted = 3.2 / 4.0 = 0.8
         assert abs(result.weighted_score - 0.8) < 0.01
+
+    def test_sync_calls_share_one_event_loop(self) -> None:
+        """Consecutive calls run on the same judge loop, keeping its connections."""
+        import asyncio
+
+        rubric = [ScoringDimension("dim", "Test", max_score=5)]
+        mock_run_result = MagicMock()
+        mock_run_result.output = _JudgeOutput(
+            dimensions=[_DimensionScore(name="dim", score=3, justification="OK")],
+            reasoning="Fine",
+        )
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def _run(_prompt: str) -> MagicMock:
+            loops.append(asyncio.get_running_loop())
+            return mock_run_result
+
+        with patch("pydantic_ai.Agent") as MockAgent:
+            MockAgent.return_value.run = _run
+
+            scorer = LLMScore(model="test-model")
+            scorer("First", rubric)
+            scorer("Second", rubric)
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert loops[0].is_running()
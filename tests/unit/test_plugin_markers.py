@@ -0,0 +1,41 @@
+"""Tests for the plugin's automatic ``aitest`` marker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pytest_skill_engineering.plugin import pytest_collection_modifyitems
+
+
+class _FakeItem:
+    """Just enough of a pytest Item for pytest_collection_modifyitems."""
+
+    def __init__(self, *fixturenames: str) -> None:
+        self.fixturenames = list(fixturenames)
+        self.own_markers: list[pytest.Mark] = []
+
+    def iter_markers(self, name: str | None = None) -> Any:
+        return (m for m in self.own_markers if name is None or m.name == name)
+
+    def get_closest_marker(self, name: str) -> Any:
+        return next(self.iter_markers(name), None)
+
+    def add_marker(self, marker: pytest.MarkDecorator) -> None:
+        self.own_markers.append(marker.mark)
+
+
+def _marked(*fixturenames: str) -> bool:
+    item = _FakeItem(*fixturenames)
+    pytest_collection_modifyitems(None, None, [item])  # type: ignore[arg-type, list-item]
+    return item.get_closest_marker("aitest") is not None
+
+
+class TestAitestAutoMarker:
+    @pytest.mark.parametrize("fixture", ["eval_run", "llm_assert", "llm_score", "ab_run"])
+    def test_model_fixtures_are_marked(self, fixture: str) -> None:
+        assert _marked("request", fixture)
+
+    def test_offline_tests_are_not_marked(self) -> None:
+        assert not _marked("request", "tmp_path")
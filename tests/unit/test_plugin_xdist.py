@@ -0,0 +1,180 @@
+"""Tests for shipping aitest reports from pytest-xdist workers to the controller."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from pytest_skill_engineering.core.result import EvalResult, ToolCall, Turn
+from pytest_skill_engineering.plugin_xdist import (
+    XDIST_REPORT_ATTR,
+    XdistReportCollector,
+    attach_for_controller,
+    group_session_tests,
+    is_xdist_worker,
+    set_xdist_group,
+)
+from pytest_skill_engineering.reporting import TestReport
+
+pytest_plugins = ["pytester"]
+
+
+def _make_test_report() -> TestReport:
+    eval_result = EvalResult(
+        turns=[
+            Turn(role="user", content="What's my balance?"),
+            Turn(
+                role="assistant",
+                content="Checking has $1,500.",
+                tool_calls=[
+                    ToolCall(
+                        name="get_balance",
+                        arguments={"account": "checking"},
+                        result='{"balance": 1500}',
+                        image_content=b"\x89PNG",
+                        image_media_type="image/png",
+                    )
+                ],
+            ),
+        ],
+        success=True,
+        token_usage={"prompt": 120, "completion": 30},
+        cost_usd=0.0012,
+    )
+    return TestReport(
+        name="tests/test_bank.py::test_balance[gpt-5-mini]",
+        outcome="passed",
+        duration_ms=1500.0,
+        eval_result=eval_result,
+        docstring="Check balance.",
+        eval_name="banking",
+        model="gpt-5-mini",
+        iteration=2,
+        _copilot_test=True,
+    )
+
+
+class TestIsXdistWorker:
+    def test_worker_config_has_workerinput(self) -> None:
+        assert is_xdist_worker(SimpleNamespace(workerinput={"workerid": "gw0"}))  # type: ignore[arg-type]
+
+    def test_controller_config_has_no_workerinput(self) -> None:
+        assert not is_xdist_worker(SimpleNamespace())  # type: ignore[arg-type]
+
+
+class TestWorkerToControllerRoundTrip:
+    def test_attach_stores_json_string(self) -> None:
+        report = SimpleNamespace()
+        attach_for_controller(report, _make_test_report())  # type: ignore[arg-type]
+
+        assert isinstance(getattr(report, XDIST_REPORT_ATTR), str)
+
+    def test_collector_rebuilds_report(self) -> None:
+        original = _make_test_report()
+        report = SimpleNamespace()
+        attach_for_controller(report, original)  # type: ignore[arg-type]
+
+        collected: list[TestReport] = []
+        XdistReportCollector(collected).pytest_runtest_logreport(report)
+
+        assert len(collected) == 1
+        rebuilt = collected[0]
+        assert rebuilt.name == original.name
+        assert rebuilt.model == "gpt-5-mini"
+        assert rebuilt.iteration == 2
+        assert rebuilt._copilot_test is True
+        assert rebuilt.eval_result is not None
+        assert rebuilt.eval_result.tool_was_called("get_balance")
+        assert rebuilt.eval_result.cost_usd == original.eval_result.cost_usd  # type: ignore[union-attr]
+        tool_call = rebuilt.eval_result.turns[1].tool_calls[0]
+        assert tool_call.image_content == b"\x89PNG"
+
+    def test_collector_ignores_reports_without_payload(self) -> None:
+        collected: list[TestReport] = []
+        XdistReportCollector(collected).pytest_runtest_logreport(SimpleNamespace())
+
+        assert collected == []
+
+
+class _FakeItem:
+    """Just enough of a pytest Item for group_session_tests."""
+
+    def __init__(self, *marks: pytest.MarkDecorator, callspec_id: str | None = None) -> None:
+        self.own_markers = [m.mark for m in marks]
+        if callspec_id is not None:
+            self.callspec = SimpleNamespace(id=callspec_id)
+
+    def get_closest_marker(self, name: str) -> Any:
+        return next((m for m in self.own_markers if m.name == name), None)
+
+    def add_marker(self, marker: pytest.MarkDecorator) -> None:
+        self.own_markers.append(marker.mark)
+
+    @property
+    def group(self) -> str | None:
+        mark = self.get_closest_marker("xdist_group")
+        return mark.args[0] if mark else None
+
+
+class TestGroupSessionTests:
+    def test_session_tests_share_a_group(self) -> None:
+        first = _FakeItem(pytest.mark.session("banking"))
+        second = _FakeItem(pytest.mark.session("banking"))
+        group_session_tests([first, second])  # type: ignore[list-item]
+        assert first.group == second.group == "session-banking"
+
+    def test_parametrized_sessions_are_grouped_per_param(self) -> None:
+        item = _FakeItem(pytest.mark.session("banking"), callspec_id="gpt-5-mini")
+        group_session_tests([item])  # type: ignore[list-item]
+        assert item.group == "session-banking[gpt-5-mini]"
+
+    def test_existing_group_and_plain_tests_untouched(self) -> None:
+        pinned = _FakeItem(pytest.mark.session("banking"), pytest.mark.xdist_group("mine"))
+        plain = _FakeItem()
+        group_session_tests([pinned, plain])  # type: ignore[list-item]
+        assert pinned.group == "mine"
+        assert plain.group is None
+
+
+class TestSetXdistGroup:
+    def test_replaces_existing_group(self) -> None:
+        item = _FakeItem(pytest.mark.session("banking"), pytest.mark.xdist_group("session-x"))
+        set_xdist_group(item, "model-a")  # type: ignore[arg-type]
+        assert [m.args[0] for m in item.own_markers if m.name == "xdist_group"] == ["model-a"]
+
+    def test_xdist_sees_only_the_new_group(self, pytester: pytest.Pytester) -> None:
+        """A session test moved into a model group gets that group's ``@`` suffix alone."""
+        pytest.importorskip("xdist")
+        pytester.makeini("[pytest]\nasyncio_mode = auto\n")
+        pytester.makeconftest(
+            """
+            import pytest
+            from pytest_skill_engineering.plugin_xdist import set_xdist_group
+
+            @pytest.hookimpl(tryfirst=True)
+            def pytest_collection_modifyitems(items):
+                for item in items:
+                    if item.name == "test_pinned":
+                        set_xdist_group(item, "model-a")
+            """
+        )
+        pytester.makepyfile(
+            """
+            import pytest
+
+            @pytest.mark.session("chat")
+            def test_pinned():
+                pass
+
+            @pytest.mark.session("other")
+            def test_session_only():
+                pass
+            """
+        )
+        result = pytester.runpytest_subprocess("-n", "1", "--dist", "loadgroup", "-v")
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(
+            ["*PASSED*::test_pinned@model-a ", "*PASSED*::test_session_only@session-other "]
+        )
@@ -0,0 +1,134 @@
+"""Tests for deserialize_test_report and its use by deserialize_suite_report."""
+
+from __future__ import annotations
+
+from pytest_skill_engineering.core.result import (
+    Assertion,
+    ClarificationStats,
+    CustomAgentInfo,
+    EvalResult,
+    InstructionFileInfo,
+    MCPPrompt,
+    MCPPromptArgument,
+    SkillInfo,
+    ToolCall,
+    ToolInfo,
+    Turn,
+)
+from pytest_skill_engineering.core.serialization import (
+    deserialize_suite_report,
+    deserialize_test_report,
+    serialize_dataclass,
+)
+from pytest_skill_engineering.reporting.collector import SuiteReport, TestReport
+
+
+def _make_test_report() -> TestReport:
+    eval_result = EvalResult(
+        turns=[
+            Turn(role="user", content="Show my balance as a chart"),
+            Turn(
+                role="assistant",
+                content="Here is the chart.",
+                tool_calls=[
+                    ToolCall(
+                        name="render_chart",
+                        arguments={"account": "checking"},
+                        result="ok",
+                        duration_ms=12.5,
+                        image_content=b"\x89PNG",
+                        image_media_type="image/png",
+                    )
+                ],
+            ),
+        ],
+        success=True,
+        duration_ms=900.0,
+        token_usage={"prompt": 120, "completion": 30},
+        cost_usd=0.0012,
+        clarification_stats=ClarificationStats(count=1, turn_indices=[1], examples=["Which?"]),
+        assertions=[Assertion(type="semantic", passed=True, message="mentions chart")],
+        available_tools=[
+            ToolInfo(
+                name="render_chart",
+                description="Render a chart",
+                input_schema={"type": "object"},
+                server_name="charts",
+            )
+        ],
+        skill_info=SkillInfo(
+            name="charts",
+            description="Chart skill",
+            instruction_content="Use render_chart.",
+            reference_names=["guide.md"],
+        ),
+        effective_system_prompt="You draw charts.",
+        mcp_prompts=[
+            MCPPrompt(
+                name="chart",
+                description="Chart prompt",
+                arguments=[MCPPromptArgument(name="account", required=True)],
+            )
+        ],
+        prompt_name="chart-prompt",
+        custom_agent_info=CustomAgentInfo(name="charter", file_path="charter.agent.md"),
+        premium_requests=1.0,
+        instruction_files=[InstructionFileInfo(name="py", apply_to="**/*.py")],
+    )
+    return TestReport(
+        name="tests/test_charts.py::test_chart[gpt-5-mini]",
+        outcome="passed",
+        duration_ms=1500.0,
+        eval_result=eval_result,
+        docstring="Draw a chart.",
+        class_docstring="Chart tests.",
+        agent_id="abc123",
+        eval_name="charts",
+        model="gpt-5-mini",
+        system_prompt_name="default",
+        skill_name="charts",
+        iteration=2,
+    )
+
+
+class TestDeserializeTestReport:
+    def test_round_trip_preserves_every_field(self) -> None:
+        original = _make_test_report()
+
+        restored = deserialize_test_report(serialize_dataclass(original))
+
+        assert restored == original
+
+    def test_report_without_eval_result(self) -> None:
+        original = TestReport(name="test_plain", outcome="failed", duration_ms=3.0, error="boom")
+
+        restored = deserialize_test_report(serialize_dataclass(original))
+
+        assert restored == original
+
+    def test_legacy_field_names(self) -> None:
+        data = serialize_dataclass(_make_test_report())
+        data["agent_result"] = data.pop("eval_result")
+        data["agent_name"] = data.pop("eval_name")
+
+        restored = deserialize_test_report(data)
+
+        assert restored.eval_name == "charts"
+        assert restored.eval_result == _make_test_report().eval_result
+
+
+class TestDeserializeSuiteReport:
+    def test_tests_match_deserialize_test_report(self) -> None:
+        suite = SuiteReport(
+            name="suite",
+            timestamp="2026-02-15T00:00:00Z",
+            duration_ms=1500.0,
+            tests=[_make_test_report()],
+            passed=1,
+        )
+        data = serialize_dataclass(suite)
+
+        restored = deserialize_suite_report(data)
+
+        assert restored == suite
+        assert restored.tests == [deserialize_test_report(t) for t in data["tests"]]
@@ -0,0 +1,107 @@
+"""Tests for the single-flight call coalescer."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from pytest_skill_engineering.execution.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight.run."""
+
+    async def test_concurrent_calls_share_one_run(self) -> None:
+        """Callers arriving while a run is in flight get its result."""
+        flight: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return 42
+
+        results = await asyncio.gather(*(flight.run("k", call) for _ in range(3)))
+
+        assert calls == 1
+        assert [value for value, _ in results] == [42, 42, 42]
+        assert [led for _, led in results] == [True, False, False]
+
+    async def test_leader_error_reaches_waiters(self) -> None:
+        """Waiters see the exception the running call raised."""
+        flight: SingleFlight[str, int] = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.run("k", call), flight.run("k", call), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_leader_lets_waiter_retry(self) -> None:
+        """A waiter takes over the call instead of inheriting the leader's cancel."""
+        flight: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def call() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await waiter == (2, True)
+        assert leader.cancelled()
+
+    async def test_cancelled_waiter_is_not_retried(self) -> None:
+        """Cancelling a waiter cancels only that waiter."""
+        flight: SingleFlight[str, int] = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0.05)
+            return 1
+
+        leader = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert await leader == (1, True)
+
+    async def test_separate_loops_do_not_share_runs(self) -> None:
+        """A run in flight on one loop is not awaited from another loop."""
+        flight: SingleFlight[str, str] = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        async def blocked() -> str:
+            started.set()
+            await asyncio.to_thread(release.wait)
+            return "other loop"
+
+        thread = threading.Thread(target=lambda: asyncio.run(flight.run("k", blocked)))
+        thread.start()
+        try:
+            assert await asyncio.to_thread(started.wait, 5)
+
+            async def call() -> str:
+                return "this loop"
+
+            assert await flight.run("k", call) == ("this loop", True)
+        finally:
+            release.set()
+            thread.join()